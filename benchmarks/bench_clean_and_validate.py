@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark: clean_and_validate per-value cleaners vs the vectorized pipeline.
+
+Times the Series.apply pipeline main() used to run against clean_dataframe()
+on synthetic Production frames, and checks both produce the same CSV.
+
+Run: python benchmarks/bench_clean_and_validate.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import clean_and_validate as cv  # noqa: E402
+from legacy_clean_and_validate import legacy_clean  # noqa: E402
+from synthetic import generate_frame  # noqa: E402
+
+def _timed(fn, df):
+    start = time.perf_counter()
+    out = fn(df.copy())
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}  {'per-value':>10}  {'vectorized':>10}  speedup")
+    for n in args.sizes:
+        df = generate_frame(n, args.seed)
+        legacy_s, legacy = _timed(legacy_clean, df)
+        fast_s, fast = _timed(cv.clean_dataframe, df)
+        if cv._df_to_csv_string(legacy) != cv._df_to_csv_string(fast):
+            raise SystemExit(f"Output mismatch at {n} rows")
+        print(f"{n:>10,}  {legacy_s:>9.2f}s  {fast_s:>9.2f}s  {legacy_s / fast_s:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark: email cleaning throughput, legacy per-cell validation vs email_cleaning.
+
+The legacy path chains the column .str normalization and then runs
+validators.email on every candidate. email_cleaning.clean_email_column uses the
+fast-path regex and memoized validator verdicts; it is timed with a cold and a
+warm verdict cache. Verdicts are checked for parity first.
+
+Run: python benchmarks/bench_email_cleaning.py [--rows N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import email_cleaning  # noqa: E402
+from legacy_email_cleaning import legacy_clean_email_column  # noqa: E402
+from synthetic import generate_frame  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    series = generate_frame(args.rows)["email"]
+    timings = []
+    start = time.perf_counter()
+    expected = legacy_clean_email_column(series)
+    timings.append(("legacy per-cell", time.perf_counter() - start))
+
+    email_cleaning.is_valid_address.cache_clear()
+    for label in ("email_cleaning (cold)", "email_cleaning (warm)"):
+        start = time.perf_counter()
+        actual = email_cleaning.clean_email_column(series)
+        timings.append((label, time.perf_counter() - start))
+        if not actual.equals(expected):
+            raise SystemExit("Verdict mismatch against the legacy cleaner")
+
+    print(f"{args.rows:,} email cells")
+    for label, seconds in timings:
+        print(f"  {label:<24} {args.rows / seconds:>12,.0f} cells/s  ({timings[0][1] / seconds:5.1f}x)")
+    print(f"  validator cache: {email_cleaning.is_valid_address.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Load test: full main() runs of geocode_working_copy.py then clean_and_validate.py
+against the local Google stand-ins in tests/google_fakes.py.
+
+A synthetic spreadsheet of --rows Working Copy and Production rows is served by
+FakeSheetsService (with --sheets-latency per request plus --seconds-per-kib of
+transfer time, and the --max-request-mib payload limit), and geocoding goes to
+a FakeGeocodeServer on localhost (--geocode-latency per request). No credentials
+or network are needed, so this runs offline in CI. Reported per script: wall
+time, the --metrics-out stages and the fake services' request and byte counts.
+--profile PATH writes cProfile stats for both runs (view with python -m pstats).
+
+Run: python benchmarks/bench_end_to_end.py [--rows 50000] [--stream] [--profile out.prof]
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import clean_and_validate as cv  # noqa: E402
+import geocode_client  # noqa: E402
+import geocode_working_copy as gwc  # noqa: E402
+import sheet_io  # noqa: E402
+from google_fakes import FakeGeocodeServer, FakeGoogle  # noqa: E402
+from synthetic import generate_rows, generate_working_copy_rows  # noqa: E402
+
+DEFAULT_ROWS = 50_000
+
+
+def synthetic_tabs(rows: int, seed: int = 0) -> dict:
+    """{"Working Copy": [...], "Production": [...]} grids, header row first."""
+    production = [[r[h] for h in cv.SHEET_HEADERS] for r in generate_rows(rows, seed)]
+    return {
+        "Working Copy": [list(gwc.HEADERS)] + generate_working_copy_rows(rows, seed),
+        "Production": [list(cv.SHEET_HEADERS)] + production,
+    }
+
+
+def _install(workdir: Path, google: FakeGoogle, geocode_url: str, concurrency: int) -> None:
+    for name, text in (("key.json", "{}"), ("sheet-id.txt", "load-test"), ("api-key.txt", "load-test-key")):
+        (workdir / name).write_text(text)
+    for module in (gwc, cv):
+        module.CREDENTIALS_PATH = workdir / "key.json"
+        module.SHEET_ID_PATH = workdir / "sheet-id.txt"
+    gwc.API_KEY_PATH = workdir / "api-key.txt"
+    sheet_io.set_client_factory(google.client_factory)
+    geocode_client.set_default_client(geocode_client.GeocodingClient(base_url=geocode_url, pool_size=concurrency))
+
+
+def _run_main(module, argv: list, profiler=None) -> float:
+    """Wall seconds of module.main() with `argv`; script output is discarded."""
+    sys.argv = [f"{module.__name__}.py"] + argv
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        if profiler is not None:
+            profiler.enable()
+        try:
+            module.main()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    return time.perf_counter() - start
+
+
+def run_load_test(
+    rows: int,
+    seed: int = 0,
+    workdir=None,
+    stream: bool = False,
+    sheets_latency: float = 0.0,
+    seconds_per_kib: float = 0.0,
+    max_request_bytes: int | None = None,
+    geocode_latency: float = 0.0,
+    concurrency: int = gwc.DEFAULT_CONCURRENCY,
+    geocode_args=(),
+    profiler=None,
+) -> dict:
+    """Run both mains once against fresh fakes. Returns {script: report} plus the final tabs under "tabs"."""
+    google = FakeGoogle(
+        synthetic_tabs(rows, seed),
+        latency=sheets_latency,
+        seconds_per_kib=seconds_per_kib,
+        max_request_bytes=max_request_bytes,
+    )
+    with tempfile.TemporaryDirectory() as tmp, FakeGeocodeServer(latency=geocode_latency) as server:
+        workdir = Path(workdir or tmp)
+        saved = (sys.argv, gwc.CREDENTIALS_PATH, gwc.SHEET_ID_PATH, gwc.API_KEY_PATH, cv.CREDENTIALS_PATH, cv.SHEET_ID_PATH)
+        _install(workdir, google, server.url, concurrency)
+        try:
+            report = {}
+            common = ["--snapshot-path", str(workdir / "snapshot.pickle")]
+            runs = [
+                (gwc, ["--cache-path", str(workdir / "cache.sqlite3"),
+                       "--fingerprints-path", str(workdir / "fingerprints.json"),
+                       "--concurrency", str(concurrency), "--qps", "100000"] + list(geocode_args)),
+                (cv, ["--output-stdout"] + (["--stream"] if stream else [])),
+            ]
+            for module, argv in runs:
+                before = (google.sheets.calls.copy(), google.sheets.bytes_sent, google.sheets.bytes_received)
+                geocode_before = server.requests
+                metrics_path = workdir / f"{module.__name__}.metrics.json"
+                seconds = _run_main(module, argv + common + ["--metrics-out", str(metrics_path)], profiler)
+                report[module.__name__] = {
+                    "seconds": round(seconds, 3),
+                    "metrics": json.loads(metrics_path.read_text()),
+                    "sheets_calls": dict(google.sheets.calls - before[0]),
+                    "sheets_kib_sent": round((google.sheets.bytes_sent - before[1]) / 1024),
+                    "sheets_kib_received": round((google.sheets.bytes_received - before[2]) / 1024),
+                    "geocode_requests": server.requests - geocode_before,
+                }
+        finally:
+            sheet_io.set_client_factory(None)
+            geocode_client.set_default_client(None)
+            (sys.argv, gwc.CREDENTIALS_PATH, gwc.SHEET_ID_PATH, gwc.API_KEY_PATH, cv.CREDENTIALS_PATH, cv.SHEET_ID_PATH) = saved
+    report["tabs"] = {name: google.sheets.rows(name) for name in ("Working Copy", "Production")}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stream", action="store_true", help="Run clean_and_validate.py with --stream.")
+    parser.add_argument("--sheets-latency", type=float, default=0.15, help="Seconds added to every Sheets request.")
+    parser.add_argument("--seconds-per-kib", type=float, default=0.0002, help="Sheets transfer time per KiB.")
+    parser.add_argument("--max-request-mib", type=float, default=0, help="Sheets request payload limit (0 = none).")
+    parser.add_argument("--geocode-latency", type=float, default=0.02, help="Seconds added to every geocode request.")
+    parser.add_argument("--concurrency", type=int, default=8, help="geocode_working_copy.py --concurrency.")
+    parser.add_argument(
+        "--adaptive-attempt-order", action="store_true", help="Pass --adaptive-attempt-order to geocode_working_copy.py."
+    )
+    parser.add_argument("--profile", metavar="PATH", help="Write cProfile stats for both runs to PATH.")
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile() if args.profile else None
+    report = run_load_test(
+        args.rows,
+        args.seed,
+        stream=args.stream,
+        sheets_latency=args.sheets_latency,
+        seconds_per_kib=args.seconds_per_kib,
+        max_request_bytes=int(args.max_request_mib * 1024 * 1024) or None,
+        geocode_latency=args.geocode_latency,
+        concurrency=args.concurrency,
+        geocode_args=["--adaptive-attempt-order"] if args.adaptive_attempt_order else [],
+        profiler=profiler,
+    )
+    print(f"{args.rows:,} synthetic rows, Sheets latency {args.sheets_latency:g}s, geocode latency {args.geocode_latency:g}s")
+    for script in ("geocode_working_copy", "clean_and_validate"):
+        r = report[script]
+        calls = ", ".join(f"{m} {n}" for m, n in sorted(r["sheets_calls"].items())) or "none"
+        print(f"{script:<22} {r['seconds']:8.2f} s")
+        print(f"    Sheets: {calls}; {r['sheets_kib_sent']:,} KiB sent, {r['sheets_kib_received']:,} KiB received")
+        print(f"    Geocoding requests: {r['geocode_requests']:,}")
+        for stage, seconds in sorted(r["metrics"]["stages"].items(), key=lambda kv: kv[1], reverse=True)[:6]:
+            print(f"    {stage:<26} {seconds:8.2f} s")
+    if profiler is not None:
+        profiler.dump_stats(args.profile)
+        print(f"Wrote profile to {args.profile}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: is_valid_city before/after precompiling REJECT_TERMS.
+
+Compares the legacy per-term regex loop with the single precompiled
+alternation (memoization bypassed) and the memoized function (warm), over comma-separated fragments of realistic provider addresses.
+
+Run: python benchmarks/bench_is_valid_city.py [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from geocode_working_copy import REJECT_TERMS, is_valid_city  # noqa: E402
+
+ADDRESSES = [
+    "55 Fruit St, Boston, MA 02114, USA",
+    "300 Longwood Ave, Boston, MA 02115",
+    "1275 York Avenue, New York, NY 10065",
+    "Level 3, Royal Children's Hospital, 50 Flemington Rd, Parkville VIC 3052, Australia",
+    "Great Ormond Street Hospital, Great Ormond St, London WC1N 3JH, United Kingdom",
+    "Av. Dr. Enéas Carvalho de Aguiar, 647 - Cerqueira César, São Paulo - SP, Brazil",
+    "7-3-1 Hongo, Bunkyo City, Tokyo 113-8655, Japan",
+    "Suite 400, 2450 Riverside Ave, Minneapolis, MN 55454",
+    "PO Box 1234, Toronto, ON M5G 1X8, Canada",
+    "Department of Clinical Genetics, Karolinska University Hospital, Stockholm, Sweden",
+    "Hospital Sant Joan de Déu, Passeig Sant Joan de Déu 2, Esplugues de Llobregat, Barcelona, Spain",
+    "Apollo Hospitals, 21 Greams Lane, Chennai, Tamil Nadu 600006, India",
+    "Telehealth only",
+    "Remote",
+    "Mexico City",
+]
+FRAGMENTS = [p.strip() for a in ADDRESSES for p in a.split(",") if p.strip()] + [a for a in ADDRESSES if "," not in a]
+
+
+def legacy_is_valid_city(city: str) -> bool:
+    """is_valid_city as it was: one re.search per reject term on every call."""
+    if not city or len(city) < 2 or len(city) > 50:
+        return False
+    if re.match(r"^\d+$", city):
+        return False
+    lower = city.lower()
+    for term in REJECT_TERMS:
+        if re.search(r"\b" + re.escape(term) + r"\b", lower):
+            return False
+    if re.search(r"\d", city):
+        return False
+    if re.search(r"\b\d{5}(-\d{4})?\b|\b[A-Z]\d[A-Z]\s?\d[A-Z]\d\b", city, re.I):
+        return False
+    return True
+
+
+def run_legacy():
+    for f in FRAGMENTS:
+        legacy_is_valid_city(f)
+
+
+def run_compiled_uncached():
+    check = is_valid_city.__wrapped__
+    for f in FRAGMENTS:
+        check(f)
+
+
+def run_memoized_warm():
+    for f in FRAGMENTS:
+        is_valid_city(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000, help="Passes over the fragment corpus per timing.")
+    args = parser.parse_args()
+
+    mismatches = [f for f in FRAGMENTS if legacy_is_valid_city(f) != is_valid_city(f)]
+    if mismatches:
+        raise SystemExit(f"Verdict mismatch on {len(mismatches)} fragments")
+
+    calls = len(FRAGMENTS) * args.repeat
+    baseline = None
+    print(f"{len(FRAGMENTS)} fragments x {args.repeat} passes")
+    for label, fn in (
+        ("legacy per-term loop", run_legacy),
+        ("compiled alternation", run_compiled_uncached),
+        ("memoized (warm cache)", run_memoized_warm),
+    ):
+        seconds = min(timeit.repeat(fn, number=args.repeat, repeat=3))
+        rate = calls / seconds
+        baseline = baseline or rate
+        print(f"  {label:<24} {rate:>12,.0f} calls/s  ({rate / baseline:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
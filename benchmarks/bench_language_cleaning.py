@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: language_spoken handling, legacy two-scan path vs language_cleaning.
+
+The legacy path ran uses_interpreters_func (one re.search per pattern) and then
+clean_languages (about ten uncompiled re passes) on every cell.
+language_cleaning.scan_language_column scans each distinct cell once and
+returns both results; the single compiled scan is also timed without the memo.
+Output parity is checked first.
+
+Run: python benchmarks/bench_language_cleaning.py [--rows N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pandas as pd  # noqa: E402
+
+import language_cleaning  # noqa: E402
+from legacy_language_cleaning import legacy_clean_languages, legacy_uses_interpreters_func  # noqa: E402
+from synthetic import generate_frame  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    series = generate_frame(args.rows)["language_spoken"]
+
+    start = time.perf_counter()
+    expected = (series.apply(legacy_clean_languages), series.apply(legacy_uses_interpreters_func))
+    legacy_s = time.perf_counter() - start
+
+    language_cleaning._scan_text.cache_clear()
+    start = time.perf_counter()
+    languages, detected = language_cleaning.scan_language_column(series)
+    scan_s = time.perf_counter() - start
+    if not (languages.equals(expected[0]) and detected.equals(expected[1])):
+        raise SystemExit("Output mismatch against the legacy cleaners")
+
+    scan = language_cleaning._scan_text.__wrapped__
+    start = time.perf_counter()
+    for v in series:
+        if not pd.isnull(v):
+            scan(str(v))
+    unmemoized_s = time.perf_counter() - start
+
+    print(f"{args.rows:,} language cells ({series.nunique()} distinct)")
+    for label, seconds in (
+        ("legacy two scans", legacy_s),
+        ("one scan, no memo", unmemoized_s),
+        ("scan_language_column", scan_s),
+    ):
+        print(f"  {label:<24} {args.rows / seconds:>12,.0f} cells/s  ({legacy_s / seconds:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
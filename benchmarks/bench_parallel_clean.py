@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial clean_dataframe vs clean_dataframe_parallel (--workers N).
+
+For each size, times the serial pipeline and the process pool at each worker
+count (a fresh pool per run, as main() uses it), then estimates the break-even
+row count from the measured pool start-up cost and per-row costs. That figure is
+what MIN_ROWS_PER_WORKER in clean_and_validate.py is based on.
+
+Run: python benchmarks/bench_parallel_clean.py [--sizes 10000 50000 200000] [--workers 2 4]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import clean_and_validate as cv  # noqa: E402
+from synthetic import generate_frame  # noqa: E402
+
+
+def _noop(_):
+    return None
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 200_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    args = parser.parse_args()
+
+    cv.MIN_ROWS_PER_WORKER = 1  # always use the pool here; the point is to measure it
+    cpus = os.cpu_count() or 1
+    print(f"CPUs available: {cpus}")
+    startup = {}
+    for w in args.workers:
+        startup[w], _ = _timed(lambda: list(ProcessPoolExecutor(max_workers=w).map(_noop, range(w))))
+        print(f"  pool start-up, {w} workers: {startup[w] * 1000:.0f} ms")
+
+    print(f"{'rows':>9}  {'serial':>8}" + "".join(f"  {f'{w} workers':>10}" for w in args.workers))
+    for n in args.sizes:
+        df = generate_frame(n)
+        serial_s, serial = _timed(lambda: cv.clean_dataframe(df))
+        line = f"{n:>9,}  {serial_s:>7.2f}s"
+        for w in args.workers:
+            par_s, par = _timed(lambda: cv.clean_dataframe_parallel(df, w))
+            if not par.equals(serial):
+                raise SystemExit(f"Parallel result differs at {n} rows, {w} workers")
+            line += f"  {par_s:>9.2f}s"
+        print(line)
+
+        # Chunks go to the workers and results come back pickled.
+        transfer_s, _ = _timed(lambda: (pickle.loads(pickle.dumps(df)), pickle.loads(pickle.dumps(serial))))
+        for w in args.workers:
+            saved_per_row = serial_s / n * (1 - 1 / min(w, cpus)) - transfer_s / n
+            even = f"{startup[w] / saved_per_row:,.0f} rows" if saved_per_row > 0 else "never (not enough cores)"
+            print(f"           break-even with {w} workers: {even}")
+
+
+if __name__ == "__main__":
+    main()
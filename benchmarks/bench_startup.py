@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: start-up cost of the Python scripts and of pytest collection.
+
+Each script module is imported in a fresh interpreter under `python -X importtime`
+and the cumulative time of its import is reported, with the heaviest packages
+it pulled in. pytest collection of tests/ is timed as wall clock. Every figure
+is the best of --repeat runs. The Google client libraries should not appear in
+the script import lists; sheet_io imports them only when a client is built.
+
+Run: python benchmarks/bench_startup.py [--repeat 5] [--top 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_DIR = REPO_ROOT / "scripts"
+MODULES = ["clean_and_validate", "geocode_working_copy"]
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_profile(module: str) -> tuple[float, list]:
+    """(cumulative seconds, [(top-level package, cumulative seconds)]) for one cold import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines come out children-first, so the module's direct imports are the
+    # depth-2 lines since the previous top-level line.
+    children = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)) / 1e6, len(match.group(3)), match.group(4)
+        if indent == 3:
+            children.append((name.split(".")[0], cumulative))
+        elif indent == 1:
+            if name == module:
+                packages = {}
+                for top, seconds in children:
+                    packages[top] = packages.get(top, 0.0) + seconds
+                return cumulative, sorted(packages.items(), key=lambda kv: kv[1], reverse=True)
+            children = []
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def collection_seconds() -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "tests"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        total, packages = min((import_profile(module) for _ in range(args.repeat)), key=lambda r: r[0])
+        print(f"import {module:<22} {total * 1000:8.1f} ms")
+        for name, seconds in packages[:args.top]:
+            print(f"    {name:<26} {seconds * 1000:8.1f} ms")
+        heavy = {"google", "googleapiclient"} & {name for name, _ in packages}
+        if heavy:
+            print(f"    !! imports {', '.join(sorted(heavy))} at module load")
+    best = min(collection_seconds() for _ in range(args.repeat))
+    print(f"pytest --collect-only tests {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
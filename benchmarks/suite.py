@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: throughput and peak memory of the cleaning and geocoding
+helpers on synthetic sheets, with a JSON baseline and a regression check.
+
+Each case times passes over --rows synthetic rows (at least 0.2 s of them,
+median of --repeat samples) and measures the peak traced allocation of a
+separate pass. Memoized helpers have their caches cleared before every pass, so
+figures are cold-cache numbers.
+
+  python benchmarks/suite.py                    # run and print
+  python benchmarks/suite.py --save-baseline    # overwrite benchmarks/baseline.json
+  python benchmarks/suite.py --check            # exit 1 if a case is more than
+                                                # --threshold slower than baseline
+
+Every run also times a fixed pure-Python loop, once after each case so the
+figure covers the same stretch of time as the cases, and keeps the median.
+--check scales the baseline by the ratio of that calibration figure, so a
+slower or faster host does not by itself read as a regression. Timings on
+shared machines still jitter; medians damp single slow samples, but keep
+--threshold generous and re-save the baseline (with a high --repeat) after
+intended changes.
+"""
+
+import argparse
+import copy
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import clean_and_validate as cv  # noqa: E402
+import geocode_working_copy as gwc  # noqa: E402
+import language_cleaning  # noqa: E402
+import phone_cleaning  # noqa: E402
+from synthetic import generate_frame, generate_geocode_results, generate_working_copy_rows  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_ROWS = 20_000
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.25
+MIN_SAMPLE_SECONDS = 0.2
+
+
+def calibration_ops_per_s() -> float:
+    """Host speed: iterations per second of one pass of a fixed pure-Python loop."""
+    n = 200_000
+    start = time.perf_counter()
+    total = 0
+    for i in range(n):
+        total += i * i % 7
+    return n / (time.perf_counter() - start)
+
+
+def _clear_caches():
+    gwc.is_valid_city.cache_clear()
+    language_cleaning._scan_text.cache_clear()
+    phone_cleaning.parse_phone.cache_clear()
+
+
+def _cases(rows: int, seed: int) -> dict:
+    """{name: (prepare, run)}: prepare() builds a fresh input outside the timed region."""
+    frame = generate_frame(rows, seed)
+    wc_rows = generate_working_copy_rows(rows, seed)
+    results = generate_geocode_results(rows, seed)
+    websites = frame["work_website"].tolist()
+    languages = frame["language_spoken"].tolist()
+    phones = frame["phone_work"].tolist()
+    addresses = [row[gwc.WORK_ADDRESS_COL] for row in wc_rows]
+    fragments = [p.strip() for a in addresses for p in a.split(",") if p.strip()][:rows]
+    # Working Copy as the API returns it: trailing empty cells dropped
+    sheet = [list(gwc.HEADERS)] + [row[:max((i + 1 for i, v in enumerate(row) if v), default=0)] for row in wc_rows]
+
+    return {
+        "clean_emails": (frame.copy, cv.clean_emails),
+        "clean_fields": (frame.copy, cv.clean_fields),
+        "clean_website": (lambda: websites, lambda vals: [cv.clean_website(v) for v in vals]),
+        "clean_languages": (lambda: languages, lambda vals: [language_cleaning.clean_languages(v) for v in vals]),
+        "clean_phone": (lambda: phones, lambda vals: [phone_cleaning.clean_phone(v) for v in vals]),
+        "is_valid_city": (lambda: fragments, lambda vals: [gwc.is_valid_city(v) for v in vals]),
+        "extract_city_from_address": (lambda: addresses, lambda vals: [gwc.extract_city_from_address(v) for v in vals]),
+        "extract_location_data": (lambda: results, lambda vals: [gwc.extract_location_data(r) for r in vals]),
+        "normalize_cities": (lambda: copy.deepcopy(wc_rows), gwc.normalize_cities),
+        "project_rows": (lambda: sheet, gwc.project_rows),
+    }
+
+
+def _timed(prepare, run) -> float:
+    """Seconds per pass, averaged over as many passes as fit in MIN_SAMPLE_SECONDS."""
+    elapsed = 0.0
+    passes = 0
+    while elapsed < MIN_SAMPLE_SECONDS:
+        data = prepare()
+        _clear_caches()
+        gc.collect()
+        start = time.perf_counter()
+        run(data)
+        elapsed += time.perf_counter() - start
+        passes += 1
+    return elapsed / passes
+
+
+def _peak_kib(prepare, run) -> float:
+    data = prepare()
+    _clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run_suite(rows: int, seed: int, repeat: int) -> tuple:
+    """({name: {"rows_per_s", "peak_kib"}}, median calibration ops/s over the run)."""
+    gwc._metro_index()  # load once, like a real run, so the first case is not charged for it
+    out = {}
+    calibration = []
+    for name, (prepare, run) in _cases(rows, seed).items():
+        seconds = statistics.median(_timed(prepare, run) for _ in range(repeat))
+        out[name] = {"rows_per_s": round(rows / seconds), "peak_kib": round(_peak_kib(prepare, run))}
+        calibration.extend(calibration_ops_per_s() for _ in range(3))
+    return out, statistics.median(calibration)
+
+
+def compare(results: dict, baseline: dict, threshold: float, host_scale: float = 1.0) -> list:
+    """Names of cases whose throughput fell more than `threshold` below the baseline.
+
+    host_scale is this host's calibration speed over the baseline host's.
+    """
+    slower = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is not None and current["rows_per_s"] < base["rows_per_s"] * host_scale * (1 - threshold):
+            slower.append(name)
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timing samples per case (median).")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a case regressed past --threshold.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed throughput drop as a fraction of the baseline (0.25 = 25%% slower).",
+    )
+    args = parser.parse_args()
+
+    baseline = {}
+    baseline_calibration = None
+    if Path(args.baseline).exists():
+        saved = json.loads(Path(args.baseline).read_text())
+        if saved.get("rows") == args.rows and saved.get("seed") == args.seed:
+            baseline = saved["results"]
+            baseline_calibration = saved.get("calibration_ops_per_s")
+        elif args.check:
+            raise SystemExit(f"Baseline was recorded with --rows {saved.get('rows')} --seed {saved.get('seed')}")
+    if args.check and not baseline:
+        raise SystemExit(f"No baseline at {args.baseline}; run with --save-baseline first")
+
+    results, calibration = run_suite(args.rows, args.seed, args.repeat)
+    calibration = round(calibration)
+    host_scale = calibration / baseline_calibration if baseline_calibration else 1.0
+    print(f"{args.rows:,} synthetic rows, seed {args.seed}, median of {args.repeat}; host speed {host_scale:.2f}x baseline")
+    for name, r in results.items():
+        line = f"  {name:<28} {r['rows_per_s']:>12,} rows/s  {r['peak_kib']:>9,} KiB peak"
+        if name in baseline:
+            line += f"  ({r['rows_per_s'] / (baseline[name]['rows_per_s'] * host_scale):5.2f}x baseline)"
+        print(line)
+
+    if args.save_baseline:
+        Path(args.baseline).write_text(
+            json.dumps(
+                {
+                    "rows": args.rows,
+                    "seed": args.seed,
+                    "python": platform.python_version(),
+                    "calibration_ops_per_s": calibration,
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Saved baseline to {args.baseline}")
+    if args.check:
+        slower = compare(results, baseline, args.threshold, host_scale)
+        if slower:
+            print(f"Regression (> {args.threshold:.0%} slower than baseline): {', '.join(slower)}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No case more than {args.threshold:.0%} slower than baseline.")
+
+
+if __name__ == "__main__":
+    main()
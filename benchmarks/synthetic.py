@@ -0,0 +1,146 @@
+"""
+Seeded generator of synthetic provider-sheet rows for benchmarks.
+
+generate_rows/generate_frame give Production rows (clean_and_validate's
+SHEET_HEADERS); generate_working_copy_rows gives Working Copy rows
+(geocode_working_copy's HEADERS) and generate_geocode_results matching Google
+Geocoding responses. Values mix clean entries with the messy ones seen in real
+submissions (sheet escapes, sentinels, several emails or URLs in one cell,
+free-text language and interpreter notes, non-ASCII cities), so every fast
+path and fallback in the cleaners gets exercised.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from clean_and_validate import SHEET_HEADERS  # noqa: E402
+from geocode_working_copy import HEADERS as WORKING_COPY_HEADERS  # noqa: E402
+
+FIRST = ["Ada", "Grace", "J. Robert", "Mary  Ann", "Li", "Sofía", "nan", ""]
+LAST = ["Lovelace", "Hopper", "O'Brien", "van der Berg", "García", "Nguyen", "N/A"]
+EMAIL_DOMAINS = ["example.org", "hospital.example.com", "uni.example.ac.uk", "clinic.example.de"]
+EMAIL_MESSY = ["prefer not to say", "a@b.co; second@x.org", "Foo, Bar@Example.org", "", "nan", "bad-address"]
+WEBSITES = [
+    "https://example.org/", "www.Example.org", "example.org/team", "Prefer not to say",
+    "see https://a.org, or www.b.org", "http://x.org; http://y.org", "n/a", "",
+]
+PHONES = [
+    "+1 617 555 {:04d}", "'+44 20 7946 {:04d}", "617-555-{:04d} / 617-555-0101", "(617)  555  {:04d}",
+    "prefer not to say", "#ERROR!", "",
+]
+LANGUAGES = [
+    "English", "English, Spanish", "Spanish, English", "English and French", "English; Mandarin",
+    "English with interpreter services available", "Prefer not to say", "German (some)", "",
+    "English; Spanish via Language Line", "Others with provided interpreter services", "Français, Español",
+]
+CITIES = ["Boston", "NYC", "New York", "Mexico# test", "London", "Tokyo", "nan", "", "São Paulo", "東京", "Zürich"]
+COUNTRIES = ["United States", "USA", "Mexico# Test comment", "United Kingdom", "Japan", "null"]
+ADDRESSES = ["{} Main St\nBoston, MA 02114", "  {} Elm   Rd ", "PO Box {},\n\nParis", "none"]
+# One-line work_address values as typed into the Working Copy
+WORK_ADDRESSES = [
+    "{} Fruit St, Boston, MA 02114, USA",
+    "{} Longwood Ave, Boston, MA 02115",
+    "Level 3, {} Flemington Rd, Parkville VIC 3052, Australia",
+    "Great Ormond St, London WC1N 3JH, United Kingdom",
+    "Av. Dr. Enéas Carvalho de Aguiar, {} - Cerqueira César, São Paulo - SP, Brazil",
+    "7-3-1 Hongo, Bunkyo City, Tokyo 113-8655, Japan",
+    "PO Box {}, Toronto, ON M5G 1X8, Canada",
+    "Rämistrasse {}, 8006 Zürich, Switzerland",
+    "Telehealth only",
+    "",
+]
+# (locality, admin area 1 short name, country, lat, lng); "" locality falls back to sublocality/admin areas
+GEOCODED_PLACES = [
+    ("Boston", "MA", "United States", 42.3601, -71.0589),
+    ("New York", "NY", "United States", 40.7128, -74.0060),
+    ("", "Tokyo", "Japan", 35.7128, 139.7621),
+    ("São Paulo", "SP", "Brazil", -23.5505, -46.6333),
+    ("Zürich", "ZH", "Switzerland", 47.3769, 8.5417),
+    ("London", "England", "United Kingdom", 51.5072, -0.1276),
+    ("東京", "東京都", "Japan", 35.6762, 139.6503),
+]
+
+
+def generate_rows(n: int, seed: int = 0) -> list:
+    """n Production rows as dicts keyed by SHEET_HEADERS."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        if rng.random() < 0.7:
+            email = f"{first[:1].lower() or 'x'}{i}@{rng.choice(EMAIL_DOMAINS)}"
+        else:
+            email = rng.choice(EMAIL_MESSY)
+        row = {h: "" for h in SHEET_HEADERS}
+        row.update({
+            "name_first": first,
+            "name_last": last,
+            "email": email,
+            "phone_work": rng.choice(PHONES).format(i % 10000),
+            "work_website": rng.choice(WEBSITES),
+            "work_institution": rng.choice(["General Hospital", "  Children's  Hospital ", "-"]),
+            "job_title": rng.choice(["Genetic Counselor", "MD", ""]),
+            "work_address": rng.choice(ADDRESSES).format(i % 500),
+            "language_spoken": rng.choice(LANGUAGES),
+            "uses_interpreters": rng.choice(["TRUE", "FALSE", ""]),
+            "specialties": "Cancer, Pediatrics",
+            "Latitude": f"{rng.uniform(-60, 70):.6f}",
+            "Longitude": f"{rng.uniform(-180, 180):.6f}",
+            "City": rng.choice(CITIES),
+            "Country": rng.choice(COUNTRIES),
+        })
+        rows.append(row)
+    return rows
+
+
+def generate_frame(n: int, seed: int = 0):
+    import pandas as pd
+
+    return pd.DataFrame(generate_rows(n, seed), columns=SHEET_HEADERS)
+
+
+def generate_working_copy_rows(n: int, seed: int = 0) -> list:
+    """n Working Copy data rows as lists in HEADERS order, about half already geocoded."""
+    rows = []
+    for i, prod in enumerate(generate_rows(n, seed)):
+        rng = random.Random(seed * 1_000_003 + i)
+        row = [prod.get(h, "") for h in WORKING_COPY_HEADERS]
+        row[WORKING_COPY_HEADERS.index("work_address")] = rng.choice(WORK_ADDRESSES).format(i % 900 + 1)
+        if rng.random() < 0.5:
+            row[WORKING_COPY_HEADERS.index("Latitude")] = ""
+            row[WORKING_COPY_HEADERS.index("Longitude")] = ""
+        else:
+            _, _, _, lat, lng = rng.choice(GEOCODED_PLACES)
+            row[WORKING_COPY_HEADERS.index("Latitude")] = f"{lat + rng.uniform(-0.05, 0.05):.6f}"
+            row[WORKING_COPY_HEADERS.index("Longitude")] = f"{lng + rng.uniform(-0.05, 0.05):.6f}"
+        rows.append(row)
+    return rows
+
+
+def generate_geocode_results(n: int, seed: int = 0) -> list:
+    """n Google Geocoding result dicts (the first entry of "results") for extract_location_data."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(n):
+        locality, admin1, country, lat, lng = rng.choice(GEOCODED_PLACES)
+        components = [
+            {"long_name": str(i % 900 + 1), "short_name": str(i % 900 + 1), "types": ["street_number"]},
+            {"long_name": "Main Street", "short_name": "Main St", "types": ["route"]},
+        ]
+        if locality:
+            components.append({"long_name": locality, "short_name": locality, "types": ["locality", "political"]})
+        else:
+            components.append({"long_name": "Bunkyo City", "short_name": "Bunkyo City", "types": ["sublocality_level_1"]})
+        components += [
+            {"long_name": admin1, "short_name": admin1, "types": ["administrative_area_level_1", "political"]},
+            {"long_name": country, "short_name": country[:2].upper(), "types": ["country", "political"]},
+            {"long_name": f"{rng.randrange(10000, 99999)}", "short_name": "", "types": ["postal_code"]},
+        ]
+        results.append({
+            "geometry": {"location": {"lat": lat + rng.uniform(-0.05, 0.05), "lng": lng + rng.uniform(-0.05, 0.05)}},
+            "address_components": components,
+        })
+    return results
@@ -0,0 +1,105 @@
+"""
+Order smart_geocode's query attempts (institution + address, address, institution)
+by how often each has returned complete data for rows of the same shape earlier
+in the run. Opt-in: a complete lower-scoring answer found first is kept.
+"""
+
+import re
+import threading
+from collections import Counter
+
+ATTEMPT_KINDS = ("combined", "address", "institution")
+# Prior chance of a complete result per attempt kind, weighted as PRIOR_WEIGHT observations
+PRIORS = (0.6, 0.5, 0.4)
+PRIOR_WEIGHT = 4.0
+
+_POSTAL_RE = re.compile(
+    r"\b(?:\d{5}(?:-\d{4})?|[A-Z]{1,2}\d[A-Z\d]? ?\d[A-Z]{2}|[A-Z]\d[A-Z] ?\d[A-Z]\d|\d{4}(?:-\d{3})?|\d{3}-\d{4}|\d{6})\b",
+    re.IGNORECASE,
+)
+_DIGIT_RE = re.compile(r"\d")
+
+
+def attempt_queries(inst: str, addr: str) -> list:
+    """[(kind index, query)] in the fixed order, empty and repeated queries dropped."""
+    seen = set()
+    out = []
+    for i, query in enumerate((", ".join(filter(None, [inst, addr])), addr, inst)):
+        if query and query not in seen:
+            seen.add(query)
+            out.append((i, query))
+    return out
+
+
+def row_shape(inst: str, addr: str) -> tuple:
+    """(has institution, structured street address, postal code present) for one row."""
+    parts = [p.strip() for p in addr.replace("\n", ",").split(",") if p.strip()]
+    structured = len(parts) >= 2 and bool(_DIGIT_RE.search(parts[0]))
+    postal = any(_POSTAL_RE.search(p) for p in parts[1:])
+    return bool(inst), structured, postal
+
+
+class AttemptPlanner:
+    """Shared by all geocoding workers. adaptive=False keeps the fixed order (still dropping repeats)."""
+
+    def __init__(self, adaptive: bool = True):
+        self.adaptive = adaptive
+        self.tried = Counter()  # (shape, kind index) -> attempts made
+        self.complete = Counter()  # (shape, kind index) -> attempts that returned complete data
+        self.queries = 0
+        self.reordered = 0
+        self.repeats_skipped = 0
+        self.first_complete = 0
+        self.lookups = 0
+        self._lock = threading.Lock()
+
+    def estimate(self, shape: tuple, kind: int) -> float:
+        """Smoothed chance that attempt `kind` returns complete data for a row of `shape`."""
+        key = (shape, kind)
+        return (self.complete[key] + PRIORS[kind] * PRIOR_WEIGHT) / (self.tried[key] + PRIOR_WEIGHT)
+
+    def plan(self, inst: str, addr: str) -> tuple:
+        """(shape, [(kind index, query)]) in the order to try them."""
+        attempts = attempt_queries(inst, addr)
+        shape = row_shape(inst, addr)
+        with self._lock:
+            self.queries += 1
+            if attempts:
+                # The fixed order also sent the combined query when it equals the address or institution
+                self.repeats_skipped += 1 + bool(inst) + bool(addr) - len(attempts)
+            if self.adaptive and len(attempts) > 1:
+                ordered = sorted(attempts, key=lambda a: -self.estimate(shape, a[0]))
+                if ordered != attempts:
+                    self.reordered += 1
+                attempts = ordered
+        return shape, attempts
+
+    def record(self, shape: tuple, kind: int, complete: bool, first: bool = False) -> None:
+        with self._lock:
+            self.tried[(shape, kind)] += 1
+            self.complete[(shape, kind)] += int(complete)
+            self.lookups += 1
+            if first and complete:
+                self.first_complete += 1
+
+    def counts(self) -> dict:
+        """Counters for metrics: attempts and complete results per kind, reorders and skipped repeats."""
+        out = Counter()
+        for (_, kind), n in self.tried.items():
+            out[f"tried.{ATTEMPT_KINDS[kind]}"] += n
+        for (_, kind), n in self.complete.items():
+            out[f"complete.{ATTEMPT_KINDS[kind]}"] += n
+        out["reordered"] = self.reordered
+        out["repeats_skipped"] = self.repeats_skipped
+        out["first_complete"] = self.first_complete
+        return dict(out)
+
+    def summary(self) -> str:
+        if not self.queries:
+            return "Query attempts: none"
+        mode = "adaptive order" if self.adaptive else "fixed order"
+        return (
+            f"Query attempts ({mode}): {self.lookups / self.queries:.2f} lookups per query, "
+            f"first attempt complete for {100 * self.first_complete / self.queries:.0f}%, "
+            f"{self.reordered} queries reordered, {self.repeats_skipped} repeated queries skipped"
+        )
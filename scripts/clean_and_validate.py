@@ -3,20 +3,34 @@
 Clean and validate provider data. Logic originally from notebooks/process_excel_data.ipynb (removed).
 Reads Production tab from Google Sheets, applies cleaning, writes back to Production.
 No local CSV. For CI: --output-stdout prints cleaned CSV for encrypt step.
-Run: python scripts/clean_and_validate.py [--output-stdout]
+--changed-rows-only sends just the rows cleaning changed, in one batchUpdate.
+--stream reads, cleans, writes back and prints Production in pages of
+--chunk-rows rows, so memory stays bounded and CSV output starts early.
+--workers N cleans row chunks in N processes on large tabs.
+--email-report PATH lists rows whose email was fixed or dropped (see email_cleaning.py).
+--metrics-out PATH writes per-stage timings and counters as JSON (see metrics.py).
+The full read reuses the sheet snapshot geocode_working_copy.py saved when the
+spreadsheet has not changed since (see sheet_io.py); --no-snapshot skips it.
+Run: python scripts/clean_and_validate.py [--output-stdout] [--changed-rows-only] [--stream] [--workers N]
 """
 
 import argparse
 import csv
+import functools
 import io
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from phone_cleaning import clean_phone
+from email_cleaning import clean_email_column, write_email_report
+from language_cleaning import scan_language_column, uses_interpreters
+from metrics import Metrics
+from phone_cleaning import clean_phones
+from sheet_io import DEFAULT_SNAPSHOT_PATH, PRODUCTION_RANGE, get_clients, read_ranges
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
@@ -51,48 +65,80 @@ SHEET_HEADERS = [
     "address_zip",
 ]
 PUBLIC_HEADERS = [h for h in SHEET_HEADERS if h != "credential_link"]
-
-try:
-    import validators
-    HAS_VALIDATORS = True
-except ImportError:
-    HAS_VALIDATORS = False
-
-
-def _first_valid_email(cell):
-    if pd.isnull(cell) or str(cell).strip() == "":
-        return None
-    for e in str(cell).split(";"):
-        e = e.strip().lower().replace(",", "").replace(" ", "")
-        if not e:
-            continue
-        if HAS_VALIDATORS:
-            try:
-                if validators.email(e):
-                    return e
-            except Exception:
-                continue
-        elif "@" in e and "." in e:
-            return e
-    return None
+DEFAULT_CHUNK_ROWS = 5000
+# Below this many rows per worker, process start-up and pickling cost more than
+# the cleaning saved (see benchmarks/bench_parallel_clean.py).
+MIN_ROWS_PER_WORKER = 20000
+
+
+def _apply_with_fast_path(series: pd.Series, fast, fast_values, fallback) -> pd.Series:
+    """Combine vectorized results for rows in `fast` with fallback(value) for the rest.
+
+    `fast_values` holds the results for the `fast` rows, in order. The result is
+    built from a plain list so pandas infers its dtype exactly as Series.apply would.
+    """
+    if series.empty:
+        return series.apply(fallback)
+    fast = np.asarray(fast, dtype=bool)
+    out = np.empty(len(series), dtype=object)
+    out[fast] = np.asarray(fast_values, dtype=object)
+    slow = ~fast
+    if slow.any():
+        out[slow] = [fallback(v) for v in series.to_numpy(dtype=object)[slow]]
+    return pd.Series(out.tolist(), index=series.index, name=series.name)
+
+
+class MemoStats:
+    """Per column: rows seen vs distinct values actually cleaned by _memoized."""
+
+    def __init__(self):
+        self.rows = Counter()
+        self.distinct = Counter()
+
+    def record(self, column, rows: int, distinct: int) -> None:
+        self.rows[column] += rows
+        self.distinct[column] += distinct
+
+    def merge(self, other: "MemoStats") -> None:
+        self.rows.update(other.rows)
+        self.distinct.update(other.distinct)
+
+    def summary(self) -> str:
+        if not self.rows:
+            return "Cleaner memo: no columns"
+        parts = [f"{col} {self.distinct[col]:,}/{self.rows[col]:,}" for col in self.rows]
+        return "Cleaner memo (distinct values cleaned / rows): " + ", ".join(parts)
+
+
+def _memoized(series: pd.Series, cleaner, stats: MemoStats | None = None) -> pd.Series:
+    """cleaner(series), computed once per distinct value and mapped back via pd.factorize.
+
+    Only all-text columns are factorized (factorize would merge 1, 1.0 and True);
+    missing values go through the cleaner as they are.
+    """
+    if series.empty or pd.api.types.infer_dtype(series, skipna=True) not in {"string", "empty"}:
+        return cleaner(series)
+    codes, uniques = pd.factorize(series)
+    if stats is not None:
+        stats.record(series.name, len(series), len(uniques))
+    cleaned = cleaner(pd.Series(uniques, dtype=object, name=series.name)).to_numpy(dtype=object)
+    missing = codes < 0
+    out = np.empty(len(series), dtype=object)
+    out[~missing] = cleaned[codes[~missing]]
+    if missing.any():
+        out[missing] = cleaner(series[missing]).to_numpy(dtype=object)
+    return pd.Series(out.tolist(), index=series.index, name=series.name)
 
 
 def clean_emails(df: pd.DataFrame) -> pd.DataFrame:
-    emails = (
-        df["email"]
-        .astype(str)
-        .str.strip()
-        .str.lower()
-        .str.replace(",", "", regex=False)
-        .str.replace(" ", "", regex=False)
-    )
     df = df.copy()
-    df["email"] = emails.apply(_first_valid_email)
+    df["email"] = clean_email_column(df["email"])
     return df
 
 
 CITY_ALIASES = {"ny": "New York City", "nyc": "New York City"}
 NULL_LIKE_TEXT = {"nan", "none", "null", "undefined", "n/a", "na", "-", "--"}
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _sheet_cell(value) -> str:
@@ -103,29 +149,39 @@ def _sheet_cell(value) -> str:
     return "" if text.lower() in NULL_LIKE_TEXT else text
 
 
-def _clean_text_field(value, field):
-    if pd.isnull(value):
-        return value
-    text = _sheet_cell(value)
-    text = re.sub(r"\s+", " ", text)
-    if field == "work_address":
-        text = re.sub(r"\n+", ", ", text)
-        text = re.sub(r"\s+", " ", text)
+def _sheet_text(series: pd.Series) -> pd.Series:
+    """Vectorized _sheet_cell for non-null values: strip, blank out null-like text."""
+    text = series.astype(str).str.strip()
+    return text.mask(text.str.lower().isin(NULL_LIKE_TEXT), "")
+
+
+def _clean_text_series(series: pd.Series, field) -> pd.Series:
+    """Strip and blank null-like text, collapse whitespace; name_first also loses its dots."""
+    present = series.notna()
+    text = _sheet_text(series[present]).str.replace(_WHITESPACE_RE, " ", regex=True)
+    # No newline survives the whitespace collapse, so work_address needs nothing more.
     if field == "name_first":
-        text = text.replace(".", "")
-    return text
+        text = text.str.replace(".", "", regex=False)
+    return _apply_with_fast_path(series, present, text, lambda value: value)
 
 
-def _strip_comment(val) -> str:
-    """Remove inline comments (e.g. 'Mexico# Test comment' -> 'Mexico')."""
-    if pd.isnull(val):
-        return ""
-    s = _sheet_cell(val)
-    i = s.find("#")
-    return _sheet_cell(s[:i].strip() if i >= 0 else s)
+def _strip_comment_series(series: pd.Series) -> pd.Series:
+    """Remove inline comments (e.g. 'Mexico# Test comment' -> 'Mexico'); missing values become ""."""
+    text = _sheet_text(series.astype(str).fillna(""))
+    return _sheet_text(text.str.split("#", n=1).str[0])
+
+
+def _clean_city_series(series: pd.Series) -> pd.Series:
+    city = _strip_comment_series(series)
+    return city.str.lower().map(CITY_ALIASES).fillna(city)
+
+
+# Low-cardinality columns: cleaned once per distinct value (see _memoized).
+# language_spoken is factorized the same way inside scan_language_column.
+MEMO_COLUMNS = {"work_institution", "job_title", "address_state", "City", "Country", "work_website"}
 
 
-def clean_fields(df: pd.DataFrame) -> pd.DataFrame:
+def clean_fields(df: pd.DataFrame, stats: MemoStats | None = None) -> pd.DataFrame:
     fields = [
         "name_first",
         "name_last",
@@ -140,16 +196,14 @@ def clean_fields(df: pd.DataFrame) -> pd.DataFrame:
     for col in fields:
         if col not in df.columns:
             continue
-        df[col] = df[col].apply(lambda value: _clean_text_field(value, col))
+        cleaner = functools.partial(_clean_text_series, field=col)
+        df[col] = _memoized(df[col], cleaner, stats) if col in MEMO_COLUMNS else cleaner(df[col])
     # Country: strip inline comments (e.g. "Mexico# Test" -> "Mexico")
     if "Country" in df.columns:
-        df["Country"] = df["Country"].astype(str).apply(_strip_comment)
+        df["Country"] = _memoized(df["Country"], _strip_comment_series, stats)
     # City: NY -> New York City; strip comments
     if "City" in df.columns:
-        df["City"] = df["City"].astype(str).apply(_strip_comment)
-        df["City"] = df["City"].apply(
-            lambda v: CITY_ALIASES.get(v.lower().strip(), v) if v else v
-        )
+        df["City"] = _memoized(df["City"], _clean_city_series, stats)
     return df
 
 
@@ -159,6 +213,16 @@ NON_URL_RESPONSES = {
 }
 
 
+_WEBSITE_TRAILING = " .,/;:\n\t"
+# Finished after lower/strip: one URL ("https://x.org", "www.x.org") or a bare
+# domain ("x.org/team") with no URL embedded in it.
+_WEBSITE_FAST_RE = re.compile(
+    r"(?:https?://|www\.)[^\s,;]+"
+    r"|(?!.*(?:https?://|www\.))[a-z0-9\-\.]+\.[a-z]{2,}[/\w\-\.\?\=\&\%]*"
+)
+_NO_SCHEME_RE = re.compile(r"^(?!https?://)")
+
+
 def clean_website(val):
     if pd.isnull(val):
         return None
@@ -184,31 +248,17 @@ def clean_website(val):
     return s if s else None
 
 
-INTERPRETER_PATTERNS = [
-    r"interpret(er|ation)( services| present| available)?",
-    r"with use of", r"with provided interpreter",
-    r"others? with (provided )?interpreter( services)?",
-    r"all other languages with interpretation services",
-    r"we also use interpreters?", r"globo interpreter",
-    r"translation", r"interpreter present",
-    r"other languages with an interpreter present",
-]
-
-LANG_IGNORE = {
-    "other", "others", "interpreter", "interpreter present",
-    "interpretation", "translation", "services", "provided",
-    "available", "languages", "with", "an", "present", "some",
-}
+def clean_websites(series: pd.Series) -> pd.Series:
+    """Series equivalent of series.apply(clean_website).
 
-
-def uses_interpreters_func(val):
-    if pd.isnull(val):
-        return False
-    val_str = str(val).lower()
-    for pat in INTERPRETER_PATTERNS:
-        if re.search(pat, val_str):
-            return True
-    return False
+    Values that are already a single URL ("https://x.org", "www.x.org") or a
+    bare domain ("x.org/team") are finished with string ops; the rest (multiple
+    URLs, free text, sentinels) fall back to clean_website.
+    """
+    text = series.astype(str).str.strip().str.lower().str.rstrip(_WEBSITE_TRAILING)
+    fast = series.notna() & text.str.fullmatch(_WEBSITE_FAST_RE, na=False)
+    done = text[fast].str.replace(_NO_SCHEME_RE, "https://", regex=True)
+    return _apply_with_fast_path(series, fast, done, clean_website)
 
 
 def normalize_uses_interpreters(explicit_value, language_value):
@@ -217,69 +267,91 @@ def normalize_uses_interpreters(explicit_value, language_value):
         normalized = str(explicit_value).strip().upper()
         if normalized in {"TRUE", "FALSE"}:
             return normalized
-    return "TRUE" if uses_interpreters_func(language_value) else "FALSE"
+    return "TRUE" if uses_interpreters(language_value) else "FALSE"
 
 
-def clean_languages(val):
-    if pd.isnull(val):
-        return None
-    val = str(val).strip()
-    val = re.sub(r"\([^)]*\)", "", val)
-    if re.search(r"prefer not to say", val, re.IGNORECASE):
-        return None
-    val = re.sub(
-        r"(all other languages with interpretation services|others? with (provided )?interpreter( services)?|interpretation services available|we also use interpreters?|limited [a-z]+|with use of [A-Za-z ]+|other languages with an interpreter present|interpreter present|translation|globo interpreter)",
-        "", val, flags=re.IGNORECASE,
-    )
-    val = val.strip()
-    val = re.sub(r"[;|/]", ",", val).replace("\n", ",")
-    val = re.sub(r"(\s+and\s+|\s+&\s+|^and\s+|\s+and$|^&\s+|\s+&$)", ",", val, flags=re.IGNORECASE)
-    val = re.sub(r"\.", "", val)
-    val = re.sub(r"[^a-zA-Z,\s]", "", val)
-    val = re.sub(r"\s+", " ", val)
-    val = re.sub(r",+", ",", val).strip(",").strip()
-    langs = []
-    for chunk in val.split(","):
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-        words = chunk.split()
-        if len(words) > 1:
-            langs.extend(words)
-        else:
-            langs.append(chunk)
-    langs = [l for l in langs if l.lower() not in LANG_IGNORE and l.strip()]
-    langs = [l.strip().capitalize() for l in langs]
-    seen = set()
-    langs_clean = []
-    for l in langs:
-        if l.lower() not in seen:
-            langs_clean.append(l)
-            seen.add(l.lower())
-    langs_clean = sorted(langs_clean, key=lambda x: x.lower())
-    return ", ".join(langs_clean) if langs_clean else None
-
-
-def _get_sheets_client():
-    if not CREDENTIALS_PATH.exists() or not SHEET_ID_PATH.exists():
-        raise SystemExit("Need .gcp-credentials/genetics-map-sa-key.json and sheet-id.txt")
-    creds = service_account.Credentials.from_service_account_file(
-        str(CREDENTIALS_PATH),
-        scopes=["https://www.googleapis.com/auth/spreadsheets"],
-    )
-    return build("sheets", "v4", credentials=creds)
+def normalize_uses_interpreters_series(explicit: pd.Series, detected: pd.Series) -> pd.Series:
+    """Column-wise normalize_uses_interpreters; `detected` is the scan's uses_interpreters flag."""
+    normalized = explicit.astype(str).str.strip().str.upper()
+    keep = explicit.notna() & normalized.isin({"TRUE", "FALSE"})
+    return normalized.where(keep, detected.map({True: "TRUE", False: "FALSE"})).astype("str")
 
 
-def _read_production_from_sheet(sheets, spreadsheet_id):
-    res = sheets.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id,
-        range="'Production'!A:X",
-    ).execute()
-    rows = res.get("values", [])
-    if len(rows) < 2:
-        return None, pd.DataFrame()
-    header_row = rows[0]
-    data_rows = rows[1:]
+def clean_dataframe(df: pd.DataFrame, stats: MemoStats | None = None, metrics: Metrics | None = None) -> pd.DataFrame:
+    """Run every cleaner over a Production frame and project it to SHEET_HEADERS.
+
+    With `metrics`, each cleaner's wall time is added to a "clean.<name>" stage.
+    """
+    metrics = metrics if metrics is not None else Metrics()
+    df = df.copy()
+    for col in SHEET_HEADERS:
+        if col not in df.columns:
+            df[col] = ""
+    with metrics.stage("clean.emails"):
+        df = clean_emails(df)
+    with metrics.stage("clean.fields"):
+        df = clean_fields(df, stats)
+    with metrics.stage("clean.websites"):
+        df["work_website"] = _memoized(df["work_website"], clean_websites, stats)
+    with metrics.stage("clean.phones"):
+        df["phone_work"] = _memoized(df["phone_work"], clean_phones, stats)
+    with metrics.stage("clean.languages"):
+        languages, detected = scan_language_column(df["language_spoken"], stats)
+        df["uses_interpreters"] = normalize_uses_interpreters_series(df["uses_interpreters"], detected)
+        df["language_spoken"] = languages
+    return df[SHEET_HEADERS]
+
+
+def _clean_chunk(df: pd.DataFrame):
+    stats = MemoStats()
+    metrics = Metrics()
+    return clean_dataframe(df, stats, metrics), stats, metrics
+
+
+def _concat_cleaned(parts: list) -> pd.DataFrame:
+    """Concatenate cleaned chunks, re-inferring columns whose chunk dtypes disagree.
+
+    A chunk whose column is all missing infers object dtype where the others
+    infer str; re-inferring over the whole column gives what one serial
+    clean_dataframe call would have produced.
+    """
+    df = pd.concat(parts)
+    for col in SHEET_HEADERS:
+        if len({str(part[col].dtype) for part in parts}) > 1:
+            df[col] = pd.Series(df[col].tolist(), index=df.index, name=col)
+    return df
+
+
+def clean_dataframe_parallel(
+    df: pd.DataFrame, workers: int, pool=None, stats: MemoStats | None = None, metrics: Metrics | None = None
+) -> pd.DataFrame:
+    """clean_dataframe over contiguous row chunks in a process pool.
+
+    Chunks are merged back in their original order; the result is identical to
+    clean_dataframe(df). Falls back to the serial call when the frame is too
+    small for the pool to pay off. Pass `pool` to reuse one executor across calls.
+    Per-cleaner times from the workers are summed into `metrics`.
+    """
+    workers = min(int(workers), len(df) // MIN_ROWS_PER_WORKER)
+    if workers <= 1:
+        return clean_dataframe(df, stats, metrics)
+    size = -(-len(df) // workers)
+    chunks = [df.iloc[i:i + size] for i in range(0, len(df), size)]
+    if pool is not None:
+        results = list(pool.map(_clean_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as own_pool:
+            results = list(own_pool.map(_clean_chunk, chunks))
+    for _, chunk_stats, chunk_metrics in results:
+        if stats is not None:
+            stats.merge(chunk_stats)
+        if metrics is not None:
+            metrics.merge(chunk_metrics)
+    return _concat_cleaned([part for part, _, _ in results])
+
+
+def _production_frame(header_row, data_rows) -> pd.DataFrame:
+    """Project raw sheet rows onto SHEET_HEADERS using the sheet's own header order."""
     idx_by_name = {str(h).strip(): i for i, h in enumerate(header_row)}
     data = []
     for row in data_rows:
@@ -288,83 +360,284 @@ def _read_production_from_sheet(sheets, spreadsheet_id):
             i = idx_by_name.get(h, -1)
             obj[h] = row[i] if 0 <= i < len(row) else ""
         data.append(obj)
-    df = pd.DataFrame(data, columns=SHEET_HEADERS)
-    return header_row, df
+    return pd.DataFrame(data, columns=SHEET_HEADERS)
+
+
+def _read_production_from_sheet(sheets, spreadsheet_id, drive=None, snapshot_path=None):
+    """(header_row, df) for the Production tab, from the sheet_io snapshot when it is current."""
+    ranges, _ = read_ranges(sheets, spreadsheet_id, [PRODUCTION_RANGE], drive, snapshot_path)
+    rows = ranges[PRODUCTION_RANGE]
+    if len(rows) < 2:
+        return None, pd.DataFrame()
+    return rows[0], _production_frame(rows[0], rows[1:])
+
+
+def _production_row_count(sheets, spreadsheet_id) -> int:
+    meta = sheets.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        ranges="'Production'!A1",
+        fields="sheets.properties.gridProperties.rowCount",
+    ).execute()
+    return int(meta["sheets"][0]["properties"]["gridProperties"]["rowCount"])
+
+
+def _iter_production_chunks(sheets, spreadsheet_id, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield (header_row, first_row, df) for successive pages of Production data.
+
+    Pages are fetched as row ranges of `chunk_rows`. Together they hold exactly
+    the rows a full 'Production'!A:X read returns: blank rows inside the data
+    are kept (carried into the next page that has data), trailing ones dropped.
+    """
+    values = sheets.spreadsheets().values()
+    header = values.get(spreadsheetId=spreadsheet_id, range="'Production'!A1:X1").execute().get("values", [])
+    if not header:
+        return
+    header_row = header[0]
+    last_row = _production_row_count(sheets, spreadsheet_id)
+    pending_blank = 0
+    start = 2
+    while start <= last_row:
+        end = min(start + chunk_rows - 1, last_row)
+        rows = values.get(
+            spreadsheetId=spreadsheet_id,
+            range=f"'Production'!A{start}:X{end}",
+        ).execute().get("values", [])
+        if rows:
+            yield header_row, start - pending_blank, _production_frame(header_row, [[]] * pending_blank + rows)
+            pending_blank = 0
+        pending_blank += end - start + 1 - len(rows)
+        start = end + 1
+
+
+def _sheet_column(series: pd.Series) -> list:
+    """Vectorized _sheet_cell over a column."""
+    return _sheet_text(series).where(series.notna(), "").tolist()
+
+
+def _sheet_values(df: pd.DataFrame) -> list:
+    """Data rows in SHEET_HEADERS order, serialized column by column."""
+    blank = [""] * len(df)
+    columns = [_sheet_column(df[h]) if h in df.columns else blank for h in SHEET_HEADERS]
+    return [list(row) for row in zip(*columns)]
+
+
+def _changed_row_ranges(original_rows: list, rows: list, first_row: int = 2) -> list:
+    """batchUpdate `data` entries for the rows that differ, consecutive rows merged."""
+    last_col = chr(ord("A") + len(SHEET_HEADERS) - 1)
+    runs = []  # [first, last] row offsets
+    for i, row in enumerate(rows):
+        if i < len(original_rows) and row == original_rows[i]:
+            continue
+        if runs and runs[-1][1] == i - 1:
+            runs[-1][1] = i
+        else:
+            runs.append([i, i])
+    return [
+        {
+            "range": f"'Production'!A{first_row + r0}:{last_col}{first_row + r1}",
+            "values": rows[r0:r1 + 1],
+        }
+        for r0, r1 in runs
+    ]
 
 
-def _write_to_production(sheets, spreadsheet_id, header_row, df):
-    rows = [SHEET_HEADERS]
-    for _, r in df.iterrows():
-        row = [_sheet_cell(r.get(h, "")) for h in SHEET_HEADERS]
-        rows.append(row)
+def _write_to_production(sheets, spreadsheet_id, header_row, df, original=None, first_row=2):
+    """Write the cleaned frame to Production.
+
+    With `original` (the frame _read_production_from_sheet returned) and a
+    canonical header, only rows whose cells changed are sent, via one
+    batchUpdate; otherwise the whole tab is rewritten from A1. `first_row` is
+    the sheet row of df's first row; chunks after the first are written in
+    place without the header.
+    """
+    rows = _sheet_values(df)
+    canonical = [str(h).strip() for h in header_row or []] == SHEET_HEADERS
+    if original is not None and canonical and len(original) == len(rows):
+        raw = original.reindex(columns=SHEET_HEADERS).fillna("").astype(str)
+        data = _changed_row_ranges(raw.values.tolist(), rows, first_row)
+        print(f"Production: {sum(len(d['values']) for d in data)} of {len(rows)} rows changed", file=sys.stderr)
+        if data:
+            sheets.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={"valueInputOption": "RAW", "data": data},
+            ).execute()
+        return
+    if first_row > 2:
+        target, values = f"'Production'!A{first_row}", rows
+    else:
+        target, values = "'Production'!A1", [SHEET_HEADERS] + rows
     sheets.spreadsheets().values().update(
         spreadsheetId=spreadsheet_id,
-        range="'Production'!A1",
+        range=target,
         valueInputOption="RAW",
-        body={"values": rows},
+        body={"values": values},
     ).execute()
 
 
-def _df_to_csv_string(df):
+def _df_to_csv_string(df, header=True):
     """Output CSV for public encrypt step—excludes credential_link (admin-only)."""
     buf = io.StringIO()
-    df[PUBLIC_HEADERS].to_csv(buf, index=False, quoting=csv.QUOTE_ALL)
+    df[PUBLIC_HEADERS].to_csv(buf, index=False, header=header, quoting=csv.QUOTE_ALL)
     return buf.getvalue()
 
 
+def _empty_csv_string():
+    return _df_to_csv_string(pd.DataFrame(columns=PUBLIC_HEADERS))
+
+
+def run_streaming(
+    sheets, spreadsheet_id, chunk_rows, output_stdout, changed_rows_only=False, workers=1, stats=None, metrics=None
+) -> int:
+    """Read, clean, write back and (optionally) print Production one page at a time.
+
+    Only one page is held in memory; its CSV rows are flushed to stdout as soon
+    as it is cleaned. Returns the number of data rows processed.
+    """
+    metrics = metrics if metrics is not None else Metrics()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    total = 0
+    pages = _iter_production_chunks(sheets, spreadsheet_id, chunk_rows)
+    try:
+        while True:
+            with metrics.stage("read"):
+                page = next(pages, None)
+            if page is None:
+                break
+            header_row, first_row, source = page
+            metrics.count("pages")
+            with metrics.stage("clean"):
+                df = clean_dataframe_parallel(source, workers, pool, stats, metrics)
+            write_kwargs = {"original": source} if changed_rows_only else {}
+            with metrics.stage("write"):
+                _write_to_production(sheets, spreadsheet_id, header_row, df, first_row=first_row, **write_kwargs)
+            if output_stdout:
+                with metrics.stage("output"):
+                    sys.stdout.write(_df_to_csv_string(df, header=total == 0))
+                    sys.stdout.flush()
+            total += len(df)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if output_stdout and total == 0:
+        sys.stdout.write(_empty_csv_string())
+    metrics.count("rows", total)
+    return total
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--output-stdout", action="store_true", help="Print cleaned CSV to stdout for encrypt step")
+    parser.add_argument(
+        "--changed-rows-only",
+        action="store_true",
+        help="Write back only rows that cleaning changed (one batchUpdate) instead of rewriting the tab",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read, clean and emit Production in pages of --chunk-rows rows to bound memory",
+    )
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows per page with --stream")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=f"Clean in N processes (used once there are {MIN_ROWS_PER_WORKER}+ rows per worker)",
+    )
+    parser.add_argument(
+        "--email-report",
+        metavar="PATH",
+        help="Write a CSV of sheet rows whose email was fixed or dropped (row and reason, no addresses)",
+    )
+    parser.add_argument(
+        "--snapshot-path",
+        default=str(DEFAULT_SNAPSHOT_PATH),
+        help="Local sheet snapshot shared with geocode_working_copy.py (reused while the sheet is unchanged)",
+    )
+    parser.add_argument("--no-snapshot", action="store_true", help="Always read Production from the API")
+    parser.add_argument(
+        "--metrics-out",
+        metavar="PATH",
+        help="Write per-stage timings and counters as JSON (no provider data)",
+    )
     args = parser.parse_args()
+    if args.email_report and args.stream:
+        parser.error("--email-report is not supported with --stream")
 
     if not CREDENTIALS_PATH.exists() or not SHEET_ID_PATH.exists():
         print("Error: Need .gcp-credentials/ (workflow creates these from secrets)", file=sys.stderr)
         sys.exit(1)
 
-    creds = service_account.Credentials.from_service_account_file(
-        str(CREDENTIALS_PATH),
-        scopes=["https://www.googleapis.com/auth/spreadsheets"],
-    )
-    sheets = build("sheets", "v4", credentials=creds)
+    metrics = Metrics("clean_and_validate")
+    try:
+        _run(args, metrics)
+    finally:
+        if args.metrics_out:
+            metrics.write(args.metrics_out)
+
+
+def _run(args, metrics: Metrics) -> None:
+    with metrics.stage("connect"):
+        sheets, drive = get_clients(CREDENTIALS_PATH)
     spreadsheet_id = SHEET_ID_PATH.read_text().strip()
 
-    header_row, df = _read_production_from_sheet(sheets, spreadsheet_id)
+    stats = MemoStats()
+    if args.stream:
+        total = run_streaming(
+            sheets,
+            spreadsheet_id,
+            args.chunk_rows,
+            args.output_stdout,
+            args.changed_rows_only,
+            args.workers,
+            stats,
+            metrics,
+        )
+        _count_memo(metrics, stats)
+        if not total:
+            print("Production has no data rows.", file=sys.stderr)
+            sys.exit(0)
+        print(stats.summary(), file=sys.stderr)
+        print(f"✅ Cleaned and validated {total} rows → Production tab", file=sys.stderr)
+        return
+
+    snapshot_path = None if args.no_snapshot else args.snapshot_path
+    with metrics.stage("read"):
+        header_row, df = _read_production_from_sheet(sheets, spreadsheet_id, drive, snapshot_path)
+    metrics.count("rows", len(df))
     if df.empty:
         if args.output_stdout:
-            buf = io.StringIO()
-            pd.DataFrame(columns=PUBLIC_HEADERS).to_csv(buf, index=False, quoting=csv.QUOTE_ALL)
-            sys.stdout.write(buf.getvalue())
+            sys.stdout.write(_empty_csv_string())
         print("Production has no data rows.", file=sys.stderr)
         sys.exit(0)
 
-    for col in SHEET_HEADERS:
-        if col not in df.columns:
-            df[col] = ""
-
-    df = clean_emails(df)
-    df = clean_fields(df)
-    if "work_website" in df.columns:
-        df["work_website"] = df["work_website"].apply(clean_website)
-    if "phone_work" in df.columns:
-        df["phone_work"] = df["phone_work"].apply(clean_phone)
-    if "language_spoken" in df.columns:
-        df["uses_interpreters"] = [
-            normalize_uses_interpreters(explicit_value, language_value)
-            for explicit_value, language_value in zip(
-                df["uses_interpreters"], df["language_spoken"]
-            )
-        ]
-        df["language_spoken"] = df["language_spoken"].apply(clean_languages)
-
-    df = df[[c for c in SHEET_HEADERS if c in df.columns]]
+    source = df
+    with metrics.stage("clean"):
+        df = clean_dataframe_parallel(df, args.workers, stats=stats, metrics=metrics)
+    _count_memo(metrics, stats)
+    print(stats.summary(), file=sys.stderr)
+    if args.email_report:
+        with metrics.stage("email_report"):
+            _, reasons = clean_email_column(source["email"], with_reasons=True)
+            counts = write_email_report(args.email_report, reasons.tolist())
+        metrics.count_all("email", counts)
+        print("Email check: " + ", ".join(f"{r} {n}" for r, n in sorted(counts.items())), file=sys.stderr)
     header_for_sheet = header_row if header_row else SHEET_HEADERS
-    _write_to_production(sheets, spreadsheet_id, header_for_sheet, df)
+    write_kwargs = {"original": source} if args.changed_rows_only else {}
+    with metrics.stage("write"):
+        _write_to_production(sheets, spreadsheet_id, header_for_sheet, df, **write_kwargs)
 
     print(f"✅ Cleaned and validated {len(df)} rows → Production tab", file=sys.stderr)
 
     if args.output_stdout:
-        csv_str = _df_to_csv_string(df)
-        sys.stdout.write(csv_str)
+        with metrics.stage("output"):
+            csv_str = _df_to_csv_string(df)
+            sys.stdout.write(csv_str)
+
+
+def _count_memo(metrics: Metrics, stats: MemoStats) -> None:
+    metrics.count_all("memo_rows", stats.rows)
+    metrics.count_all("memo_distinct", stats.distinct)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+"""
+Email cell cleaning: the first valid address in a cell, plus a reason code.
+
+Cells are lowercased and stripped of spaces and commas, then split on ";".
+Each candidate is checked against a compiled fast-path pattern first. The
+pattern matches a strict subset of what validators.email accepts. Only the
+remaining, borderline candidates reach validators.email, and those verdicts
+are memoized per address.
+"""
+
+import csv
+import functools
+import re
+from collections import Counter
+
+# Reason codes, one per row
+VALID = "valid"  # the cell was exactly one valid address
+NORMALIZED = "normalized"  # one valid address once case, spaces and commas were cleaned up
+FIRST_OF_MANY = "first_of_many"  # several candidates; the first valid one was kept
+INVALID = "invalid"  # no valid address
+EMPTY = "empty"  # missing or blank
+REASONS = (VALID, NORMALIZED, FIRST_OF_MANY, INVALID, EMPTY)
+
+_FAST_RE = re.compile(
+    r"(?=[^@]{1,64}@)[a-z0-9_+-]+(?:\.[a-z0-9_+-]+)*"
+    r"@(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,24}"
+)
+_JUNK_RE = re.compile(r"[, ]")
+
+
+def _is_nullish(val) -> bool:
+    if val is None:
+        return True
+    try:
+        return bool(val != val)
+    except TypeError:  # pd.NA
+        return True
+
+
+@functools.lru_cache(maxsize=1)
+def _validators():
+    """The validators module, imported on the first borderline address; None if not installed."""
+    try:
+        import validators
+    except ImportError:
+        return None
+    return validators
+
+
+@functools.lru_cache(maxsize=65536)
+def is_valid_address(address: str) -> bool:
+    if _FAST_RE.fullmatch(address):
+        return True
+    validators = _validators()
+    if validators is not None:
+        try:
+            return bool(validators.email(address))
+        except Exception:
+            return False
+    return "@" in address and "." in address
+
+
+def email_with_reason(cell):
+    """(address or None, reason code) for one sheet cell."""
+    if _is_nullish(cell):
+        return None, EMPTY
+    raw = str(cell)
+    normalized = _JUNK_RE.sub("", raw.strip().lower())
+    candidates = [e.strip().lower().replace(",", "").replace(" ", "") for e in normalized.split(";")]
+    candidates = [e for e in candidates if e]
+    for e in candidates:
+        if is_valid_address(e):
+            if len(candidates) > 1:
+                return e, FIRST_OF_MANY
+            return e, VALID if e == raw else NORMALIZED
+    return None, INVALID if candidates else EMPTY
+
+
+def first_valid_email(cell):
+    return email_with_reason(cell)[0]
+
+
+def clean_email_column(series, with_reasons=False):
+    """Series equivalent of series.apply(first_valid_email).
+
+    Cells that are a single plain address after normalization are finished with
+    string ops; the rest use email_with_reason. With `with_reasons`, returns
+    (emails, reasons) where reasons holds one REASONS code per row.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if series.empty:
+        emails = series.apply(first_valid_email)
+        return (emails, series.apply(lambda cell: email_with_reason(cell)[1])) if with_reasons else emails
+    text = series.astype(str)
+    normalized = text.str.strip().str.lower().str.replace(_JUNK_RE, "", regex=True)
+    fast = (series.notna() & normalized.str.fullmatch(_FAST_RE, na=False)).to_numpy(dtype=bool)
+    emails = np.empty(len(series), dtype=object)
+    emails[fast] = normalized[fast].to_numpy(dtype=object)
+    reasons = np.empty(len(series), dtype=object)
+    reasons[fast] = np.where((text[fast] == normalized[fast]).to_numpy(dtype=bool), VALID, NORMALIZED)
+    if not fast.all():
+        slow = [email_with_reason(cell) for cell in series.to_numpy(dtype=object)[~fast]]
+        emails[~fast] = [address for address, _ in slow]
+        reasons[~fast] = [reason for _, reason in slow]
+    emails = pd.Series(emails.tolist(), index=series.index, name=series.name)
+    if with_reasons:
+        return emails, pd.Series(reasons.tolist(), index=series.index, name="email_reason", dtype=object)
+    return emails
+
+
+def write_email_report(path, reasons, first_row: int = 2) -> Counter:
+    """CSV of sheet rows whose email was not already valid (row number and reason only,
+    never the address). Returns the count per reason."""
+    counts = Counter(reasons)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["sheet_row", "reason"])
+        for offset, reason in enumerate(reasons):
+            if reason not in (VALID, EMPTY):
+                writer.writerow([first_row + offset, reason])
+    return counts
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Offline gazetteer: city/country names and centroids without network access.
+
+The editable source is scripts/data/gazetteer.tsv. It is compiled once into a
+binary index (scripts/data/gazetteer.idx) of flat arrays: coordinates,
+sorted normalized name keys with offsets into one UTF-8 blob, and per-record
+country/kind columns. Loading memory-maps that file and casts the sections to
+typed memoryviews, so opening it takes milliseconds and lookups are binary
+searches over the sorted keys. The index is rebuilt automatically when the TSV
+is newer.
+
+Usage: python scripts/gazetteer.py --build
+       python scripts/gazetteer.py "Tokyo" "Bunkyo City, Tokyo, Japan"
+"""
+
+import argparse
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import unicodedata
+from collections import namedtuple
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_SOURCE_PATH = SCRIPT_DIR / "data" / "gazetteer.tsv"
+DEFAULT_INDEX_PATH = SCRIPT_DIR / "data" / "gazetteer.idx"
+
+MAGIC = b"GZT1"
+_HEADER = struct.Struct("<4sIII")  # magic, n_names, n_records, blob_len
+KIND_CITY = 0
+KIND_COUNTRY = 1
+
+Place = namedtuple("Place", ["name", "country", "lat", "lng"])
+
+# US states, Canadian provinces/territories and Australian states: names and
+# postal abbreviations, as normalize_name keys. An address part that is one of
+# these is a region, never a city ("Lafayette, LA", "Albany, New York").
+REGIONS = frozenset([
+    "alabama", "al", "alaska", "ak", "arizona", "az", "arkansas", "ar", "california", "ca",
+    "colorado", "co", "connecticut", "ct", "delaware", "de", "florida", "fl", "georgia", "ga",
+    "hawaii", "hi", "idaho", "id", "illinois", "il", "indiana", "in", "iowa", "ia", "kansas", "ks",
+    "kentucky", "ky", "louisiana", "la", "maine", "me", "maryland", "md", "massachusetts", "ma",
+    "michigan", "mi", "minnesota", "mn", "mississippi", "ms", "missouri", "mo", "montana", "mt",
+    "nebraska", "ne", "nevada", "nv", "new hampshire", "nh", "new jersey", "nj", "new mexico", "nm",
+    "new york", "ny", "north carolina", "nc", "north dakota", "nd", "ohio", "oh", "oklahoma", "ok",
+    "oregon", "or", "pennsylvania", "pa", "rhode island", "ri", "south carolina", "sc",
+    "south dakota", "sd", "tennessee", "tn", "texas", "tx", "utah", "ut", "vermont", "vt",
+    "virginia", "va", "washington", "wa", "west virginia", "wv", "wisconsin", "wi", "wyoming", "wy",
+    "dc", "district of columbia", "puerto rico", "pr",
+    "alberta", "ab", "british columbia", "bc", "manitoba", "mb", "new brunswick", "nb",
+    "newfoundland", "newfoundland and labrador", "nl", "nova scotia", "ns", "ontario", "on",
+    "prince edward island", "pe", "pei", "quebec", "qc", "saskatchewan", "sk", "yukon", "yt",
+    "northwest territories", "nt", "nunavut", "nu",
+    "new south wales", "nsw", "victoria", "vic", "queensland", "qld", "south australia",
+    "western australia", "tasmania", "tas", "australian capital territory", "act", "northern territory",
+])
+
+_STRIP_RE = re.compile(r"[.'’]")
+_SEPARATOR_RE = re.compile(r"[^\w]+")
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase, drop accents and punctuation: 'St. Louis' -> 'st louis', 'Zürich' -> 'zurich'."""
+    text = unicodedata.normalize("NFKD", str(text or ""))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = _STRIP_RE.sub("", text)
+    return _SEPARATOR_RE.sub(" ", text).replace("_", " ").strip()
+
+
+def is_region(name: str) -> bool:
+    """True for a state/province name or abbreviation in REGIONS."""
+    return normalize_name(name) in REGIONS
+
+
+def _read_source(source_path) -> list:
+    """Parse the TSV into [(kind, name, country, lat, lng, aliases)]."""
+    records = []
+    with open(source_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            kind, name, country, lat, lng, aliases = (line.rstrip("\n").split("\t") + [""])[:6]
+            records.append((
+                KIND_COUNTRY if kind == "country" else KIND_CITY,
+                name,
+                country,
+                float(lat),
+                float(lng),
+                [a for a in aliases.split("|") if a],
+            ))
+    return records
+
+
+def build_index(source_path=DEFAULT_SOURCE_PATH, index_path=DEFAULT_INDEX_PATH) -> Path:
+    """Compile the TSV gazetteer into the binary index file."""
+    records = _read_source(source_path)
+    country_rec = {}
+    for i, (kind, name, *_rest) in enumerate(records):
+        if kind == KIND_COUNTRY:
+            country_rec[name] = i
+
+    names = []  # (key, record index); source order breaks ties so earlier rows win
+    for i, (_kind, name, _country, _lat, _lng, aliases) in enumerate(records):
+        for alias in dict.fromkeys([name] + aliases):
+            key = normalize_name(alias)
+            if key:
+                names.append((key, i))
+    names = sorted(set(names), key=lambda kv: (kv[0].encode("utf-8"), kv[1]))
+
+    blob = bytearray()
+    key_off = []
+    for key, _ in names:
+        key_off.append(len(blob))
+        blob += key.encode("utf-8")
+    key_off.append(len(blob))
+    disp_off = []
+    for rec in records:
+        disp_off.append(len(blob))
+        blob += rec[1].encode("utf-8")
+    disp_off.append(len(blob))
+
+    n_names, n_records = len(names), len(records)
+    missing = 0xFFFFFFFF
+    parts = [
+        _HEADER.pack(MAGIC, n_names, n_records, len(blob)),
+        struct.pack(f"<{n_records}d", *(r[3] for r in records)),
+        struct.pack(f"<{n_records}d", *(r[4] for r in records)),
+        struct.pack(f"<{n_names + 1}I", *key_off),
+        struct.pack(f"<{n_names}I", *(i for _, i in names)),
+        struct.pack(f"<{n_records + 1}I", *disp_off),
+        struct.pack(f"<{n_records}I", *(country_rec.get(r[2], missing) for r in records)),
+        struct.pack(f"<{n_records}I", *(r[0] for r in records)),
+        bytes(blob),
+    ]
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    # A private temp file per build, so concurrent builds (worker threads on a
+    # fresh checkout, parallel CI jobs) each replace the index atomically.
+    with tempfile.NamedTemporaryFile(dir=index_path.parent, prefix=index_path.name, suffix=".tmp", delete=False) as f:
+        f.write(b"".join(parts))
+    try:
+        os.replace(f.name, index_path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+    return index_path
+
+
+class Gazetteer:
+    """Read-only view over a compiled gazetteer index buffer."""
+
+    def __init__(self, buf):
+        view = memoryview(buf)
+        magic, n_names, n_records, blob_len = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("not a gazetteer index")
+        pos = _HEADER.size
+
+        def take(fmt, count, size):
+            nonlocal pos
+            section = view[pos:pos + count * size].cast(fmt)
+            pos += count * size
+            return section
+
+        self.lat = take("d", n_records, 8)
+        self.lng = take("d", n_records, 8)
+        self._key_off = take("I", n_names + 1, 4)
+        self._name_rec = take("I", n_names, 4)
+        self._disp_off = take("I", n_records + 1, 4)
+        self._country_rec = take("I", n_records, 4)
+        self._kind = take("I", n_records, 4)
+        self._blob = view[pos:pos + blob_len]
+        self._n_names = n_names
+        self._buf = buf
+
+    @classmethod
+    def load(cls, index_path=DEFAULT_INDEX_PATH, source_path=DEFAULT_SOURCE_PATH):
+        """Memory-map the index, (re)building it first if missing or older than the TSV."""
+        index_path, source_path = Path(index_path), Path(source_path)
+        if not index_path.exists() or (
+            source_path.exists() and source_path.stat().st_mtime > index_path.stat().st_mtime
+        ):
+            build_index(source_path, index_path)
+        with open(index_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buf)
+
+    def __len__(self) -> int:
+        return len(self._kind)
+
+    def _key(self, i: int) -> bytes:
+        return bytes(self._blob[self._key_off[i]:self._key_off[i + 1]])
+
+    def _records(self, name: str) -> list:
+        key = normalize_name(name).encode("utf-8")
+        if not key:
+            return []
+        lo, hi = 0, self._n_names
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        found = []
+        while lo < self._n_names and self._key(lo) == key:
+            found.append(self._name_rec[lo])
+            lo += 1
+        return found
+
+    def _display(self, rec: int) -> str:
+        return bytes(self._blob[self._disp_off[rec]:self._disp_off[rec + 1]]).decode("utf-8")
+
+    def _place(self, rec: int) -> Place:
+        country = self._country_rec[rec]
+        return Place(
+            self._display(rec),
+            self._display(country) if country != 0xFFFFFFFF else "",
+            self.lat[rec],
+            self.lng[rec],
+        )
+
+    def lookup_country(self, name: str) -> str | None:
+        """Canonical country name for a country name or alias ('USA' -> 'United States')."""
+        for rec in self._records(name):
+            if self._kind[rec] == KIND_COUNTRY:
+                return self._display(rec)
+        return None
+
+    def lookup_city(self, name: str, country: str | None = None) -> Place | None:
+        """City by name. With `country`, only cities in that country match; without it,
+        names shared by cities in different countries are treated as ambiguous (None).
+        One- and two-letter Latin names ("LA", "SF") never match: they are state codes
+        far more often than city nicknames."""
+        key = normalize_name(name)
+        if len(key) <= 2 and key.isascii():
+            return None
+        places = [self._place(rec) for rec in self._records(name) if self._kind[rec] == KIND_CITY]
+        if country:
+            places = [p for p in places if p.country == country]
+        if not places or len({p.country for p in places}) > 1:
+            return None
+        return places[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the offline gazetteer index")
+    parser.add_argument("--build", action="store_true", help="(Re)compile the index from the TSV source.")
+    parser.add_argument("names", nargs="*", help="City or country names to look up.")
+    args = parser.parse_args()
+    if args.build:
+        path = build_index()
+        print(f"Built {path} ({path.stat().st_size} bytes)")
+    gaz = Gazetteer.load()
+    for name in args.names:
+        print(f"{name!r}: country={gaz.lookup_country(name)!r} city={gaz.lookup_city(name)!r}")
+    if not args.build and not args.names:
+        parser.print_help(sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
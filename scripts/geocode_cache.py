@@ -0,0 +1,207 @@
+"""
+Persistent on-disk cache for Google Geocoding results (SQLite).
+
+Keys are the normalized query text plus the language parameter, so
+"1 Main St,  Boston" and "1 main st, boston" share an entry. Entries expire
+after a TTL and the table is capped at a maximum size with least-recently-used
+eviction. Only successful results are stored; errors are always retried.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+DEFAULT_CACHE_PATH = REPO_ROOT / ".gcp-credentials" / "geocode-cache.sqlite3"
+DEFAULT_TTL_DAYS = 90
+DEFAULT_MAX_ENTRIES = 20000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_COMMA_RE = re.compile(r"\s*,\s*")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace/comma spacing so equivalent queries share a key."""
+    text = _WHITESPACE_RE.sub(" ", str(query or "").strip().lower())
+    return _COMMA_RE.sub(", ", text).strip(" ,")
+
+
+class GeocodeCache:
+    """SQLite-backed geocode result cache with TTL expiry and LRU size cap."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=DEFAULT_TTL_DAYS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl_seconds = float(ttl_days) * 86400
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " query TEXT NOT NULL,"
+            " language TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (query, language))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS geocode_last_used ON geocode (last_used)")
+        self._conn.commit()
+
+    def get(self, query: str, language: str = "en", count: bool = True):
+        """Return (hit, result). Expired entries are dropped and count as misses.
+
+        count=False leaves hits/misses alone (lookups made for ReverseGeocodeMemo,
+        which keeps its own counters).
+        """
+        key = normalize_query(query)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, created_at FROM geocode WHERE query = ? AND language = ?",
+                (key, language),
+            ).fetchone()
+            if row is None:
+                self.misses += count
+                return False, None
+            result, created_at = row
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM geocode WHERE query = ? AND language = ?", (key, language))
+                self._conn.commit()
+                self.misses += count
+                return False, None
+            self._conn.execute(
+                "UPDATE geocode SET last_used = ? WHERE query = ? AND language = ?",
+                (now, key, language),
+            )
+            self._conn.commit()
+            self.hits += count
+        return True, json.loads(result)
+
+    def put(self, query: str, result, language: str = "en") -> None:
+        key = normalize_query(query)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode (query, language, result, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, language, json.dumps(result, separators=(",", ":")), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM geocode WHERE rowid IN (SELECT rowid FROM geocode ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self) -> int:
+        """Delete every entry. Returns the number of entries removed."""
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()
+            self._conn.execute("DELETE FROM geocode")
+            self._conn.commit()
+        return count
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()
+        return count
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = 100 * self.hits / total if total else 0.0
+        return f"Geocode cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate)"
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+DEFAULT_REVERSE_PRECISION = 6
+
+
+def geohash(lat: float, lng: float, precision: int = DEFAULT_REVERSE_PRECISION) -> str:
+    """Standard base-32 geohash; 5 chars is ~5 km, 6 chars ~1 km, 7 chars ~150 m."""
+    lat_lo, lat_hi, lng_lo, lng_hi = -90.0, 90.0, -180.0, 180.0
+    chars = []
+    bits = 0
+    n_bits = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            bit = lng >= mid
+            lng_lo, lng_hi = (mid, lng_hi) if bit else (lng_lo, mid)
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            bit = lat >= mid
+            lat_lo, lat_hi = (mid, lat_hi) if bit else (lat_lo, mid)
+        bits = (bits << 1) | bit
+        n_bits += 1
+        even = not even
+        if n_bits == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = n_bits = 0
+    return "".join(chars)
+
+
+class ReverseGeocodeMemo:
+    """Reverse-geocode results keyed by geohash-quantized coordinates.
+
+    Nearby providers (same building, same block) share one lookup. Results live
+    in memory for the run and, when a GeocodeCache is given, persist under a
+    "rev:<geohash>" key alongside forward results. Those lookups count toward
+    this memo's hits and misses only, not the cache's forward-query figures.
+    """
+
+    def __init__(self, precision: int = DEFAULT_REVERSE_PRECISION, cache=None):
+        self.precision = int(precision)
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def key(self, lat: float, lng: float) -> str:
+        return "rev:" + geohash(lat, lng, self.precision)
+
+    def get(self, lat: float, lng: float, language: str = "en"):
+        """Return (hit, result) for the cell containing (lat, lng)."""
+        key = (self.key(lat, lng), language)
+        with self._lock:
+            if key in self._memo:
+                self.hits += 1
+                return True, self._memo[key]
+        if self.cache is not None:
+            hit, result = self.cache.get(*key, count=False)
+            if hit:
+                with self._lock:
+                    self._memo[key] = result
+                    self.hits += 1
+                return True, result
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, lat: float, lng: float, result, language: str = "en") -> None:
+        key = self.key(lat, lng)
+        with self._lock:
+            self._memo[(key, language)] = result
+        if self.cache is not None and result:
+            self.cache.put(key, result, language)
+
+    def summary(self) -> str:
+        return f"Reverse geocode memo (geohash {self.precision}): {self.hits} hits, {self.misses} misses"
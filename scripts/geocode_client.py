@@ -0,0 +1,143 @@
+"""
+Google Geocoding API client with a pooled HTTP session and retry/backoff.
+
+One requests.Session is shared by every call (and every worker thread), so
+connections are kept alive instead of opening a new TLS connection per query.
+HTTP 5xx responses, connection errors and OVER_QUERY_LIMIT / UNKNOWN_ERROR
+statuses are retried with exponential backoff and jitter; each response status
+is counted for the run summary. Tests inject a fake by passing `session` or
+pointing `base_url` at a local server, or via set_default_client().
+"""
+
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+RETRYABLE_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 8.0
+DEFAULT_TIMEOUT = 10
+
+
+class GeocodingClient:
+    def __init__(
+        self,
+        base_url: str = GEOCODE_URL,
+        session=None,
+        pool_size: int = 10,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        timeout: float = DEFAULT_TIMEOUT,
+        sleep=time.sleep,
+    ):
+        self.base_url = base_url
+        self.pool_size = max(1, int(pool_size))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self._sleep = sleep
+        self._session = session
+        self._lock = threading.Lock()
+        self.status_counts = Counter()
+        self.retries = 0
+        self.backoff_seconds = 0.0
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+        return self._session
+
+    def _count(self, status: str) -> None:
+        with self._lock:
+            self.status_counts[status] += 1
+
+    def _backoff(self, attempt: int) -> None:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt)) * (0.5 + random.random() / 2)
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+        self._sleep(delay)
+
+    def request(self, params: dict) -> dict | None:
+        """GET the geocode endpoint. Returns the first result, or None when there is none."""
+        for attempt in range(self.max_retries + 1):
+            retry = attempt < self.max_retries
+            try:
+                r = self.session.get(self.base_url, params=params, timeout=self.timeout)
+                if r.status_code >= 400:
+                    self._count(f"HTTP_{r.status_code}")
+                    if r.status_code >= 500 and retry:
+                        self._backoff(attempt)
+                        continue
+                    print(f"  Geocode error: HTTP {r.status_code}", file=sys.stderr)
+                    return None
+                data = r.json()
+            except Exception as e:
+                self._count(type(e).__name__)
+                if retry and _is_transient(e):
+                    self._backoff(attempt)
+                    continue
+                print(f"  Geocode error: {type(e).__name__}", file=sys.stderr)
+                return None
+            status = data.get("status", "UNKNOWN")
+            self._count(status)
+            if status in RETRYABLE_STATUSES and retry:
+                self._backoff(attempt)
+                continue
+            if status == "OK" and data.get("results"):
+                return data["results"][0]
+            return None
+        return None
+
+    def geocode(self, address: str, api_key: str, language: str = "en") -> dict | None:
+        return self.request({"address": address, "key": api_key, "language": language})
+
+    def reverse_geocode(self, lat: float, lng: float, api_key: str, language: str = "en") -> dict | None:
+        return self.request({"latlng": f"{lat},{lng}", "key": api_key, "language": language})
+
+    def summary(self) -> str:
+        total = sum(self.status_counts.values())
+        if not total:
+            return "Geocoding API: no requests"
+        statuses = ", ".join(f"{status} {n}" for status, n in sorted(self.status_counts.items()))
+        return f"Geocoding API: {total} responses ({statuses}), {self.retries} retries"
+
+
+def _is_transient(exc: Exception) -> bool:
+    try:
+        import requests
+    except ImportError:
+        return False
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+_default_client = None
+
+
+def get_default_client() -> GeocodingClient:
+    global _default_client
+    if _default_client is None:
+        _default_client = GeocodingClient()
+    return _default_client
+
+
+def set_default_client(client: GeocodingClient | None) -> GeocodingClient | None:
+    """Swap the module-level client (e.g. a fake in tests) and return the previous one. None resets to a fresh default."""
+    global _default_client
+    previous, _default_client = _default_client, client
+    return previous
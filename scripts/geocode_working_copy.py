@@ -3,19 +3,57 @@
 Geocode records in the Working Copy tab using the Google Geocoding API.
 Replicates the logic from scripts/geocoding.gs.
 
-Default: only geocode rows missing Latitude/Longitude.
+Default: geocode rows missing Latitude/Longitude, plus rows whose
+work_institution/work_address changed since they were last geocoded (tracked by
+per-row input fingerprints in a sidecar file, see --fingerprints-path).
 --backfill-all-records: re-run geocoding on every record (overwrite existing).
-
-Usage: python scripts/geocode_working_copy.py [--backfill-all-records]
+Empty City values are inferred from coordinates via metro bounding boxes
+(scripts/metro_index.py).
+--fix-cities-only, or a missing API key, fills empty City/Country from the
+offline gazetteer (scripts/gazetteer.py) with no Geocoding API calls.
+The Working Copy is read through sheet_io.py, which reuses a local snapshot
+while the spreadsheet is unchanged (--no-snapshot to always fetch).
+Forward geocode results are cached on disk (see geocode_cache.py); use
+--no-cache to bypass or --clear-cache to start fresh.
+API calls share a token-bucket limiter (--qps); --concurrency N geocodes rows
+on N worker threads.
+--adaptive-attempt-order tries each row's queries in the order that has worked
+best this run (attempt_planner.py), trading some result quality for fewer calls.
+--metrics-out PATH writes per-stage timings and counters as JSON (see metrics.py).
+
+Usage: python scripts/geocode_working_copy.py [--backfill-all-records] [--no-cache] [--clear-cache]
+                                              [--concurrency N] [--qps RATE] [--no-fingerprints]
        (requires: pip install -r requirements.txt)
 """
 
 import argparse
+import functools
+import hashlib
+import hmac
+import json
+import operator
 import re
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from attempt_planner import AttemptPlanner, attempt_queries
+from gazetteer import Gazetteer, is_region
+from geocode_client import GEOCODE_URL, GeocodingClient, get_default_client, set_default_client
+from geocode_cache import (
+    DEFAULT_CACHE_PATH,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_REVERSE_PRECISION,
+    DEFAULT_TTL_DAYS,
+    GeocodeCache,
+    ReverseGeocodeMemo,
+    normalize_query,
+)
+from metrics import Metrics
+from metro_index import Metro, MetroIndex
+from rate_limit import TokenBucket
+from sheet_io import DEFAULT_SNAPSHOT_PATH, WORKING_COPY_RANGE, get_clients, read_ranges
+
 # Force line buffering so progress appears when run under conda run / non-TTY
 if hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(line_buffering=True)
@@ -26,6 +64,8 @@ REPO_ROOT = SCRIPT_DIR.parent
 CREDENTIALS_PATH = REPO_ROOT / ".gcp-credentials" / "genetics-map-sa-key.json"
 SHEET_ID_PATH = REPO_ROOT / ".gcp-credentials" / "sheet-id.txt"
 API_KEY_PATH = REPO_ROOT / ".gcp-credentials" / "geocoding-api-key.txt"
+FINGERPRINTS_PATH = REPO_ROOT / ".gcp-credentials" / "geocode-fingerprints.json"
+FINGERPRINTS_VERSION = 2
 
 # Canonical Working Copy header order (A:Y)
 HEADERS = [
@@ -40,7 +80,6 @@ HEADERS = [
     "address_street", "address_state", "address_zip",
     "signed_up_for_newsletter",
 ]
-SHEET_RANGE_A1 = "A:Y"
 
 # Column indices (0-based) per HEADERS
 WORK_INSTITUTION_COL = HEADERS.index("work_institution")
@@ -52,10 +91,12 @@ COUNTRY_COL = HEADERS.index("Country")
 ADDRESS_STREET_COL = HEADERS.index("address_street")
 ADDRESS_STATE_COL = HEADERS.index("address_state")
 ADDRESS_ZIP_COL = HEADERS.index("address_zip")
+# Columns that identify a provider row across runs (for input fingerprints)
+IDENTITY_COLS = tuple(HEADERS.index(h) for h in ("name_first", "name_last", "email"))
 
-# Rate limiting (seconds between API calls)
-DELAY_BETWEEN_ROWS = 0.25
-DELAY_BETWEEN_ATTEMPTS = 0.5
+# Rate limiting: Geocoding API requests per second across all workers
+DEFAULT_QPS = 10.0
+DEFAULT_CONCURRENCY = 1
 
 # Terms that indicate a string is NOT a valid city name
 REJECT_TERMS = [
@@ -71,22 +112,34 @@ REJECT_TERMS = [
     "northern", "southern", "upper", "lower",
     "ny", "ca", "tx", "fl", "il", "pa", "oh", "ga", "nc", "mi",  # State abbrevs
 ]
+# One precompiled alternation: same result as searching \bterm\b for each term
+_REJECT_RE = re.compile(r"\b(?:" + "|".join(re.escape(t) for t in sorted(REJECT_TERMS, key=len, reverse=True)) + r")\b")
+_DIGIT_RE = re.compile(r"\d")
+_POSTAL_RE = re.compile(r"\b\d{5}(-\d{4})?\b|\b[A-Z]\d[A-Z]\s?\d[A-Z]\d\b", re.I)
 # Expand state abbrevs / bad city values to proper city names
 CITY_ALIASES = {
     "ny": "New York City",
     "nyc": "New York City",
 }
 
-# Lat/lng bounds for NYC metro; when coords in range and city empty, use this
-NYC_BOUNDS = (40.5, 40.95, -74.25, -73.7)
+
+@functools.lru_cache(maxsize=1)
+def _gazetteer() -> Gazetteer:
+    return Gazetteer.load()
+
+
+@functools.lru_cache(maxsize=1)
+def _metro_index() -> MetroIndex:
+    return MetroIndex.load()
 
 
-def _coords_in_nyc(lat: float, lng: float) -> bool:
+def metro_for_coords(lat, lng) -> Metro | None:
+    """Metro whose bounding box (scripts/data/metro_bounds.tsv) contains the coordinates."""
     try:
         la, ln = float(lat), float(lng)
-        return NYC_BOUNDS[0] <= la <= NYC_BOUNDS[1] and NYC_BOUNDS[2] <= ln <= NYC_BOUNDS[3]
     except (ValueError, TypeError):
-        return False
+        return None
+    return _metro_index().lookup(la, ln)
 
 
 def is_empty_or_nan(value):
@@ -95,18 +148,15 @@ def is_empty_or_nan(value):
     return s in ("", "nan", "null", "undefined")
 
 
+@functools.lru_cache(maxsize=8192)
 def is_valid_city(city: str) -> bool:
     if not city or len(city) < 2 or len(city) > 50:
         return False
-    if re.match(r"^\d+$", city):
+    if _REJECT_RE.search(city.lower()):
         return False
-    lower = city.lower()
-    for term in REJECT_TERMS:
-        if re.search(r"\b" + re.escape(term) + r"\b", lower):
-            return False
-    if re.search(r"\d", city):
+    if _DIGIT_RE.search(city):
         return False
-    if re.search(r"\b\d{5}(-\d{4})?\b|\b[A-Z]\d[A-Z]\s?\d[A-Z]\d\b", city, re.I):
+    if _POSTAL_RE.search(city):
         return False
     return True
 
@@ -184,47 +234,56 @@ def geocode_address(address: str, api_key: str) -> dict | None:
     """Call Google Geocoding API. Returns first result or None."""
     if not address.strip():
         return None
-    import requests
+    return get_default_client().geocode(address, api_key, "en")
 
-    url = "https://maps.googleapis.com/maps/api/geocode/json"
-    params = {"address": address, "key": api_key, "language": "en"}
-    try:
-        r = requests.get(url, params=params, timeout=10)
-        r.raise_for_status()
-        data = r.json()
-        if data.get("status") == "OK" and data.get("results"):
-            return data["results"][0]
-    except Exception as e:
-        print(f"  Geocode error: {type(e).__name__}", file=sys.stderr)
-    return None
+
+def _geocode_query(query: str, api_key: str, cache=None, limiter=None) -> tuple[dict | None, bool]:
+    """Geocode via the cache when available. Returns (result, served_from_cache)."""
+    if cache is not None:
+        hit, cached = cache.get(query, "en")
+        if hit:
+            return cached, True
+    if limiter is not None:
+        limiter.acquire()
+    result = geocode_address(query, api_key)
+    if cache is not None and result:
+        cache.put(query, result, "en")
+    return result, False
 
 
 def reverse_geocode_language(lat: float, lng: float, api_key: str, language: str = "en") -> dict | None:
     """Reverse geocode lat,lng to get address components in specified language."""
-    import requests
-
-    url = "https://maps.googleapis.com/maps/api/geocode/json"
-    params = {"latlng": f"{lat},{lng}", "key": api_key, "language": language}
-    try:
-        r = requests.get(url, params=params, timeout=10)
-        r.raise_for_status()
-        data = r.json()
-        if data.get("status") == "OK" and data.get("results"):
-            return data["results"][0]
-    except Exception:
-        pass
-    return None
+    return get_default_client().reverse_geocode(lat, lng, api_key, language)
 
 
 def _city_has_non_ascii(s: str) -> bool:
     return any(ord(c) > 127 for c in s)
 
 
-def _resolve_city_to_english(city: str, lat: float, lng: float, api_key: str) -> str:
-    """If city has non-ASCII chars, reverse geocode to get English locality."""
+def _resolve_city_to_english(
+    city: str, lat: float, lng: float, api_key: str, limiter=None, reverse_memo=None
+) -> str:
+    """If city has non-ASCII chars, reverse geocode to get English locality.
+
+    Checked first, without an API call: native names in the gazetteer
+    (東京 -> Tokyo), native names listed for the metro containing the
+    coordinates, and reverse results memoized for the same geohash cell.
+    """
     if not city or not _city_has_non_ascii(city):
         return city
-    result = reverse_geocode_language(lat, lng, api_key, "en")
+    place = _gazetteer().lookup_city(city)
+    if place and not _city_has_non_ascii(place.name):
+        return place.name
+    metro = metro_for_coords(lat, lng)
+    if metro and city.strip().casefold() in metro.aliases:
+        return metro.city
+    hit, result = reverse_memo.get(lat, lng, "en") if reverse_memo is not None else (False, None)
+    if not hit:
+        if limiter is not None:
+            limiter.acquire()
+        result = reverse_geocode_language(lat, lng, api_key, "en")
+        if reverse_memo is not None:
+            reverse_memo.put(lat, lng, result, "en")
     if not result:
         return city
     for comp in result.get("address_components", []):
@@ -237,15 +296,21 @@ def _resolve_city_to_english(city: str, lat: float, lng: float, api_key: str) ->
     return city
 
 
-def smart_geocode(inst: str, addr: str, api_key: str) -> dict:
+def smart_geocode(
+    inst: str, addr: str, api_key: str, cache=None, limiter=None, reverse_memo=None, planner=None
+) -> dict:
+    """Best location from the institution + address, address and institution queries.
+
+    Stops at the first complete result. An adaptive AttemptPlanner may try
+    the queries in another order; scores credit the query kind, not the
+    position it was tried in.
+    """
     valid_inst = "" if is_empty_or_nan(inst) else str(inst).strip()
     valid_addr = "" if is_empty_or_nan(addr) else str(addr).strip()
-    attempts = [
-        ", ".join(filter(None, [valid_inst, valid_addr])),
-        valid_addr,
-        valid_inst,
-    ]
-    attempts = [a for a in attempts if a]
+    if planner is not None:
+        shape, attempts = planner.plan(valid_inst, valid_addr)
+    else:
+        shape, attempts = None, attempt_queries(valid_inst, valid_addr)
     best = {
         "lat": "",
         "lng": "",
@@ -256,10 +321,9 @@ def smart_geocode(inst: str, addr: str, api_key: str) -> dict:
         "zip": "",
     }
     best_score = 0.0
-    for i, query in enumerate(attempts):
-        if not query:
-            continue
-        result = geocode_address(query, api_key)
+    for n, (i, query) in enumerate(attempts):
+        result, _ = _geocode_query(query, api_key, cache, limiter)
+        complete = False
         if result:
             data = extract_location_data(result)
             score = 0.0
@@ -281,21 +345,25 @@ def smart_geocode(inst: str, addr: str, api_key: str) -> dict:
             if score > best_score:
                 best = data.copy()
                 best_score = score
-            if is_complete_data(data):
+            complete = is_complete_data(data)
+            if complete:
                 best = data.copy()
-                break
-        time.sleep(DELAY_BETWEEN_ATTEMPTS)
+        if planner is not None:
+            planner.record(shape, i, complete, first=n == 0)
+        if complete:
+            break
     if best["lat"] and best["lng"] and not best["city"] and valid_addr:
         extracted = extract_city_from_address(valid_addr)
         if extracted:
             best["city"] = CITY_ALIASES.get(extracted.lower().strip(), extracted)
     if best["lat"] and best["lng"] and not best["city"]:
-        if _coords_in_nyc(best["lat"], best["lng"]):
-            best["city"] = "New York City"
+        metro = metro_for_coords(best["lat"], best["lng"])
+        if metro:
+            best["city"] = metro.city
     if best["city"] and _city_has_non_ascii(best["city"]) and best["lat"] and best["lng"]:
         try:
             lat_f, lng_f = float(best["lat"]), float(best["lng"])
-            best["city"] = _resolve_city_to_english(best["city"], lat_f, lng_f, api_key)
+            best["city"] = _resolve_city_to_english(best["city"], lat_f, lng_f, api_key, limiter, reverse_memo)
         except (ValueError, TypeError):
             pass
     if best["city"]:
@@ -303,32 +371,111 @@ def smart_geocode(inst: str, addr: str, api_key: str) -> dict:
     return best
 
 
+def project_rows(rows: list) -> list:
+    """Working Copy data rows (rows[1:]) as new fixed-width lists in HEADERS order.
+
+    The column projection is worked out once from the header row. With the
+    canonical header each row is only padded to len(HEADERS) (the API drops
+    trailing empty cells); any other layout is remapped by one itemgetter call
+    per row, with missing columns read from a blank pad cell. Every later step
+    indexes rows by the *_COL constants without length checks.
+    """
+    header, data = rows[0], rows[1:]
+    width = len(HEADERS)
+    source_idx = {str(h).strip(): i for i, h in enumerate(header)}
+    if all(source_idx.get(h) == i for i, h in enumerate(HEADERS)):
+        return [row[:width] + [""] * (width - len(row)) for row in data]
+    pad = len(header)
+    pick = operator.itemgetter(*[source_idx.get(h, pad) for h in HEADERS])
+    blank = [""] * (pad + 1)
+    return [list(pick(row[:pad] + blank[min(len(row), pad):])) for row in data]
+
+
 def normalize_cities(data_rows: list) -> int:
-    """Apply CITY_ALIASES and NYC_BOUNDS to all rows. Returns count of rows changed."""
+    """Apply CITY_ALIASES, and fill empty City from the metro box containing lat/lng.
+
+    Returns count of rows changed.
+    """
     changed = 0
     for row in data_rows:
-        while len(row) <= CITY_COL:
-            row.append("")
-        city = row[CITY_COL].strip() if len(row) > CITY_COL else ""
-        lat = row[LAT_COL] if len(row) > LAT_COL else ""
-        lng = row[LNG_COL] if len(row) > LNG_COL else ""
+        city = row[CITY_COL].strip()
+        lat = row[LAT_COL]
+        lng = row[LNG_COL]
         if city:
             fixed = CITY_ALIASES.get(city.lower().strip(), city)
             if fixed != city:
                 row[CITY_COL] = fixed
                 changed += 1
-        elif lat and lng and _coords_in_nyc(lat, lng):
-            row[CITY_COL] = "New York City"
-            changed += 1
+        elif lat and lng:
+            metro = metro_for_coords(lat, lng)
+            if metro:
+                row[CITY_COL] = metro.city
+                changed += 1
+    return changed
+
+
+_TOKEN_WITH_DIGIT_RE = re.compile(r"\S*\d\S*")
+
+
+def offline_locate(address: str, gazetteer) -> dict:
+    """City/Country for a free-text address from the local gazetteer (no network).
+
+    Comma parts are read with postcode-like tokens removed ('Tokyo 113-8655' ->
+    'Tokyo'). The country is the rightmost part naming one. Before it, pure
+    postcodes and one state/province part ('LA 70508', 'Quebec') are skipped;
+    the part left of them is tried first, then the remaining parts from the
+    right. State and province names never match as cities.
+    """
+    found = {"city": "", "country": ""}
+    if not address or is_empty_or_nan(address):
+        return found
+    parts = [p.strip() for p in str(address).replace("\n", ",").split(",") if p.strip()]
+    stripped = [_TOKEN_WITH_DIGIT_RE.sub(" ", p).strip() for p in parts]
+    end = len(stripped)
+    for i in range(len(stripped) - 1, -1, -1):
+        country = gazetteer.lookup_country(stripped[i])
+        if country:
+            found["country"] = country
+            end = i
+            break
+    while end and not stripped[end - 1]:
+        end -= 1
+    if end and is_region(stripped[end - 1]):
+        end -= 1
+    candidates = stripped[end - 1:end] + [p for p in reversed(stripped[:end - 1]) if not is_region(p)] if end else []
+    for candidate in candidates:
+        if not candidate:
+            continue
+        place = gazetteer.lookup_city(candidate, found["country"] or None)
+        if place:
+            found["city"] = place.name
+            found["country"] = found["country"] or place.country
+            break
+    return found
+
+
+def fill_locations_offline(data_rows: list, gazetteer) -> int:
+    """Fill empty City/Country cells from work_address via the gazetteer. Returns rows changed."""
+    changed = 0
+    for row in data_rows:
+        if row[CITY_COL].strip() and row[COUNTRY_COL].strip():
+            continue
+        found = offline_locate(row[WORK_ADDRESS_COL], gazetteer)
+        row_changed = False
+        if not row[CITY_COL].strip() and found["city"]:
+            row[CITY_COL] = found["city"]
+            row_changed = True
+        if not row[COUNTRY_COL].strip() and found["country"]:
+            row[COUNTRY_COL] = found["country"]
+            row_changed = True
+        changed += row_changed
     return changed
 
 
 def _has_geocoding(row: list) -> bool:
     """True if row already has valid lat and lng."""
-    while len(row) <= max(LAT_COL, LNG_COL):
-        row.append("")
-    lat = row[LAT_COL] if len(row) > LAT_COL else ""
-    lng = row[LNG_COL] if len(row) > LNG_COL else ""
+    lat = row[LAT_COL]
+    lng = row[LNG_COL]
     if is_empty_or_nan(lat) or is_empty_or_nan(lng):
         return False
     try:
@@ -341,15 +488,96 @@ def _has_geocoding(row: list) -> bool:
 
 def _has_address_components(row: list) -> bool:
     """True if any structured address field (street/state/zip) is populated."""
-    while len(row) <= ADDRESS_ZIP_COL:
-        row.append("")
     for col in (ADDRESS_STREET_COL, ADDRESS_STATE_COL, ADDRESS_ZIP_COL):
-        v = row[col] if len(row) > col else ""
-        if not is_empty_or_nan(v):
+        if not is_empty_or_nan(row[col]):
             return True
     return False
 
 
+def fingerprint_key(credentials_path) -> bytes:
+    """HMAC key for the fingerprint sidecar, derived from the service-account key file.
+
+    The sidecar travels through the Actions cache, so its hashes must not be
+    reversible by anyone who can read it without the repository's secrets.
+    """
+    return hashlib.sha256(b"geocode-fingerprints\0" + Path(credentials_path).read_bytes()).digest()
+
+
+def _digest(parts, key: bytes) -> str:
+    return hmac.new(key, "\x1f".join(parts).encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+
+
+def _key_id(key: bytes) -> str:
+    return _digest(["key-id"], key)[:16]
+
+
+def input_fingerprint(inst: str, addr: str, key: bytes) -> str:
+    """Keyed hash of the normalized geocoding inputs (no plaintext address is stored)."""
+    return _digest(_query_key(inst, addr), key)
+
+
+def row_identities(data_rows: list, key: bytes) -> list:
+    """Stable per-row keys (keyed hashes of name/email); repeated identities get an occurrence suffix."""
+    seen = {}
+    identities = []
+    for row in data_rows:
+        parts = [normalize_query(row[c]) for c in IDENTITY_COLS]
+        base = _digest(parts, key)
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        identities.append(f"{base}#{n}" if n else base)
+    return identities
+
+
+def load_fingerprints(path, key: bytes) -> dict | None:
+    """Return {row identity: input fingerprint}, or None when no sidecar was recorded under `key`."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        print("Warning: unreadable fingerprint file; treating as missing.", file=sys.stderr)
+        return None
+    if data.get("version") != FINGERPRINTS_VERSION or data.get("key_id") != _key_id(key):
+        print("Fingerprint file was recorded with another key; treating as missing.", file=sys.stderr)
+        return None
+    return dict(data.get("rows", {}))
+
+
+def save_fingerprints(path, data_rows: list, identities: list, key: bytes) -> int:
+    """Record input fingerprints for every row that currently has coordinates."""
+    rows = {
+        identity: input_fingerprint(row[WORK_INSTITUTION_COL], row[WORK_ADDRESS_COL], key)
+        for identity, row in zip(identities, data_rows)
+        if _has_geocoding(row)
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": FINGERPRINTS_VERSION, "key_id": _key_id(key), "rows": rows}
+    path.write_text(json.dumps(data, sort_keys=True, separators=(",", ":")))
+    return len(rows)
+
+
+def select_rows_to_geocode(data_rows: list, backfill_all: bool, fingerprints=None, identities=None, key: bytes = b""):
+    """Return (row indices to geocode, count selected only because their inputs changed)."""
+    to_process = []
+    changed = 0
+    for i, row in enumerate(data_rows):
+        if is_empty_or_nan(row[WORK_INSTITUTION_COL]) and is_empty_or_nan(row[WORK_ADDRESS_COL]):
+            continue
+        if backfill_all or not _has_geocoding(row) or not _has_address_components(row):
+            to_process.append(i)
+            continue
+        if fingerprints is None:
+            continue
+        known = fingerprints.get(identities[i])
+        if known is not None and known != input_fingerprint(row[WORK_INSTITUTION_COL], row[WORK_ADDRESS_COL], key):
+            to_process.append(i)
+            changed += 1
+    return to_process, changed
+
+
 def format_geocode_log_summary(geo: dict) -> str:
     """Return a non-PII summary suitable for public CI logs."""
     if not geo:
@@ -370,6 +598,154 @@ def format_geocode_log_summary(geo: dict) -> str:
     return "updated " + ", ".join(updated)
 
 
+def _column_name(index: int) -> str:
+    """0-based column index -> A1 column letters (0 -> A, 25 -> Z, 26 -> AA)."""
+    n = index + 1
+    name = ""
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+
+def changed_ranges(original_rows: list, data_rows: list, sheet: str = "Working Copy", first_row: int = 2) -> list:
+    """Diff data rows against the values read from the sheet.
+
+    Returns batchUpdate `data` entries covering only changed cells: adjacent
+    changed cells in a row become one run, and identical column runs on
+    consecutive rows are merged into one rectangular range.
+    """
+    runs = []  # (row_offset, first_col, last_col)
+    for r, row in enumerate(data_rows):
+        original = original_rows[r] if r < len(original_rows) else []
+        start = None
+        for c in range(len(row) + 1):
+            changed = c < len(row) and str(row[c]) != str(original[c] if c < len(original) else "")
+            if changed and start is None:
+                start = c
+            elif not changed and start is not None:
+                runs.append((r, start, c - 1))
+                start = None
+
+    blocks = []  # [first_row_offset, last_row_offset, first_col, last_col]
+    for r, c0, c1 in runs:
+        last = blocks[-1] if blocks else None
+        if last and last[1] == r - 1 and last[2] == c0 and last[3] == c1:
+            last[1] = r
+        else:
+            blocks.append([r, r, c0, c1])
+
+    return [
+        {
+            "range": f"'{sheet}'!{_column_name(c0)}{first_row + r0}:{_column_name(c1)}{first_row + r1}",
+            "values": [[str(v) for v in data_rows[r][c0:c1 + 1]] for r in range(r0, r1 + 1)],
+        }
+        for r0, r1, c0, c1 in blocks
+    ]
+
+
+def write_working_copy(sheets, spreadsheet_id: str, rows: list, data_rows: list) -> int:
+    """Persist data_rows, sending only changed cells. Returns the number of cells written."""
+    source_header = [str(h).strip() for h in rows[0]]
+    if source_header[:len(HEADERS)] != HEADERS:
+        # Non-canonical layout: rewrite the whole tab in HEADERS order (header + data)
+        out_rows = [HEADERS[:]] + data_rows
+        print("Writing to Working Copy (full rewrite: header layout differs)...", flush=True)
+        sheets.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id,
+            range="'Working Copy'!A1:Y",
+            valueInputOption="RAW",
+            body={"values": out_rows},
+        ).execute()
+        return len(out_rows) * len(HEADERS)
+
+    updates = changed_ranges(rows[1:], data_rows)
+    if not updates:
+        print("No cell changes to write to Working Copy.", flush=True)
+        return 0
+    n_cells = sum(len(u["values"]) * len(u["values"][0]) for u in updates)
+    print(f"Writing {n_cells} changed cells in {len(updates)} ranges to Working Copy...", flush=True)
+    sheets.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={"valueInputOption": "RAW", "data": updates},
+    ).execute()
+    return n_cells
+
+
+def _progress_line(done: int, total: int, bar_width: int = 30) -> str:
+    pct = 100 * done / total if total else 0
+    filled = int(bar_width * done / total) if total else 0
+    bar = "=" * filled + "-" * (bar_width - filled)
+    return f"[{bar}] {pct:5.1f}% ({done}/{total})"
+
+
+class _CallCounter:
+    """Counts API requests made for one lookup while delegating to the shared limiter."""
+
+    def __init__(self, limiter=None):
+        self.limiter = limiter
+        self.calls = 0
+
+    def acquire(self) -> float:
+        self.calls += 1
+        return self.limiter.acquire() if self.limiter is not None else 0.0
+
+
+def _query_key(inst: str, addr: str) -> tuple[str, str]:
+    return (
+        "" if is_empty_or_nan(inst) else normalize_query(inst),
+        "" if is_empty_or_nan(addr) else normalize_query(addr),
+    )
+
+
+def plan_unique_queries(jobs: list) -> list:
+    """Group (row_index, inst, addr) jobs by normalized (inst, addr).
+
+    Returns [(inst, addr, [row_index, ...]), ...] in first-seen order, so each
+    distinct institution/address pair is geocoded once and fanned out.
+    """
+    groups = {}
+    for i, inst, addr in jobs:
+        key = _query_key(inst, addr)
+        if key not in groups:
+            groups[key] = (inst, addr, [])
+        groups[key][2].append(i)
+    return list(groups.values())
+
+
+def geocode_rows(
+    jobs: list,
+    api_key: str,
+    cache=None,
+    limiter=None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    reverse_memo=None,
+    planner=None,
+):
+    """Geocode (inst, addr) pairs on a bounded worker pool.
+
+    Yields (result, api_calls) in input order.
+    """
+
+    def run(job):
+        counter = _CallCounter(limiter)
+        geo = smart_geocode(job[0], job[1], api_key, cache, counter, reverse_memo, planner)
+        return geo, counter.calls
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        yield from pool.map(run, jobs)
+
+
+def _apply_geocode(row: list, geo: dict) -> None:
+    row[LAT_COL] = str(geo["lat"]) if geo["lat"] else ""
+    row[LNG_COL] = str(geo["lng"]) if geo["lng"] else ""
+    row[CITY_COL] = geo["city"]
+    row[COUNTRY_COL] = geo["country"]
+    row[ADDRESS_STREET_COL] = geo.get("street", "")
+    row[ADDRESS_STATE_COL] = geo.get("state", "")
+    row[ADDRESS_ZIP_COL] = geo.get("zip", "")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Geocode Working Copy records via Google Geocoding API")
     parser.add_argument(
@@ -380,10 +756,68 @@ def main():
     parser.add_argument(
         "--fix-cities-only",
         action="store_true",
-        help="Only apply city alias lookup (NY→New York City, etc.) and NYC coords fallback. No geocoding.",
+        help=(
+            "Only apply city alias lookup (NY→New York City, etc.), metro coords fallback and the offline "
+            "gazetteer for empty City/Country. No Geocoding API calls."
+        ),
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk geocode cache.")
+    parser.add_argument("--clear-cache", action="store_true", help="Empty the on-disk geocode cache before running.")
+    parser.add_argument("--cache-path", default=str(DEFAULT_CACHE_PATH), help="SQLite geocode cache location.")
+    parser.add_argument("--cache-ttl-days", type=float, default=DEFAULT_TTL_DAYS, help="Expire cached results after N days.")
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help="Evict least-recently-used entries beyond this size.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Number of rows to geocode in parallel (all workers share the --qps limit).",
+    )
+    parser.add_argument("--qps", type=float, default=DEFAULT_QPS, help="Maximum Geocoding API requests per second.")
+    parser.add_argument(
+        "--reverse-precision",
+        type=int,
+        default=DEFAULT_REVERSE_PRECISION,
+        help="Geohash length used to share reverse-geocode results between nearby coordinates (6 ≈ 1 km).",
+    )
+    parser.add_argument(
+        "--fingerprints-path",
+        default=str(FINGERPRINTS_PATH),
+        help="Sidecar file of per-row input fingerprints used to detect edited addresses.",
+    )
+    parser.add_argument(
+        "--no-fingerprints",
+        action="store_true",
+        help="Ignore and do not update input fingerprints (only fill missing data).",
+    )
+    parser.add_argument(
+        "--adaptive-attempt-order",
+        action="store_true",
+        help="Try the query kind most often complete earlier in the run first (fewer calls; a row may keep "
+        "the address result where institution+address was also complete).",
+    )
+    parser.add_argument(
+        "--snapshot-path",
+        default=str(DEFAULT_SNAPSHOT_PATH),
+        help="Local sheet snapshot shared with clean_and_validate.py (reused while the sheet is unchanged).",
+    )
+    parser.add_argument("--no-snapshot", action="store_true", help="Always read the Working Copy from the API.")
+    parser.add_argument(
+        "--metrics-out",
+        metavar="PATH",
+        help="Write per-stage timings and counters as JSON (no addresses or other provider data).",
     )
     args = parser.parse_args()
-    backfill_all = args.backfill_all_records
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.qps <= 0:
+        parser.error("--qps must be positive")
+    if not 1 <= args.reverse_precision <= 12:
+        parser.error("--reverse-precision must be between 1 and 12")
     fix_cities_only = args.fix_cities_only
 
     if not CREDENTIALS_PATH.exists():
@@ -393,125 +827,174 @@ def main():
         print("Error: Sheet ID not found at", SHEET_ID_PATH, file=sys.stderr)
         sys.exit(1)
     if not fix_cities_only and not API_KEY_PATH.exists():
-        print("Skipping geocoding (no API key at", API_KEY_PATH, ")", file=sys.stderr)
-        return
+        print("No API key at", API_KEY_PATH, "- filling City/Country offline only.", file=sys.stderr)
+        fix_cities_only = True
     api_key = API_KEY_PATH.read_text().strip() if not fix_cities_only else ""
     spreadsheet_id = SHEET_ID_PATH.read_text().strip()
 
-    from google.oauth2 import service_account
-    from googleapiclient.discovery import build
+    metrics = Metrics("geocode_working_copy")
+    # An injected client (tests, load test) is used as is; otherwise build one sized to the worker pool
+    previous_client = set_default_client(None)
+    set_default_client(previous_client or GeocodingClient(base_url=GEOCODE_URL, pool_size=args.concurrency))
+    try:
+        _run(args, spreadsheet_id, api_key, fix_cities_only, metrics)
+    finally:
+        set_default_client(previous_client)
+        if args.metrics_out:
+            metrics.write(args.metrics_out)
 
-    creds = service_account.Credentials.from_service_account_file(
-        str(CREDENTIALS_PATH),
-        scopes=["https://www.googleapis.com/auth/spreadsheets"],
-    )
-    sheets = build("sheets", "v4", credentials=creds)
+
+def _run(args, spreadsheet_id: str, api_key: str, fix_cities_only: bool, metrics: Metrics) -> None:
+    backfill_all = args.backfill_all_records
+    with metrics.stage("connect"):
+        sheets, drive = get_clients(CREDENTIALS_PATH)
 
     print("Reading Working Copy...", flush=True)
-    result = sheets.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id,
-        range=f"'Working Copy'!{SHEET_RANGE_A1}",
-    ).execute()
-    rows = result.get("values", [])
+    snapshot_path = None if args.no_snapshot else args.snapshot_path
+    with metrics.stage("read"):
+        ranges, from_snapshot = read_ranges(sheets, spreadsheet_id, [WORKING_COPY_RANGE], drive, snapshot_path)
+    metrics.count("snapshot_hits" if from_snapshot else "snapshot_misses")
+    if from_snapshot:
+        print("  (unchanged since the last read; using the local sheet snapshot)", flush=True)
+    rows = ranges[WORKING_COPY_RANGE]
     if len(rows) < 2:
         print("No data rows in Working Copy.")
         return
 
-    source_header = rows[0]
-    source_idx = {str(h).strip(): i for i, h in enumerate(source_header)}
-    header = HEADERS[:]
-    data_rows = []
-    for raw_row in rows[1:]:
-        remapped = [raw_row[source_idx[h]] if h in source_idx and source_idx[h] < len(raw_row) else "" for h in HEADERS]
-        data_rows.append(remapped)
-    n_cols = len(HEADERS)
+    data_rows = project_rows(rows)
+    metrics.count("rows", len(data_rows))
 
     if fix_cities_only:
-        print("Applying city alias lookup and NYC fallback...", flush=True)
-        changed = normalize_cities(data_rows)
-        out_rows = [header] + data_rows
-        for row in out_rows:
-            while len(row) < n_cols:
-                row.append("")
-        print("Writing to Working Copy...", flush=True)
-        sheets.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range="'Working Copy'!A1:Y",
-            valueInputOption="RAW",
-            body={"values": out_rows},
-        ).execute()
-        print(f"Done. Fixed {changed} city values.", flush=True)
+        print("Applying city alias lookup, metro coords fallback and offline gazetteer...", flush=True)
+        with metrics.stage("normalize_cities"):
+            changed = normalize_cities(data_rows)
+        with metrics.stage("offline_fill"):
+            filled = fill_locations_offline(data_rows, _gazetteer())
+        with metrics.stage("write"):
+            cells = write_working_copy(sheets, spreadsheet_id, rows, data_rows)
+        metrics.count("cities_fixed", changed)
+        metrics.count("rows_filled_offline", filled)
+        metrics.count("cells_written", cells)
+        print(f"Done. Fixed {changed} city values; filled City/Country offline for {filled} rows.", flush=True)
         return
 
     # Determine which rows to process
-    to_process = []
-    for i, row in enumerate(data_rows):
-        if is_empty_or_nan(row[WORK_INSTITUTION_COL]) and is_empty_or_nan(row[WORK_ADDRESS_COL]):
-            continue
-        if backfill_all or not _has_geocoding(row) or not _has_address_components(row):
-            to_process.append(i)
+    key = fingerprint_key(CREDENTIALS_PATH)
+    identities = row_identities(data_rows, key)
+    fingerprints = None
+    if not args.no_fingerprints:
+        fingerprints = load_fingerprints(args.fingerprints_path, key)
+        if fingerprints is None:
+            print("No input fingerprints yet; recording current rows as the baseline.", flush=True)
+    to_process, changed_inputs = select_rows_to_geocode(data_rows, backfill_all, fingerprints, identities, key)
+    metrics.count("rows_to_process", len(to_process))
+    metrics.count("rows_changed_inputs", changed_inputs)
 
     if not to_process:
         print(
-            "No rows need geocoding. (All have lat/lng and structured address; "
+            "No rows need geocoding. (All have lat/lng, structured address and unchanged inputs; "
             "use --backfill-all-records to re-run.)"
         )
+        if not args.no_fingerprints and fingerprints is None:
+            save_fingerprints(args.fingerprints_path, data_rows, identities, key)
         return
 
-    mode = "backfill (all records)" if backfill_all else "fill missing only"
-    print(f"Geocoding {len(to_process)} rows [{mode}]...", flush=True)
+    cache = None
+    if not args.no_cache:
+        cache = GeocodeCache(args.cache_path, ttl_days=args.cache_ttl_days, max_entries=args.cache_max_entries)
+        if args.clear_cache:
+            print(f"Cleared {cache.clear()} cached geocode results.", flush=True)
+
+    limiter = TokenBucket(args.qps, burst=max(1, args.concurrency))
+    client = get_default_client()
+    reverse_memo = ReverseGeocodeMemo(args.reverse_precision, cache)
+    planner = AttemptPlanner(adaptive=args.adaptive_attempt_order)
+    if backfill_all:
+        mode = "backfill (all records)"
+    elif changed_inputs:
+        mode = f"fill missing + {changed_inputs} rows with changed address inputs"
+    else:
+        mode = "fill missing only"
     processed = 0
     skipped = 0
-    total = len(to_process)
-
-    bar_width = 30
-    for idx, i in enumerate(to_process):
+    jobs = []
+    for i in to_process:
         row = data_rows[i]
-        while len(row) <= COUNTRY_COL:
-            row.append("")
-        while len(row) <= ADDRESS_ZIP_COL:
-            row.append("")
-        inst = row[WORK_INSTITUTION_COL] if len(row) > WORK_INSTITUTION_COL else ""
-        addr = row[WORK_ADDRESS_COL] if len(row) > WORK_ADDRESS_COL else ""
+        inst = row[WORK_INSTITUTION_COL]
+        addr = row[WORK_ADDRESS_COL]
         if is_empty_or_nan(inst) and is_empty_or_nan(addr):
             skipped += 1
             continue
+        jobs.append((i, inst, addr))
+    total = len(jobs)
+    groups = plan_unique_queries(jobs)
+    print(
+        f"Geocoding {total} rows as {len(groups)} unique queries "
+        f"[{mode}, concurrency {args.concurrency}, {args.qps:g} req/s]...",
+        flush=True,
+    )
 
-        pct = 100 * (idx + 1) / total if total else 0
-        filled = int(bar_width * (idx + 1) / total) if total else 0
-        bar = "=" * filled + "-" * (bar_width - filled)
-        progress = f"[{bar}] {pct:5.1f}% ({idx + 1}/{total})"
-        print(f"  {progress} Row {i + 2}...", end=" ", flush=True)
-        geo = smart_geocode(inst, addr, api_key)
-        row[LAT_COL] = str(geo["lat"]) if geo["lat"] else ""
-        row[LNG_COL] = str(geo["lng"]) if geo["lng"] else ""
-        row[CITY_COL] = geo["city"]
-        row[COUNTRY_COL] = geo["country"]
-        row[ADDRESS_STREET_COL] = geo.get("street", "")
-        row[ADDRESS_STATE_COL] = geo.get("state", "")
-        row[ADDRESS_ZIP_COL] = geo.get("zip", "")
-        processed += 1
-        print(format_geocode_log_summary(geo), flush=True)
-        time.sleep(DELAY_BETWEEN_ROWS)
+    metrics.count("unique_queries", len(groups))
+    results = geocode_rows(
+        [(inst, addr) for inst, addr, _ in groups],
+        api_key,
+        cache=cache,
+        limiter=limiter,
+        concurrency=args.concurrency,
+        reverse_memo=reverse_memo,
+        planner=planner,
+    )
+    api_calls = 0
+    saved_calls = 0
+    with metrics.stage("geocode"):
+        for (_, _, row_ids), (geo, calls) in zip(groups, results):
+            for i in row_ids:
+                _apply_geocode(data_rows[i], geo)
+            processed += len(row_ids)
+            api_calls += calls
+            saved_calls += calls * (len(row_ids) - 1)
+            label = f"Row {row_ids[0] + 2}"
+            if len(row_ids) > 1:
+                label += f" (+{len(row_ids) - 1} rows with same address)"
+            print(f"  {_progress_line(processed, total)} {label}... {format_geocode_log_summary(geo)}", flush=True)
 
     # Apply city fixes to ALL rows before persist (handles stale "NY" etc. even when not re-geocoded)
-    normalize_cities(data_rows)
-
-    # Persist: write entire sheet back (header + data)
-    out_rows = [header] + data_rows
-    # Pad rows to same length
-    for row in out_rows:
-        while len(row) < n_cols:
-            row.append("")
-
-    print("Writing to Working Copy...")
-    sheets.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id,
-        range="'Working Copy'!A1:Y",
-        valueInputOption="RAW",
-        body={"values": out_rows},
-    ).execute()
+    with metrics.stage("normalize_cities"):
+        metrics.count("cities_fixed", normalize_cities(data_rows))
+
+    # Persist: only the cells that changed (full rewrite if the header layout is not canonical)
+    with metrics.stage("write"):
+        metrics.count("cells_written", write_working_copy(sheets, spreadsheet_id, rows, data_rows))
+    if not args.no_fingerprints:
+        with metrics.stage("fingerprints"):
+            save_fingerprints(args.fingerprints_path, data_rows, identities, key)
+    metrics.count("rows_geocoded", processed)
+    metrics.count("rows_skipped", skipped)
+    metrics.count("api_calls", api_calls)
+    metrics.count("api_calls_saved", saved_calls)
+    metrics.count_all("attempts", planner.counts())
+    metrics.count_all("api_status", client.status_counts)
+    metrics.count("api_retries", client.retries)
+    metrics.add_time("geocode.backoff_sleep", client.backoff_seconds)
+    metrics.add_time("geocode.rate_limit_wait", limiter.waited)
+    metrics.count("reverse_memo_hits", reverse_memo.hits)
+    metrics.count("reverse_memo_misses", reverse_memo.misses)
+    if cache is not None:
+        metrics.count("cache_hits", cache.hits)
+        metrics.count("cache_misses", cache.misses)
     print(f"Done. Geocoded {processed} rows, skipped {skipped} empty rows.")
+    print(
+        f"Dedup: {total - len(groups)} duplicate rows reused a shared lookup; "
+        f"{api_calls} API calls made, {saved_calls} saved."
+    )
+    if processed:
+        print(f"API calls per geocoded row: {api_calls / processed:.2f} ({api_calls / len(groups):.2f} per unique query)")
+    print(planner.summary())
+    print(client.summary())
+    print(reverse_memo.summary())
+    if cache is not None:
+        print(cache.summary())
+        cache.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+"""
+Language cell parsing: one shared scan yields the language list and interpreter use.
+
+scan_languages() returns the cleaned, deduplicated and sorted language list
+("English, Spanish") and whether the cell mentions interpreter services. All
+patterns are compiled once. Scans are memoized per cell text, so interpreter
+inference and language cleaning in clean_and_validate scan each distinct value
+once instead of twice.
+"""
+
+import functools
+import re
+from collections import namedtuple
+
+INTERPRETER_PATTERNS = [
+    r"interpret(er|ation)( services| present| available)?",
+    r"with use of", r"with provided interpreter",
+    r"others? with (provided )?interpreter( services)?",
+    r"all other languages with interpretation services",
+    r"we also use interpreters?", r"globo interpreter",
+    r"translation", r"interpreter present",
+    r"other languages with an interpreter present",
+]
+
+LANG_IGNORE = {
+    "other", "others", "interpreter", "interpreter present",
+    "interpretation", "translation", "services", "provided",
+    "available", "languages", "with", "an", "present", "some",
+}
+
+# Matched against the lowercased cell, before anything is removed
+_INTERPRETER_RE = re.compile("|".join(f"(?:{p})" for p in INTERPRETER_PATTERNS))
+_PARENS_RE = re.compile(r"\([^)]*\)")
+_PREFER_NOT_RE = re.compile(r"prefer not to say", re.IGNORECASE)
+_SERVICE_PHRASE_RE = re.compile(
+    r"all other languages with interpretation services|others? with (?:provided )?interpreter(?: services)?"
+    r"|interpretation services available|we also use interpreters?|limited [a-z]+|with use of [A-Za-z ]+"
+    r"|other languages with an interpreter present|interpreter present|translation|globo interpreter",
+    re.IGNORECASE,
+)
+_SEPARATOR_RE = re.compile(r"[;|/\n]")
+_AND_RE = re.compile(r"\s+and\s+|\s+&\s+|^and\s+|\s+and$|^&\s+|\s+&$", re.IGNORECASE)
+_NON_LETTER_RE = re.compile(r"[^a-zA-Z,\s]")
+
+LanguageScan = namedtuple("LanguageScan", ["languages", "uses_interpreters"])
+
+
+def _is_nullish(val) -> bool:
+    if val is None:
+        return True
+    try:
+        return bool(val != val)
+    except TypeError:  # pd.NA
+        return True
+
+
+@functools.lru_cache(maxsize=16384)
+def _scan_text(text: str) -> LanguageScan:
+    uses_interpreters = _INTERPRETER_RE.search(text.lower()) is not None
+    val = _PARENS_RE.sub("", text.strip())
+    if _PREFER_NOT_RE.search(val):
+        return LanguageScan(None, uses_interpreters)
+    val = _SERVICE_PHRASE_RE.sub("", val).strip()
+    val = _AND_RE.sub(",", _SEPARATOR_RE.sub(",", val))
+    val = _NON_LETTER_RE.sub("", val)
+    langs = {}
+    for word in val.replace(",", " ").split():
+        key = word.lower()
+        if key not in LANG_IGNORE:
+            langs.setdefault(key, word.capitalize())
+    languages = ", ".join(langs[k] for k in sorted(langs))
+    return LanguageScan(languages or None, uses_interpreters)
+
+
+def scan_languages(val) -> LanguageScan:
+    if _is_nullish(val):
+        return LanguageScan(None, False)
+    return _scan_text(str(val))
+
+
+def clean_languages(val):
+    """'Spanish; english and French (some)' -> 'English, French, Spanish'; None when empty."""
+    return scan_languages(val).languages
+
+
+def uses_interpreters(val) -> bool:
+    return scan_languages(val).uses_interpreters
+
+
+def scan_language_column(series, stats=None):
+    """(languages, uses_interpreters) Series for a language_spoken column.
+
+    Text columns are factorized so each distinct cell is scanned once; `stats`
+    (a clean_and_validate.MemoStats) records rows vs distinct values.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not series.empty and pd.api.types.infer_dtype(series, skipna=True) == "string":
+        codes, uniques = pd.factorize(series)
+        if stats is not None:
+            stats.record(series.name, len(series), len(uniques))
+        # Missing cells get code -1, which picks the trailing empty scan
+        scans = [scan_languages(u) for u in uniques] + [LanguageScan(None, False)]
+        languages = np.array([s.languages for s in scans], dtype=object)[codes]
+        detected = np.array([s.uses_interpreters for s in scans], dtype=bool)[codes]
+    else:
+        scans = [scan_languages(v) for v in series.to_numpy(dtype=object)]
+        languages = [s.languages for s in scans]
+        detected = np.array([s.uses_interpreters for s in scans], dtype=bool)
+    if series.empty:
+        return series.apply(clean_languages), pd.Series(detected, index=series.index, dtype=bool)
+    return (
+        pd.Series(list(languages), index=series.index, name=series.name),
+        pd.Series(detected, index=series.index),
+    )
@@ -0,0 +1,64 @@
+"""
+Run metrics for the Python scripts: wall time per stage plus named counters,
+written as JSON by --metrics-out so CI runs can be compared.
+
+Stage and counter names are fixed strings chosen by the code (API status codes
+and exception type names at most), and values are numbers. Nothing from a
+sheet cell or an API response body is recorded, so, like
+format_geocode_log_summary, a metrics file is safe to upload as an artifact.
+"""
+
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+METRICS_VERSION = 1
+
+
+class Metrics:
+    def __init__(self, script: str = ""):
+        self.script = script
+        self.stages = Counter()
+        self.counters = Counter()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Add the wall time of the block to stage `name` (repeated stages accumulate)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] += time.perf_counter() - start
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.stages[name] += seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def count_all(self, prefix: str, counts) -> None:
+        """Add every (key, n) of a mapping as counter "<prefix>.<key>"."""
+        for key, n in counts.items():
+            self.counters[f"{prefix}.{key}"] += n
+
+    def merge(self, other: "Metrics") -> None:
+        """Fold in metrics gathered elsewhere (e.g. a worker process)."""
+        self.stages.update(other.stages)
+        self.counters.update(other.counters)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": METRICS_VERSION,
+            "script": self.script,
+            "total_seconds": round(time.perf_counter() - self._started, 4),
+            "stages": {name: round(seconds, 4) for name, seconds in sorted(self.stages.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def write(self, path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
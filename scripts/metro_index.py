@@ -0,0 +1,92 @@
+"""
+Grid spatial index of metro bounding boxes (scripts/data/metro_bounds.tsv).
+
+Used to infer an empty City from Latitude/Longitude, and to map native-script
+city names to English, without a reverse-geocode API call. Boxes are stored in
+parallel float arrays. A uniform grid of CELL_DEGREES cells maps each cell to
+the boxes overlapping it (CSR layout: per-cell offsets into one id array). A
+lookup only tests the few boxes in the point's cell, so cost does not grow with
+the size of the table. When boxes overlap, the smallest one wins.
+"""
+
+import math
+from array import array
+from collections import namedtuple
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_SOURCE_PATH = SCRIPT_DIR / "data" / "metro_bounds.tsv"
+CELL_DEGREES = 1.0
+
+Metro = namedtuple("Metro", ["city", "country", "aliases"])
+
+
+def _cell(lat: float, lng: float) -> int:
+    row = int(math.floor((lat + 90.0) / CELL_DEGREES))
+    col = int(math.floor((lng + 180.0) / CELL_DEGREES))
+    return row * int(360 / CELL_DEGREES + 1) + col
+
+
+class MetroIndex:
+    def __init__(self, boxes: list):
+        """boxes: [(city, country, min_lat, max_lat, min_lng, max_lng, aliases)]."""
+        self.metros = [Metro(b[0], b[1], frozenset(a.casefold() for a in b[6])) for b in boxes]
+        self.min_lat = array("d", (b[2] for b in boxes))
+        self.max_lat = array("d", (b[3] for b in boxes))
+        self.min_lng = array("d", (b[4] for b in boxes))
+        self.max_lng = array("d", (b[5] for b in boxes))
+        self.area = array("d", ((b[3] - b[2]) * (b[5] - b[4]) for b in boxes))
+
+        buckets = {}
+        for i, (_c, _k, lat0, lat1, lng0, lng1, _a) in enumerate(boxes):
+            lat = math.floor(lat0 / CELL_DEGREES) * CELL_DEGREES
+            while lat <= lat1:
+                lng = math.floor(lng0 / CELL_DEGREES) * CELL_DEGREES
+                while lng <= lng1:
+                    buckets.setdefault(_cell(lat, lng), []).append(i)
+                    lng += CELL_DEGREES
+                lat += CELL_DEGREES
+        self._cell_start = {}
+        self._cell_ids = array("I")
+        for cell in sorted(buckets):
+            start = len(self._cell_ids)
+            self._cell_ids.extend(buckets[cell])
+            self._cell_start[cell] = (start, len(self._cell_ids))
+
+    @classmethod
+    def load(cls, source_path=DEFAULT_SOURCE_PATH):
+        boxes = []
+        with open(source_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                city, country, lat0, lat1, lng0, lng1, aliases = (line.rstrip("\n").split("\t") + [""])[:7]
+                boxes.append((
+                    city,
+                    country,
+                    float(lat0),
+                    float(lat1),
+                    float(lng0),
+                    float(lng1),
+                    [a for a in aliases.split("|") if a],
+                ))
+        return cls(boxes)
+
+    def __len__(self) -> int:
+        return len(self.metros)
+
+    def lookup(self, lat: float, lng: float) -> Metro | None:
+        """Smallest metro box containing (lat, lng), or None."""
+        span = self._cell_start.get(_cell(lat, lng))
+        if span is None:
+            return None
+        best = None
+        for k in range(*span):
+            i = self._cell_ids[k]
+            if (
+                self.min_lat[i] <= lat <= self.max_lat[i]
+                and self.min_lng[i] <= lng <= self.max_lng[i]
+                and (best is None or self.area[i] < self.area[best])
+            ):
+                best = i
+        return self.metros[best] if best is not None else None
@@ -1,4 +1,29 @@
 import re
+from collections import namedtuple
+from functools import lru_cache
+
+PhoneNumber = namedtuple("PhoneNumber", ["country_code", "national_number"])
+
+_SHEET_ESCAPE_RE = re.compile(r"'[=+\-@]")
+_PHONE_LIKE_RE = re.compile(r"\+?\d[\d\s\-\(\)]{5,}")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_NULL_PHONES = frozenset(("prefer not to say", "", "#error!"))
+
+# ITU-T E.164 calling codes are prefix-free: 1 and 7 are the only one-digit
+# codes, these are the two-digit ones, and everything else has three digits.
+_ONE_DIGIT_CODES = frozenset("17")
+_TWO_DIGIT_CODES = frozenset(
+    "20 27 30 31 32 33 34 36 39 40 41 43 44 45 46 47 48 49 51 52 53 54 55 56 57 58 "
+    "60 61 62 63 64 65 66 81 82 84 86 90 91 92 93 94 95 98".split()
+)
+# Countries whose national numbers keep the leading 0 after the country code.
+_KEEPS_TRUNK_ZERO = frozenset(("39", "378", "379"))
+_EXTENSION_RE = re.compile(r"\s*(?:(?i:ext)\.?|[xX#])\s*\d{1,6}$")
+_TRUNK_PAREN_RE = re.compile(r"\(0\)")
+_NON_DIGIT_RE = re.compile(r"\D+")
+# E.164 ("+16175551234") and NANP ("617-555-1234", "(617) 555-1234", "+1 617.555.1234"):
+# single separators only, so clean_phone would return these unchanged
+_ALREADY_CLEAN_RE = re.compile(r"\+[1-9]\d{6,14}|(?:\+1[ .-]?)?(?:\(\d{3}\) ?|\d{3}[ .-]?)\d{3}[ .-]?\d{4}")
 
 
 def _is_nullish(val) -> bool:
@@ -14,15 +39,63 @@ def clean_phone(val):
     if _is_nullish(val):
         return None
     val_str = str(val).strip()
-    if re.match(r"^'[=+\-@]", val_str):
+    if _SHEET_ESCAPE_RE.match(val_str):
         val_str = val_str[1:].strip()
-    if val_str.lower() in ("prefer not to say", "") or val_str.upper() == "#ERROR!":
+    if val_str.lower() in _NULL_PHONES:
         return None
     if "/" in val_str:
         parts = [p.strip() for p in val_str.split("/")]
         for part in parts:
-            if re.search(r"(\+?\d[\d\s\-\(\)]{5,})", part):
+            if _PHONE_LIKE_RE.search(part):
                 val_str = part
                 break
-    val_str = re.sub(r" {2,}", " ", val_str.strip())
+    val_str = _MULTI_SPACE_RE.sub(" ", val_str.strip())
     return val_str if val_str else None
+
+
+@lru_cache(maxsize=16384)
+def parse_phone(text: str) -> PhoneNumber | None:
+    """Split a cleaned phone string into (country_code, national_number) digit strings.
+
+    country_code is "" when the number has no "+" or "00" international prefix.
+    Extensions and a "(0)" trunk marker are dropped. Returns None when the text
+    does not hold 6-15 digits.
+    """
+    text = _EXTENSION_RE.sub("", str(text or "").strip())
+    text = _TRUNK_PAREN_RE.sub("", text)
+    international = text.startswith("+") or text.startswith("00")
+    digits = _NON_DIGIT_RE.sub("", text)
+    if international and not text.startswith("+"):
+        digits = digits[2:]
+    if not 6 <= len(digits) <= 15:
+        return None
+    if not international:
+        return PhoneNumber("", digits)
+    if digits[0] in _ONE_DIGIT_CODES:
+        width = 1
+    elif digits[:2] in _TWO_DIGIT_CODES:
+        width = 2
+    else:
+        width = 3
+    code, national = digits[:width], digits[width:]
+    if national.startswith("0") and code not in _KEEPS_TRUNK_ZERO:
+        national = national[1:]
+    return PhoneNumber(code, national) if national else None
+
+
+def clean_phones(series):
+    """Series equivalent of series.apply(clean_phone).
+
+    Text already in E.164 or NANP form comes back from clean_phone unchanged,
+    so it is matched in one vectorized pass and only the rest is cleaned cell
+    by cell. Wrap in clean_and_validate._memoized to clean each distinct value
+    once.
+    """
+    import pandas as pd
+
+    if series.empty or pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return series.apply(clean_phone)
+    out = series.to_numpy(dtype=object, copy=True)
+    rest = ~series.str.fullmatch(_ALREADY_CLEAN_RE, na=False).to_numpy(dtype=bool)
+    out[rest] = [clean_phone(v) for v in out[rest]]
+    return pd.Series(out.tolist(), index=series.index, name=series.name)
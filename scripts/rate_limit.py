@@ -0,0 +1,45 @@
+"""
+Thread-safe token-bucket rate limiter shared by geocoding workers.
+
+The bucket refills at `rate` tokens per second up to `burst` tokens; each API
+request takes one token and blocks until one is available. This replaces fixed
+sleeps between calls, so cached lookups and idle time cost nothing while the
+overall request rate still stays under the API quota.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1.0, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self.waited += wait
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns seconds spent waiting."""
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -0,0 +1,123 @@
+"""
+Shared Google Sheets reads for geocode_working_copy.py and clean_and_validate.py.
+
+All ranges a script needs are fetched in one values().batchGet. The result is
+saved to a local snapshot (a pickle of the raw row lists) stamped with the
+spreadsheet's Drive modifiedTime, taken just before the read. A later run,
+in the same or the other script, reuses the snapshot only while that stamp
+is unchanged. Any edit to the spreadsheet, including this pipeline's own
+write-backs and the Node promote step, makes it stale. When the stamp cannot
+be read (no Drive client, API disabled), nothing is cached.
+
+set_client_factory() swaps the Google clients for other objects with the same
+call surface, e.g. the local fakes in tests/google_fakes.py used by load tests.
+"""
+
+import pickle
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+DEFAULT_SNAPSHOT_PATH = REPO_ROOT / ".gcp-credentials" / "sheet-snapshot.pickle"
+SNAPSHOT_VERSION = 1
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+]
+WORKING_COPY_RANGE = "'Working Copy'!A:Y"
+PRODUCTION_RANGE = "'Production'!A:X"
+
+_client_factory = None
+
+
+def set_client_factory(factory) -> None:
+    """Build clients with factory(credentials_path) -> (sheets, drive) instead. None restores the Google clients."""
+    global _client_factory
+    _client_factory = factory
+
+
+def get_clients(credentials_path):
+    """(sheets, drive) discovery clients sharing one set of service-account credentials.
+
+    The Google client libraries are imported here rather than at module load,
+    and both clients are built from the discovery documents bundled with
+    googleapiclient (no discovery fetch, no on-disk discovery cache).
+    """
+    if _client_factory is not None:
+        return _client_factory(credentials_path)
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
+    creds = service_account.Credentials.from_service_account_file(str(credentials_path), scopes=SCOPES)
+    return (
+        build("sheets", "v4", credentials=creds, static_discovery=True, cache_discovery=False),
+        build("drive", "v3", credentials=creds, static_discovery=True, cache_discovery=False),
+    )
+
+
+def batch_get(sheets, spreadsheet_id: str, ranges: list) -> dict:
+    """Fetch every range in one request. Returns {requested range: rows}."""
+    res = sheets.spreadsheets().values().batchGet(spreadsheetId=spreadsheet_id, ranges=list(ranges)).execute()
+    value_ranges = res.get("valueRanges", [])
+    return {r: (value_ranges[i].get("values", []) if i < len(value_ranges) else []) for i, r in enumerate(ranges)}
+
+
+def modified_time(drive, spreadsheet_id: str) -> str | None:
+    """Drive modifiedTime of the spreadsheet, or None when it cannot be read."""
+    if drive is None:
+        return None
+    try:
+        meta = drive.files().get(fileId=spreadsheet_id, fields="modifiedTime", supportsAllDrives=True).execute()
+    except Exception:
+        return None
+    return meta.get("modifiedTime")
+
+
+def load_snapshot(path, spreadsheet_id: str, stamp: str | None) -> dict | None:
+    """Cached {range: rows} if the snapshot at `path` was taken at `stamp`."""
+    if not stamp:
+        return None
+    try:
+        with open(path, "rb") as f:
+            snap = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if (
+        not isinstance(snap, dict)
+        or snap.get("version") != SNAPSHOT_VERSION
+        or snap.get("spreadsheet_id") != spreadsheet_id
+        or snap.get("modified_time") != stamp
+    ):
+        return None
+    return snap.get("ranges")
+
+
+def save_snapshot(path, spreadsheet_id: str, stamp: str, ranges: dict) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(
+            {"version": SNAPSHOT_VERSION, "spreadsheet_id": spreadsheet_id, "modified_time": stamp, "ranges": ranges},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    tmp.replace(path)
+
+
+def read_ranges(sheets, spreadsheet_id: str, ranges: list, drive=None, snapshot_path=None, prefetch=()) -> tuple[dict, bool]:
+    """(rows_by_range, from_snapshot) for `ranges`, reusing the snapshot while the spreadsheet is unchanged.
+
+    On a miss, `ranges` and `prefetch` (ranges another script will want) are
+    fetched together in one batchGet and snapshotted.
+    """
+    stamp = modified_time(drive, spreadsheet_id) if snapshot_path else None
+    cached = load_snapshot(snapshot_path, spreadsheet_id, stamp) if stamp else None
+    if cached is not None and all(r in cached for r in ranges):
+        return {r: cached[r] for r in ranges}, True
+    wanted = list(dict.fromkeys(list(ranges) + list(prefetch)))
+    fetched = batch_get(sheets, spreadsheet_id, wanted)
+    if stamp:
+        save_snapshot(snapshot_path, spreadsheet_id, stamp, fetched)
+    return {r: fetched[r] for r in ranges}, False
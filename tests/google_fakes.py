@@ -0,0 +1,392 @@
+"""
+Local stand-ins for the Google APIs the Python scripts call, for end-to-end
+load tests and profiling without a real spreadsheet, credentials or network.
+
+FakeSheetsService answers the discovery-client calls the scripts make
+(spreadsheets().get for rowCount and values().get/update/batchGet/batchUpdate)
+from in-memory tabs, trimming read results the way the real API does:
+trailing empty cells and rows dropped, blank rows inside the data returned
+as []. Every execute() can sleep a fixed latency plus a per-KiB transfer time,
+and requests or responses over a payload limit raise PayloadTooLarge.
+FakeDriveService reports a modifiedTime that moves on every write, so the
+sheet snapshot behaves as it does against Drive. Install both with
+sheet_io.set_client_factory(fakes.client_factory).
+
+FakeGeocodeServer is a localhost HTTP server speaking the Geocoding API's JSON.
+Results are deterministic per address (a hash picks one of PLACES); an
+optional share of requests answers OVER_QUERY_LIMIT to exercise retries.
+Inject it with geocode_client.set_default_client(GeocodingClient(base_url=server.url))
+and reset the default to None afterwards.
+"""
+
+import json
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_ROW_COUNT = 1000
+
+_A1_RE = re.compile(r"^(?:(?:'(?P<quoted>(?:[^']|'')+)'|(?P<tab>[^!]+))!)?(?P<c1>[A-Z]*)(?P<r1>\d*)(?::(?P<c2>[A-Z]*)(?P<r2>\d*))?$")
+
+# (locality, English locality, admin area 1, country, country code, lat, lng)
+PLACES = [
+    ("Boston", "Boston", "MA", "United States", "US", 42.3601, -71.0589),
+    ("New York", "New York", "NY", "United States", "US", 40.7128, -74.0060),
+    ("London", "London", "England", "United Kingdom", "GB", 51.5072, -0.1276),
+    ("Toronto", "Toronto", "ON", "Canada", "CA", 43.6532, -79.3832),
+    ("Melbourne", "Melbourne", "VIC", "Australia", "AU", -37.8136, 144.9631),
+    ("São Paulo", "São Paulo", "SP", "Brazil", "BR", -23.5505, -46.6333),
+    ("Zürich", "Zurich", "ZH", "Switzerland", "CH", 47.3769, 8.5417),
+    ("東京", "Tokyo", "Tokyo", "Japan", "JP", 35.6762, 139.6503),
+]
+NO_RESULT_WORDS = ("telehealth", "virtual", "remote")
+
+
+class PayloadTooLarge(Exception):
+    """A request or response exceeded the fake service's payload limit."""
+
+
+def _column_index(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - ord("A") + 1
+    return n - 1
+
+
+def parse_a1(a1: str, default_tab: str = "Sheet1") -> tuple:
+    """(tab, first_row, first_col, last_row, last_col) with 0-based indexes; open ends are None."""
+    match = _A1_RE.match(a1.strip())
+    if not match:
+        raise ValueError(f"Unable to parse range: {a1}")
+    tab = match.group("quoted").replace("''", "'") if match.group("quoted") else match.group("tab") or default_tab
+    c1, r1, c2, r2 = match.group("c1", "r1", "c2", "r2")
+    first_row = int(r1) - 1 if r1 else 0
+    first_col = _column_index(c1) if c1 else 0
+    if c2 is None:
+        # One cell ("A1") or whole rows/columns given by a single reference
+        return tab, first_row, first_col, first_row if r1 else None, first_col if c1 else None
+    last_row = int(r2) - 1 if r2 else None
+    last_col = _column_index(c2) if c2 else None
+    return tab, first_row, first_col, last_row, last_col
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return str(value)
+
+
+def _trim(rows: list) -> list:
+    """Drop trailing empty cells of each row, then trailing empty rows."""
+    out = []
+    for row in rows:
+        end = len(row)
+        while end and row[end - 1] == "":
+            end -= 1
+        out.append(row[:end])
+    while out and not out[-1]:
+        out.pop()
+    return out
+
+
+class _Request:
+    def __init__(self, service, method: str, params: dict, run):
+        self._service = service
+        self._method = method
+        self._params = params
+        self._run = run
+
+    def execute(self):
+        return self._service._execute(self._method, self._params, self._run)
+
+
+class FakeSheetsService:
+    """In-memory Sheets v4 service: `tabs` maps tab name to a list of row lists.
+
+    `calls` counts executed requests by method; `requests` lists each one as
+    (method, params), params being the range(s) and body it was sent with.
+    """
+
+    def __init__(
+        self,
+        tabs: dict | None = None,
+        latency: float = 0.0,
+        seconds_per_kib: float = 0.0,
+        max_request_bytes: int | None = None,
+        max_response_bytes: int | None = None,
+        sleep=time.sleep,
+    ):
+        self.tabs = {name: [[_cell(v) for v in row] for row in rows] for name, rows in (tabs or {}).items()}
+        self.latency = latency
+        self.seconds_per_kib = seconds_per_kib
+        self.max_request_bytes = max_request_bytes
+        self.max_response_bytes = max_response_bytes
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.calls = Counter()
+        self.requests = []
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.version = 0
+        self.waited = 0.0
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId=None, range=None, ranges=None, fields=None, **_):
+        if range is not None:
+            return _Request(self, "values.get", {"range": range}, lambda: self._get_range(range))
+        return _Request(self, "spreadsheets.get", {"ranges": ranges}, lambda: self._metadata(ranges))
+
+    def batchGet(self, spreadsheetId=None, ranges=(), **_):
+        ranges = [ranges] if isinstance(ranges, str) else list(ranges)
+        return _Request(
+            self, "values.batchGet", {"ranges": ranges}, lambda: {"valueRanges": [self._get_range(r) for r in ranges]}
+        )
+
+    def update(self, spreadsheetId=None, range=None, valueInputOption=None, body=None, **_):
+        return _Request(self, "values.update", {"range": range, "body": body}, lambda: self._write(range, body.get("values", [])))
+
+    def batchUpdate(self, spreadsheetId=None, body=None, **_):
+        def run():
+            cells = sum(self._write(d["range"], d.get("values", []))["updatedCells"] for d in body.get("data", []))
+            return {"totalUpdatedCells": cells}
+
+        return _Request(self, "values.batchUpdate", {"body": body}, run)
+
+    def rows(self, tab: str) -> list:
+        """Trimmed contents of a tab, as a full read would return them."""
+        return _trim(self.tabs.get(tab, []))
+
+    def _execute(self, method: str, params: dict, run):
+        body = params.get("body")
+        sent = len(json.dumps(body).encode()) if body is not None else 0
+        if self.max_request_bytes is not None and sent > self.max_request_bytes:
+            raise PayloadTooLarge(f"{method}: request of {sent} bytes exceeds {self.max_request_bytes}")
+        with self._lock:
+            result = run()
+        received = len(json.dumps(result).encode())
+        if self.max_response_bytes is not None and received > self.max_response_bytes:
+            raise PayloadTooLarge(f"{method}: response of {received} bytes exceeds {self.max_response_bytes}")
+        delay = self.latency + self.seconds_per_kib * (sent + received) / 1024
+        with self._lock:
+            self.calls[method] += 1
+            self.requests.append((method, params))
+            self.bytes_sent += sent
+            self.bytes_received += received
+            self.waited += delay
+        if delay:
+            self._sleep(delay)
+        return result
+
+    def _tab(self, name: str) -> list:
+        if name not in self.tabs:
+            raise KeyError(f"Unable to parse range: no tab named {name!r}")
+        return self.tabs[name]
+
+    def _get_range(self, a1: str) -> dict:
+        tab, r0, c0, r1, c1 = parse_a1(a1)
+        grid = self._tab(tab)
+        stop_row = len(grid) if r1 is None else min(r1 + 1, len(grid))
+        values = _trim([row[c0:None if c1 is None else c1 + 1] for row in grid[r0:stop_row]])
+        out = {"range": a1, "majorDimension": "ROWS"}
+        if values:
+            out["values"] = values
+        return out
+
+    def _metadata(self, ranges) -> dict:
+        names = [parse_a1(r)[0] for r in ([ranges] if isinstance(ranges, str) else ranges or [])] or list(self.tabs)
+        return {
+            "sheets": [
+                {"properties": {"title": n, "gridProperties": {"rowCount": max(DEFAULT_ROW_COUNT, len(self._tab(n)))}}}
+                for n in names
+            ]
+        }
+
+    def _write(self, a1: str, values: list) -> dict:
+        tab, r0, c0, _, _ = parse_a1(a1)
+        grid = self.tabs.setdefault(tab, [])
+        cells = 0
+        for i, row in enumerate(values):
+            while len(grid) <= r0 + i:
+                grid.append([])
+            target = grid[r0 + i]
+            if len(target) < c0 + len(row):
+                target.extend([""] * (c0 + len(row) - len(target)))
+            for j, value in enumerate(row):
+                target[c0 + j] = _cell(value)
+            cells += len(row)
+        self.version += 1
+        return {"updatedRange": a1, "updatedRows": len(values), "updatedCells": cells}
+
+
+class FakeDriveService:
+    """Drive v3 files().get(fields="modifiedTime") backed by a FakeSheetsService's write count.
+
+    With `enabled=False` every request fails, as it does when the Drive API is
+    not enabled for the project.
+    """
+
+    EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self, sheets: FakeSheetsService, enabled: bool = True):
+        self.sheets = sheets
+        self.enabled = enabled
+        self.calls = 0
+
+    def files(self):
+        return self
+
+    def get(self, fileId=None, fields=None, **_):
+        if not self.enabled:
+            raise RuntimeError("Drive API has not been used in project")
+        return self
+
+    def execute(self):
+        self.calls += 1
+        stamp = self.EPOCH + timedelta(seconds=self.sheets.version)
+        return {"modifiedTime": stamp.strftime("%Y-%m-%dT%H:%M:%S.000Z")}
+
+
+class FakeGoogle:
+    """A FakeSheetsService and its FakeDriveService; client_factory fits sheet_io.set_client_factory."""
+
+    def __init__(self, tabs: dict | None = None, **sheets_options):
+        self.sheets = FakeSheetsService(tabs, **sheets_options)
+        self.drive = FakeDriveService(self.sheets)
+
+    def client_factory(self, credentials_path=None):
+        return self.sheets, self.drive
+
+
+def _place_for(text: str):
+    return PLACES[zlib.crc32(text.casefold().encode()) % len(PLACES)]
+
+
+def geocode_result(address: str, language: str = "en") -> dict | None:
+    """The deterministic result FakeGeocodeServer returns for `address` (None for ZERO_RESULTS)."""
+    key = address.strip()
+    if not key or any(word in key.casefold() for word in NO_RESULT_WORDS):
+        return None
+    locality, english, admin1, country, code, lat, lng = _place_for(key)
+    return _result(english if language == "en" else locality, admin1, country, code, lat, lng, key)
+
+
+def _result(locality, admin1, country, code, lat, lng, key) -> dict:
+    h = zlib.crc32(key.encode())
+    number = str(h % 900 + 1)
+    return {
+        "formatted_address": f"{number} Main St, {locality}, {admin1}, {country}",
+        "geometry": {
+            "location": {"lat": round(lat + (h % 1000 - 500) / 10000, 6), "lng": round(lng + (h // 1000 % 1000 - 500) / 10000, 6)}
+        },
+        "address_components": [
+            {"long_name": number, "short_name": number, "types": ["street_number"]},
+            {"long_name": "Main Street", "short_name": "Main St", "types": ["route"]},
+            {"long_name": locality, "short_name": locality, "types": ["locality", "political"]},
+            {"long_name": admin1, "short_name": admin1, "types": ["administrative_area_level_1", "political"]},
+            {"long_name": country, "short_name": code, "types": ["country", "political"]},
+            {"long_name": f"{h % 90000 + 10000}", "short_name": f"{h % 90000 + 10000}", "types": ["postal_code"]},
+        ],
+    }
+
+
+def reverse_result(lat: float, lng: float, language: str = "en") -> dict:
+    """Result for the nearest of PLACES to (lat, lng)."""
+    locality, english, admin1, country, code, plat, plng = min(
+        PLACES, key=lambda p: (p[5] - lat) ** 2 + (p[6] - lng) ** 2
+    )
+    return _result(english if language == "en" else locality, admin1, country, code, plat, plng, f"{lat},{lng}")
+
+
+class FakeGeocodeServer:
+    """Localhost Geocoding API. Use as a context manager; `url` is the endpoint to query.
+
+    Every `over_query_limit_every`-th request (0 = never) answers OVER_QUERY_LIMIT.
+    """
+
+    def __init__(self, latency: float = 0.0, over_query_limit_every: int = 0):
+        self.latency = latency
+        self.over_query_limit_every = over_query_limit_every
+        self.statuses = Counter()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/maps/api/geocode/json"
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    def respond(self, params: dict) -> dict:
+        """JSON body for one request's query parameters (values as strings)."""
+        with self._lock:
+            self._requests += 1
+            n = self._requests
+        if self.over_query_limit_every and n % self.over_query_limit_every == 0:
+            body = {"status": "OVER_QUERY_LIMIT", "results": []}
+        elif not params.get("key"):
+            body = {"status": "REQUEST_DENIED", "results": []}
+        elif "latlng" in params:
+            lat, lng = (float(x) for x in params["latlng"].split(","))
+            body = {"status": "OK", "results": [reverse_result(lat, lng, params.get("language", "en"))]}
+        else:
+            result = geocode_result(params.get("address", ""), params.get("language", "en"))
+            body = {"status": "OK", "results": [result]} if result else {"status": "ZERO_RESULTS", "results": []}
+        with self._lock:
+            self.statuses[body["status"]] += 1
+        return body
+
+    def start(self) -> "FakeGeocodeServer":
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                body = json.dumps(fake.respond({k: v[0] for k, v in query.items()})).encode()
+                if fake.latency:
+                    time.sleep(fake.latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
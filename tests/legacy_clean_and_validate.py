@@ -0,0 +1,74 @@
+"""
+The per-value pipeline clean_and_validate.main() ran before vectorization, kept
+as the reference for parity tests and benchmarks/bench_clean_and_validate.py.
+clean_website and clean_phone are the scalar cleaners, which are unchanged
+(clean_phone's parity with its old form is tested in test_phone_cleaning.py).
+"""
+
+import re
+
+import pandas as pd
+
+from clean_and_validate import CITY_ALIASES, NULL_LIKE_TEXT, SHEET_HEADERS, clean_website
+from legacy_email_cleaning import legacy_clean_email_column
+from legacy_language_cleaning import legacy_clean_languages, legacy_uses_interpreters_func
+from phone_cleaning import clean_phone
+
+TEXT_FIELDS = [
+    "name_first", "name_last", "work_institution", "job_title", "work_address",
+    "address_street", "address_state", "address_zip",
+]
+
+
+def _sheet_cell(value) -> str:
+    if pd.isnull(value):
+        return ""
+    text = str(value).strip()
+    return "" if text.lower() in NULL_LIKE_TEXT else text
+
+
+def legacy_clean_text_field(value, field):
+    if pd.isnull(value):
+        return value
+    text = _sheet_cell(value)
+    text = re.sub(r"\s+", " ", text)
+    if field == "work_address":
+        text = re.sub(r"\n+", ", ", text)
+        text = re.sub(r"\s+", " ", text)
+    if field == "name_first":
+        text = text.replace(".", "")
+    return text
+
+
+def legacy_strip_comment(val) -> str:
+    if pd.isnull(val):
+        return ""
+    s = _sheet_cell(val)
+    i = s.find("#")
+    return _sheet_cell(s[:i].strip() if i >= 0 else s)
+
+
+def legacy_normalize_uses_interpreters(explicit_value, language_value):
+    if not pd.isnull(explicit_value):
+        normalized = str(explicit_value).strip().upper()
+        if normalized in {"TRUE", "FALSE"}:
+            return normalized
+    return "TRUE" if legacy_uses_interpreters_func(language_value) else "FALSE"
+
+
+def legacy_clean(df):
+    """The per-value pipeline as main() ran it before vectorization."""
+    df = df.copy()
+    df["email"] = legacy_clean_email_column(df["email"])
+    for col in TEXT_FIELDS:
+        df[col] = df[col].apply(lambda value: legacy_clean_text_field(value, col))
+    df["Country"] = df["Country"].astype(str).apply(legacy_strip_comment)
+    df["City"] = df["City"].astype(str).apply(legacy_strip_comment)
+    df["City"] = df["City"].apply(lambda v: CITY_ALIASES.get(v.lower().strip(), v) if v else v)
+    df["work_website"] = df["work_website"].apply(clean_website)
+    df["phone_work"] = df["phone_work"].apply(clean_phone)
+    df["uses_interpreters"] = [
+        legacy_normalize_uses_interpreters(e, lang) for e, lang in zip(df["uses_interpreters"], df["language_spoken"])
+    ]
+    df["language_spoken"] = df["language_spoken"].apply(legacy_clean_languages)
+    return df[SHEET_HEADERS]
@@ -0,0 +1,40 @@
+"""
+clean_and_validate's email normalization and _first_valid_email as they were
+before email_cleaning.py, kept as the reference for parity tests and
+benchmarks/bench_email_cleaning.py.
+"""
+
+import pandas as pd
+import validators
+
+
+def legacy_first_valid_email(cell):
+    """clean_and_validate._first_valid_email as it was."""
+    if pd.isnull(cell) or str(cell).strip() == "":
+        return None
+    for e in str(cell).split(";"):
+        e = e.strip().lower().replace(",", "").replace(" ", "")
+        if not e:
+            continue
+        try:
+            if validators.email(e):
+                return e
+        except Exception:
+            continue
+    return None
+
+
+def legacy_clean_email_column(series):
+    """The legacy column .str normalization followed by legacy_first_valid_email per cell."""
+    return (
+        series.astype(str).str.strip().str.lower()
+        .str.replace(",", "", regex=False).str.replace(" ", "", regex=False)
+        .apply(legacy_first_valid_email)
+    )
+
+
+def legacy_clean_email(cell):
+    """legacy_clean_email_column for a single cell."""
+    if pd.isnull(cell):
+        return None
+    return legacy_first_valid_email(str(cell).strip().lower().replace(",", "").replace(" ", ""))
@@ -0,0 +1,61 @@
+"""
+clean_and_validate's uses_interpreters_func and clean_languages as they were
+before language_cleaning.py, kept as the reference for parity tests and
+benchmarks/bench_language_cleaning.py.
+"""
+
+import re
+
+import pandas as pd
+
+from language_cleaning import INTERPRETER_PATTERNS, LANG_IGNORE
+
+
+def legacy_uses_interpreters_func(val):
+    if pd.isnull(val):
+        return False
+    val_str = str(val).lower()
+    for pat in INTERPRETER_PATTERNS:
+        if re.search(pat, val_str):
+            return True
+    return False
+
+
+def legacy_clean_languages(val):
+    if pd.isnull(val):
+        return None
+    val = str(val).strip()
+    val = re.sub(r"\([^)]*\)", "", val)
+    if re.search(r"prefer not to say", val, re.IGNORECASE):
+        return None
+    val = re.sub(
+        r"(all other languages with interpretation services|others? with (provided )?interpreter( services)?|interpretation services available|we also use interpreters?|limited [a-z]+|with use of [A-Za-z ]+|other languages with an interpreter present|interpreter present|translation|globo interpreter)",
+        "", val, flags=re.IGNORECASE,
+    )
+    val = val.strip()
+    val = re.sub(r"[;|/]", ",", val).replace("\n", ",")
+    val = re.sub(r"(\s+and\s+|\s+&\s+|^and\s+|\s+and$|^&\s+|\s+&$)", ",", val, flags=re.IGNORECASE)
+    val = re.sub(r"\.", "", val)
+    val = re.sub(r"[^a-zA-Z,\s]", "", val)
+    val = re.sub(r"\s+", " ", val)
+    val = re.sub(r",+", ",", val).strip(",").strip()
+    langs = []
+    for chunk in val.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        words = chunk.split()
+        if len(words) > 1:
+            langs.extend(words)
+        else:
+            langs.append(chunk)
+    langs = [l for l in langs if l.lower() not in LANG_IGNORE and l.strip()]
+    langs = [l.strip().capitalize() for l in langs]
+    seen = set()
+    langs_clean = []
+    for l in langs:
+        if l.lower() not in seen:
+            langs_clean.append(l)
+            seen.add(l.lower())
+    langs_clean = sorted(langs_clean, key=lambda x: x.lower())
+    return ", ".join(langs_clean) if langs_clean else None
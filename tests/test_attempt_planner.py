@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from attempt_planner import AttemptPlanner, attempt_queries, row_shape
+
+
+def test_attempt_queries_keep_fixed_order_and_drop_repeats():
+    assert attempt_queries("MGH", "55 Fruit St") == [(0, "MGH, 55 Fruit St"), (1, "55 Fruit St"), (2, "MGH")]
+    assert attempt_queries("", "55 Fruit St") == [(0, "55 Fruit St")]
+    assert attempt_queries("MGH", "") == [(0, "MGH")]
+    assert attempt_queries("", "") == []
+
+
+def test_row_shape_features():
+    assert row_shape("MGH", "55 Fruit St, Boston, MA 02114") == (True, True, True)
+    assert row_shape("", "Great Ormond St, London WC1N 3JH") == (False, False, True)
+    assert row_shape("", "Rämistrasse 71, 8006 Zürich") == (False, True, True)
+    assert row_shape("MGH", "Boston") == (True, False, False)
+
+
+def test_planner_starts_in_fixed_order_and_learns_from_the_run():
+    planner = AttemptPlanner()
+    shape, attempts = planner.plan("MGH", "55 Fruit St, Boston, MA 02114")
+    assert [kind for kind, _ in attempts] == [0, 1, 2]
+    for _ in range(3):
+        planner.record(shape, 0, complete=False, first=True)
+        planner.record(shape, 1, complete=True)
+
+    _, attempts = planner.plan("BCH", "300 Longwood Ave, Boston, MA 02115")
+    assert [kind for kind, _ in attempts] == [1, 2, 0]
+    # Other row shapes keep their own history
+    _, attempts = planner.plan("MGH", "Boston")
+    assert [kind for kind, _ in attempts] == [0, 1, 2]
+    assert planner.reordered == 1
+
+    fixed = AttemptPlanner(adaptive=False)
+    fixed.tried, fixed.complete = planner.tried, planner.complete
+    assert [kind for kind, _ in fixed.plan("BCH", "300 Longwood Ave, Boston, MA 02115")[1]] == [0, 1, 2]
+    assert planner.counts()["tried.combined"] == 3
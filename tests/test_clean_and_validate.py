@@ -9,6 +9,8 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from phone_cleaning import clean_phone
 import clean_and_validate
+from google_fakes import FakeSheetsService
+from legacy_clean_and_validate import legacy_clean
 
 
 def test_clean_phone_strips_google_sheets_text_escape():
@@ -75,16 +77,11 @@ def test_cleaning_preserves_explicit_interpreter_service_values(monkeypatch):
     captured = {}
     monkeypatch.setattr(clean_and_validate, "CREDENTIALS_PATH", FakePath())
     monkeypatch.setattr(clean_and_validate, "SHEET_ID_PATH", FakePath())
-    monkeypatch.setattr(
-        clean_and_validate.service_account.Credentials,
-        "from_service_account_file",
-        lambda *args, **kwargs: object(),
-    )
-    monkeypatch.setattr(clean_and_validate, "build", lambda *args, **kwargs: object())
+    monkeypatch.setattr(clean_and_validate, "get_clients", lambda path: (object(), None))
     monkeypatch.setattr(
         clean_and_validate,
         "_read_production_from_sheet",
-        lambda sheets, spreadsheet_id: (clean_and_validate.SHEET_HEADERS, source.copy()),
+        lambda sheets, spreadsheet_id, drive, snapshot_path: (clean_and_validate.SHEET_HEADERS, source.copy()),
     )
     monkeypatch.setattr(
         clean_and_validate,
@@ -119,3 +116,205 @@ def test_interpreter_service_normalization_uses_legacy_inference_only_as_fallbac
         )
         == expected
     )
+
+
+CORPUS = {
+    "name_first": ["Ada", " J. Robert ", "nan", None, "Mary  Ann", "-", "", "Dr.\tLee"],
+    "name_last": ["Lovelace", pd.NA, "N/A", "  O'Brien ", "van  der Berg", "null"],
+    "email": [
+        "ada@example.org", " Ada@Example.ORG ", "a@b.co; second@x.org", "bad-address",
+        "first.last+tag@sub.example.co.uk", "foo,bar@x.org", "x@y", None, "", "nan",
+        "under_score@x-y.org", "a..b@x.org", "-@x.org", "ünï@x.org", "two@@x.org",
+        "someone@exam_ple.org", "; real@x.org", "a" * 65 + "@x.org",
+    ],
+    "work_address": ["1 Main St\nBoston", "  2 Elm   Rd ", "none", None, "PO Box 5,\n\nParis"],
+    "City": ["NYC", " ny ", "Mexico# test", "nan", None, "Boston", "#only", "Paris #x"],
+    "Country": ["USA", "Mexico# Test comment", "null", None, "  Canada  ", "--"],
+    "work_website": [
+        "https://example.org/", "www.Example.org", "example.org/team", "Prefer not to say",
+        "see https://a.org, or www.b.org", "http://x.org; http://y.org", "n.a.",
+        "not a url", "sub.www.example.org", "foo.bar baz", None, "", "https://x.org.",
+        "HTTP://CAPS.ORG/PATH/", "x.y", "ex-ample.co.uk/a?b=c&d=%20", "a;b",
+        "www.x.org\nwww.y.org", "https://x.org/a,b",
+    ],
+    "phone_work": [
+        "+1 617 555 0100", "'+1 617 555 0100", "617-555-0100 / 617-555-0101", "prefer not to say",
+        "#ERROR!", None, "", "  (617)  555  0100 ", "ext / 617 555 0100", "'abc", 6175550100,
+    ],
+    "language_spoken": [
+        "English", "English, French", "Spanish, English, Spanish", "English and Spanish",
+        "English; French", "Prefer not to say", "English with interpreter services available",
+        "French (some)", "English, Other", "english", "Translation", "Limited Spanish",
+        None, "", "And", "Interpreters", "English, And", "Zulu, Afrikaans, English",
+    ],
+    "uses_interpreters": ["TRUE", "false", " true ", "", None, "unknown", True, False],
+}
+
+
+def _corpus_frame(n=120):
+    rows = []
+    for i in range(n):
+        row = {h: "" for h in clean_and_validate.SHEET_HEADERS}
+        for col, values in CORPUS.items():
+            row[col] = values[(i * 7 + len(col)) % len(values)]
+        rows.append(row)
+    return pd.DataFrame(rows, columns=clean_and_validate.SHEET_HEADERS)
+
+
+def test_vectorized_pipeline_matches_per_value_cleaners():
+    source = _corpus_frame()
+    expected = legacy_clean(source)
+    actual = clean_and_validate.clean_dataframe(source.copy())
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert clean_and_validate._df_to_csv_string(actual) == clean_and_validate._df_to_csv_string(expected)
+
+
+@pytest.mark.parametrize(
+    "column, vectorized, scalar",
+    [
+        ("work_website", clean_and_validate.clean_websites, clean_and_validate.clean_website),
+    ],
+)
+def test_series_cleaners_match_scalar_cleaners(column, vectorized, scalar):
+    values = pd.Series(CORPUS[column], dtype=object)
+    pd.testing.assert_series_equal(vectorized(values), values.apply(scalar))
+    pd.testing.assert_series_equal(vectorized(values.iloc[:0]), values.iloc[:0].apply(scalar))
+
+
+def test_columnar_serializer_matches_per_cell_serialization():
+    for frame in (_corpus_frame(), clean_and_validate.clean_dataframe(_corpus_frame())):
+        expected = [
+            [clean_and_validate._sheet_cell(r.get(h, "")) for h in clean_and_validate.SHEET_HEADERS]
+            for _, r in frame.iterrows()
+        ]
+        assert clean_and_validate._sheet_values(frame) == expected
+
+
+def test_write_to_production_rewrites_whole_tab_by_default():
+    headers = clean_and_validate.SHEET_HEADERS
+    sheets = FakeSheetsService({"Production": []})
+    source = _corpus_frame(3)
+
+    clean_and_validate._write_to_production(sheets, "sheet", headers, source)
+
+    [(method, params)] = sheets.requests
+    assert method == "values.update" and params["range"] == "'Production'!A1"
+    assert params["body"]["values"][0] == headers
+    assert len(sheets.rows("Production")) == 4
+
+
+def test_write_to_production_sends_only_changed_rows():
+    headers = clean_and_validate.SHEET_HEADERS
+    clean_row = {h: "" for h in headers}
+    clean_row.update(name_first="Ada", email="ada@example.org", uses_interpreters="FALSE")
+    source = pd.DataFrame(
+        [dict(clean_row), dict(clean_row, name_first=" Grace "), dict(clean_row, City="nyc"), dict(clean_row)],
+        columns=headers,
+    )
+    cleaned = clean_and_validate.clean_dataframe(source)
+    sheets = FakeSheetsService({"Production": []})
+
+    clean_and_validate._write_to_production(sheets, "sheet", headers, cleaned, original=source)
+
+    [(method, params)] = sheets.requests
+    assert method == "values.batchUpdate"
+    data = params["body"]["data"]
+    assert [d["range"] for d in data] == ["'Production'!A3:X4"]
+    assert data[0]["values"][0][0] == "Grace"
+    assert data[0]["values"][1][headers.index("City")] == "New York City"
+
+    sheets = FakeSheetsService({"Production": []})
+    clean_and_validate._write_to_production(sheets, "sheet", headers, cleaned.iloc[[0, 3]], original=source.iloc[[0, 3]])
+    assert sheets.requests == []
+
+    sheets = FakeSheetsService({"Production": []})
+    clean_and_validate._write_to_production(sheets, "sheet", list(reversed(headers)), cleaned, original=source)
+    assert [method for method, _ in sheets.requests] == ["values.update"]
+
+
+def _production_grid():
+    headers = clean_and_validate.SHEET_HEADERS
+    data = [[row[h] if row[h] is not None else "" for h in headers] for row in _corpus_frame(11).to_dict("records")]
+    data = [[str(v) for v in row] for row in data]
+    # interior blank rows, including a run that spans a page boundary
+    return [headers] + data[:3] + [[], []] + data[3:9] + [[]] + data[9:] + [[], []]
+
+
+@pytest.mark.parametrize("changed_rows_only", [False, True])
+def test_streaming_matches_single_read(capsys, changed_rows_only):
+    grid = _production_grid()
+    expected_sheets = FakeSheetsService({"Production": grid})
+    header_row, source = clean_and_validate._read_production_from_sheet(expected_sheets, "sheet")
+    expected_df = clean_and_validate.clean_dataframe(source)
+    clean_and_validate._write_to_production(expected_sheets, "sheet", header_row, expected_df)
+    capsys.readouterr()
+
+    sheets = FakeSheetsService({"Production": grid})
+    total = clean_and_validate.run_streaming(sheets, "sheet", 3, True, changed_rows_only)
+
+    assert total == len(expected_df)
+    assert capsys.readouterr().out == clean_and_validate._df_to_csv_string(expected_df)
+    assert sheets.rows("Production") == expected_sheets.rows("Production")
+    pages = [params["range"] for method, params in sheets.requests if method == "values.get"]
+    assert pages[:3] == ["'Production'!A1:X1", "'Production'!A2:X4", "'Production'!A5:X7"]
+
+
+def test_streaming_empty_production_prints_header_only(capsys):
+    sheets = FakeSheetsService({"Production": [clean_and_validate.SHEET_HEADERS]})
+    total = clean_and_validate.run_streaming(sheets, "sheet", 3, True)
+
+    assert total == 0
+    assert capsys.readouterr().out == clean_and_validate._df_to_csv_string(
+        pd.DataFrame(columns=clean_and_validate.PUBLIC_HEADERS)
+    )
+
+
+def test_parallel_cleaning_matches_serial(monkeypatch):
+    monkeypatch.setattr(clean_and_validate, "MIN_ROWS_PER_WORKER", 10)
+    source = _corpus_frame(90)
+    source.loc[:29, "name_first"] = None  # first chunk infers object dtype, the others str
+
+    serial = clean_and_validate.clean_dataframe(source)
+    parallel = clean_and_validate.clean_dataframe_parallel(source, workers=3)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert clean_and_validate._df_to_csv_string(parallel) == clean_and_validate._df_to_csv_string(serial)
+
+
+def test_memoized_cleaner_runs_once_per_distinct_value():
+    calls = []
+
+    def cleaner(series):
+        calls.append(len(series))
+        return clean_and_validate._clean_city_series(series)
+
+    values = pd.Series(["NYC", None, "Boston# comment", "NYC"] * 50, name="City")
+    stats = clean_and_validate.MemoStats()
+
+    result = clean_and_validate._memoized(values, cleaner, stats)
+
+    pd.testing.assert_series_equal(result, clean_and_validate._clean_city_series(values))
+    assert result.tolist()[:3] == ["New York City", "", "Boston"]
+    assert calls == [2, 50]  # distinct values, then the missing rows as they are
+    assert stats.rows["City"] == 200 and stats.distinct["City"] == 2
+    assert "City 2/200" in stats.summary()
+
+
+def test_memoized_cleaner_skips_non_text_columns():
+    values = pd.Series([1, 1.0, True, "1"], dtype=object, name="job_title")
+    stats = clean_and_validate.MemoStats()
+    cleaner = lambda s: clean_and_validate._clean_text_series(s, "job_title")  # noqa: E731
+
+    pd.testing.assert_series_equal(clean_and_validate._memoized(values, cleaner, stats), cleaner(values))
+    assert not stats.rows
+
+
+def test_phone_column_is_memoized_without_merging_numeric_cells():
+    df = pd.DataFrame({"phone_work": [1, 1.0, True, "1"]})
+    assert clean_and_validate.clean_dataframe(df)["phone_work"].tolist() == ["1", "1.0", "True", "1"]
+    stats = clean_and_validate.MemoStats()
+    df = pd.DataFrame({"phone_work": ["+16175551234"] * 3 + ["'+1 617  555 1234", None]})
+    cleaned = clean_and_validate.clean_dataframe(df, stats)["phone_work"].tolist()
+    assert cleaned[:4] == ["+16175551234"] * 3 + ["+1 617 555 1234"] and pd.isna(cleaned[4])
+    assert stats.rows["phone_work"] == 5 and stats.distinct["phone_work"] == 2
@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import validators
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import email_cleaning
+from email_cleaning import (
+    EMPTY,
+    FIRST_OF_MANY,
+    INVALID,
+    NORMALIZED,
+    VALID,
+    clean_email_column,
+    email_with_reason,
+    write_email_report,
+)
+from legacy_email_cleaning import legacy_clean_email
+
+CELLS = [
+    "ada@example.org", " Ada@Example.ORG ", "a@b.co; second@x.org", "bad; good@x.org", "bad-address",
+    "first.last+tag@sub.example.co.uk", "foo,bar@x.org", "x@y", None, float("nan"), pd.NA, "", "   ", "nan",
+    "under_score@x-y.org", "a..b@x.org", "-@x.org", "ünï@x.org", "two@@x.org", "someone@exam_ple.org",
+    "; real@x.org", "a" * 65 + "@x.org", "a@" + "b" * 64 + ".org", "x@xn--bcher-kva.example", "x@sub.123",
+    "o'brien@x.ie", "dash@-x.org", "a@b.c", "tab\t@x.org", "ok@x.org\n", "Prefer not to say",
+]
+
+
+@pytest.mark.parametrize("cell", CELLS)
+def test_verdicts_match_legacy_cleaner(cell):
+    assert email_with_reason(cell)[0] == legacy_clean_email(cell)
+
+
+def test_column_api_matches_scalar_and_reports_reasons():
+    series = pd.Series(CELLS, dtype=object, name="email")
+
+    emails, reasons = clean_email_column(series, with_reasons=True)
+
+    pd.testing.assert_series_equal(emails, series.apply(email_cleaning.first_valid_email))
+    assert reasons.tolist() == [email_with_reason(cell)[1] for cell in CELLS]
+    assert dict(zip(CELLS[:5], reasons[:5])) == {
+        "ada@example.org": VALID,
+        " Ada@Example.ORG ": NORMALIZED,
+        "a@b.co; second@x.org": FIRST_OF_MANY,
+        "bad; good@x.org": FIRST_OF_MANY,
+        "bad-address": INVALID,
+    }
+    assert reasons[8:13].tolist() == [EMPTY, EMPTY, EMPTY, EMPTY, EMPTY]  # None, NaN, NA, "", "   "
+
+
+def test_validator_verdicts_are_memoized(monkeypatch):
+    calls = []
+    monkeypatch.setattr(validators, "email", lambda e: calls.append(e) or True)
+    email_cleaning.is_valid_address.cache_clear()
+
+    for _ in range(3):
+        assert email_with_reason("ünï@x.org") == ("ünï@x.org", VALID)
+        assert email_with_reason("plain@x.org") == ("plain@x.org", VALID)
+
+    assert calls == ["ünï@x.org"]  # fast-path addresses never reach the validator
+    email_cleaning.is_valid_address.cache_clear()
+
+
+def test_email_report_lists_rows_without_addresses(tmp_path):
+    path = tmp_path / "report.csv"
+
+    counts = write_email_report(path, [VALID, INVALID, EMPTY, NORMALIZED])
+
+    assert path.read_text().splitlines() == ["sheet_row,reason", "3,invalid", "5,normalized"]
+    assert counts == {VALID: 1, INVALID: 1, EMPTY: 1, NORMALIZED: 1}
@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import geocode_working_copy
+from gazetteer import Gazetteer, build_index, normalize_name
+
+SOURCE = SCRIPT_DIR / "data" / "gazetteer.tsv"
+
+
+def _load(tmp_path):
+    return Gazetteer.load(tmp_path / "gazetteer.idx", SOURCE)
+
+
+def test_normalize_name_folds_accents_and_punctuation():
+    assert normalize_name("  St. Louis ") == "st louis"
+    assert normalize_name("Zürich") == "zurich"
+    assert normalize_name("東京") == "東京"
+
+
+def test_index_builds_once_and_answers_lookups(tmp_path):
+    gaz = _load(tmp_path)
+    index = tmp_path / "gazetteer.idx"
+    built_at = index.stat().st_mtime_ns
+
+    assert _load(tmp_path).lookup_city("tokyo") == gaz.lookup_city("東京")
+    assert index.stat().st_mtime_ns == built_at
+    assert gaz.lookup_country("U.S.A.") == "United States"
+    assert gaz.lookup_country("Boston") is None
+    place = gaz.lookup_city("Sao Paulo")
+    assert (place.name, place.country) == ("São Paulo", "Brazil")
+
+
+def test_lookup_city_requires_country_for_ambiguous_names(tmp_path):
+    gaz = _load(tmp_path)
+    assert gaz.lookup_city("London") is None
+    assert gaz.lookup_city("London", "United Kingdom").country == "United Kingdom"
+    assert gaz.lookup_city("Victoria", "Australia") is None
+
+
+def test_index_rejects_foreign_files(tmp_path):
+    path = build_index(SOURCE, tmp_path / "gazetteer.idx")
+    data = bytearray(path.read_bytes())
+    data[:4] = b"XXXX"
+    try:
+        Gazetteer(bytes(data))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_fill_locations_offline_fills_only_empty_city_and_country(tmp_path):
+    gaz = _load(tmp_path)
+    rows = [[""] * len(geocode_working_copy.HEADERS) for _ in range(4)]
+    rows[0][geocode_working_copy.WORK_ADDRESS_COL] = "55 Fruit St, Boston, MA 02114, USA"
+    rows[1][geocode_working_copy.WORK_ADDRESS_COL] = "7-3-1 Hongo, Bunkyo City, Tokyo 113-8655, Japan"
+    rows[2][geocode_working_copy.WORK_ADDRESS_COL] = "Level 3, 50 Flemington Rd, Melbourne, Victoria, Australia"
+    rows[2][geocode_working_copy.CITY_COL] = "Parkville"
+    rows[3][geocode_working_copy.WORK_ADDRESS_COL] = "Telehealth only"
+
+    assert geocode_working_copy.fill_locations_offline(rows, gaz) == 3
+
+    located = [(r[geocode_working_copy.CITY_COL], r[geocode_working_copy.COUNTRY_COL]) for r in rows]
+    assert located == [
+        ("Boston", "United States"),
+        ("Tokyo", "Japan"),
+        ("Parkville", "Australia"),
+        ("", ""),
+    ]
+
+
+def test_offline_locate_never_reads_states_or_provinces_as_cities(tmp_path):
+    gaz = _load(tmp_path)
+    locate = geocode_working_copy.offline_locate
+    cases = {
+        "Lafayette, LA 70508": ("", ""),
+        "1 Main St, Baton Rouge, LA 70808, USA": ("", "United States"),
+        "Suite 200, Metairie, LA": ("", ""),
+        "McGill, 1001 Decarie Blvd, Montreal, Quebec, Canada": ("Montreal", "Canada"),
+        "Sherbrooke, Quebec, Canada": ("", "Canada"),
+        "3 Main St, Albany, New York, USA": ("Albany", "United States"),
+        "Victoria, BC, Canada": ("Victoria", "Canada"),
+        "Level 3, 50 Flemington Rd, Melbourne, Victoria, Australia": ("Melbourne", "Australia"),
+        "55 Fruit St, Boston, MA 02114": ("Boston", "United States"),
+    }
+    for address, expected in cases.items():
+        found = locate(address, gaz)
+        assert (found["city"], found["country"]) == expected, address
+    assert gaz.lookup_city("LA") is None
+    assert gaz.lookup_city("SF") is None
+
+
+def test_concurrent_builds_do_not_collide(tmp_path):
+    import threading
+
+    errors = []
+
+    def build():
+        try:
+            build_index(SOURCE, tmp_path / "gazetteer.idx")
+        except Exception as e:  # pragma: no cover - the failure being tested for
+            errors.append(e)
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert _load(tmp_path).lookup_country("USA") == "United States"
+    assert [p.name for p in tmp_path.iterdir()] == ["gazetteer.idx"]
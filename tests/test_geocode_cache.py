@@ -0,0 +1,112 @@
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import geocode_working_copy
+from geocode_cache import GeocodeCache, ReverseGeocodeMemo, geohash, normalize_query
+
+RESULT = {
+    "geometry": {"location": {"lat": 42.36, "lng": -71.06}},
+    "address_components": [
+        {"long_name": "Boston", "types": ["locality"]},
+        {"long_name": "United States", "types": ["country"]},
+    ],
+}
+
+
+def test_normalize_query_collapses_case_and_spacing():
+    assert normalize_query("  1 Main St ,Boston,  MA ") == normalize_query("1 main st, boston, ma")
+
+
+def test_cache_round_trip_counts_hits_and_misses(tmp_path):
+    cache = GeocodeCache(tmp_path / "cache.sqlite3")
+    assert cache.get("1 Main St, Boston") == (False, None)
+    cache.put("1 Main St, Boston", RESULT)
+    assert cache.get("1 main st,boston") == (True, RESULT)
+    assert cache.get("1 Main St, Boston", "fr") == (False, None)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_persists_and_expires_by_ttl(tmp_path, monkeypatch):
+    path = tmp_path / "cache.sqlite3"
+    cache = GeocodeCache(path, ttl_days=1)
+    cache.put("Boston", RESULT)
+    cache.close()
+
+    reopened = GeocodeCache(path, ttl_days=1)
+    assert reopened.get("Boston")[0] is True
+    later = time.time() + 2 * 86400
+    monkeypatch.setattr("geocode_cache.time.time", lambda: later)
+    assert reopened.get("Boston") == (False, None)
+    assert len(reopened) == 0
+
+
+def test_cache_evicts_least_recently_used_entry(tmp_path):
+    cache = GeocodeCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.put("a", RESULT)
+    cache.put("b", RESULT)
+    cache.get("a")
+    cache.put("c", RESULT)
+    assert cache.get("a")[0] is True
+    assert cache.get("b")[0] is False
+    assert cache.get("c")[0] is True
+
+
+def test_smart_geocode_cache_hits_skip_api_and_rate_limiter(tmp_path, monkeypatch):
+    cache = GeocodeCache(tmp_path / "cache.sqlite3")
+    calls = []
+
+    class CountingLimiter:
+        acquired = 0
+
+        def acquire(self):
+            self.acquired += 1
+
+    limiter = CountingLimiter()
+    monkeypatch.setattr(geocode_working_copy, "geocode_address", lambda query, key: calls.append(query) or RESULT)
+
+    first = geocode_working_copy.smart_geocode("Mass General", "55 Fruit St, Boston", "key", cache, limiter)
+    second = geocode_working_copy.smart_geocode("Mass General", "55 Fruit St,  Boston", "key", cache, limiter)
+
+    assert first == second
+    assert len(calls) == 1
+    assert limiter.acquired == 1
+    assert cache.hits == 1
+
+
+def test_geohash_matches_reference_and_quantizes_nearby_points():
+    assert geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert geohash(35.6812, 139.7671, 6) == geohash(35.6815, 139.7675, 6)
+    assert geohash(35.6812, 139.7671, 6) != geohash(34.6937, 135.5023, 6)
+
+
+def test_reverse_memo_shares_results_between_nearby_coordinates(tmp_path, monkeypatch):
+    reverse_result = {"address_components": [{"long_name": "Sapporo", "types": ["locality"]}]}
+    calls = []
+    monkeypatch.setattr(
+        geocode_working_copy,
+        "reverse_geocode_language",
+        lambda lat, lng, key, language="en": calls.append((lat, lng)) or reverse_result,
+    )
+    cache = GeocodeCache(tmp_path / "cache.sqlite3")
+    memo = ReverseGeocodeMemo(6, cache)
+
+    for lat, lng in ((43.0618, 141.3545), (43.0619, 141.3546), (43.0620, 141.3544)):
+        assert geocode_working_copy._resolve_city_to_english("札幌市", lat, lng, "key", reverse_memo=memo) == "Sapporo"
+    assert len(calls) == 1
+    assert (memo.hits, memo.misses) == (2, 1)
+
+    fresh = ReverseGeocodeMemo(6, cache)
+    assert geocode_working_copy._resolve_city_to_english("札幌市", 43.0618, 141.3545, "key", reverse_memo=fresh) == "Sapporo"
+    assert len(calls) == 1
+    assert (fresh.hits, fresh.misses) == (1, 0)
+    # Reverse lookups leave the forward-query hit rate alone
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_native_names_in_gazetteer_skip_reverse_geocoding(monkeypatch):
+    monkeypatch.setattr(geocode_working_copy, "reverse_geocode_language", lambda *a, **k: 1 / 0)
+    assert geocode_working_copy._resolve_city_to_english("北京", 0.0, 0.0, "key") == "Beijing"
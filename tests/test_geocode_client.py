@@ -0,0 +1,108 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import geocode_client
+import geocode_working_copy
+from geocode_client import GeocodingClient
+
+OK_RESULT = {"geometry": {"location": {"lat": 1.0, "lng": 2.0}}, "address_components": []}
+
+
+@pytest.fixture
+def fake_geocode_server():
+    """Local stand-in for the Geocoding endpoint that replays scripted responses."""
+    responses = []
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            seen.append(parse_qs(urlparse(self.path).query))
+            code, payload = responses.pop(0) if responses else (200, {"status": "ZERO_RESULTS", "results": []})
+            body = json.dumps(payload).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/geocode/json", responses, seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_retries_server_errors_and_over_query_limit(fake_geocode_server):
+    url, responses, seen = fake_geocode_server
+    responses.extend([
+        (503, {}),
+        (200, {"status": "OVER_QUERY_LIMIT", "results": []}),
+        (200, {"status": "OK", "results": [OK_RESULT]}),
+    ])
+    sleeps = []
+    client = GeocodingClient(base_url=url, sleep=sleeps.append)
+
+    assert client.geocode("1 Main St", "key") == OK_RESULT
+    assert len(seen) == 3
+    assert seen[0]["address"] == ["1 Main St"]
+    assert client.retries == 2
+    assert client.status_counts == {"HTTP_503": 1, "OVER_QUERY_LIMIT": 1, "OK": 1}
+    assert 0.25 <= sleeps[0] <= 0.5 and 0.5 <= sleeps[1] <= 1.0
+    assert client.backoff_seconds == pytest.approx(sum(sleeps))
+
+
+def test_client_gives_up_after_max_retries(fake_geocode_server):
+    url, responses, _ = fake_geocode_server
+    responses.extend([(500, {})] * 3)
+    client = GeocodingClient(base_url=url, max_retries=2, sleep=lambda s: None)
+
+    assert client.geocode("1 Main St", "key") is None
+    assert client.status_counts == {"HTTP_500": 3}
+
+
+def test_client_does_not_retry_definitive_statuses():
+    class FakeResponse:
+        status_code = 200
+
+        def json(self):
+            return {"status": "ZERO_RESULTS", "results": []}
+
+    class FakeSession:
+        calls = 0
+
+        def get(self, url, params=None, timeout=None):
+            self.calls += 1
+            return FakeResponse()
+
+    session = FakeSession()
+    client = GeocodingClient(session=session, sleep=lambda s: None)
+
+    assert client.reverse_geocode(1.0, 2.0, "key") is None
+    assert session.calls == 1
+    assert client.summary() == "Geocoding API: 1 responses (ZERO_RESULTS 1), 0 retries"
+
+
+def test_geocode_address_uses_injected_default_client(fake_geocode_server):
+    url, responses, seen = fake_geocode_server
+    responses.append((200, {"status": "OK", "results": [OK_RESULT]}))
+    geocode_client.set_default_client(GeocodingClient(base_url=url))
+    try:
+        assert geocode_working_copy.geocode_address("1 Main St", "key") == OK_RESULT
+    finally:
+        geocode_client.set_default_client(None)
+    assert seen[0]["language"] == ["en"]
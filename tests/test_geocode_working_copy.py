@@ -1,10 +1,16 @@
+import re
 import sys
+import threading
 from pathlib import Path
 
+import pytest
+
 SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
 sys.path.insert(0, str(SCRIPT_DIR))
 
-from geocode_working_copy import format_geocode_log_summary
+import geocode_working_copy
+from geocode_working_copy import format_geocode_log_summary, plan_unique_queries
+from google_fakes import FakeGoogle, FakeSheetsService
 
 
 def test_format_geocode_log_summary_redacts_location_values():
@@ -28,3 +34,376 @@ def test_format_geocode_log_summary_redacts_location_values():
     assert "10001" not in summary
     assert "coordinates" in summary
     assert "address components" in summary
+
+
+def test_plan_unique_queries_groups_rows_sharing_institution_and_address():
+    jobs = [
+        (0, "Mass General", "55 Fruit St, Boston"),
+        (1, "Boston Children's", "300 Longwood Ave"),
+        (2, "mass general ", "55 Fruit St,Boston"),
+        (3, "nan", "300 Longwood Ave"),
+        (4, "", "300 Longwood Ave"),
+    ]
+
+    groups = plan_unique_queries(jobs)
+
+    assert [row_ids for _, _, row_ids in groups] == [[0, 2], [1], [3, 4]]
+    assert groups[0][:2] == ("Mass General", "55 Fruit St, Boston")
+
+
+def test_geocode_rows_preserves_input_order_under_concurrency(monkeypatch):
+    release = threading.Event()
+
+    def fake_smart_geocode(inst, addr, api_key, cache=None, limiter=None, reverse_memo=None, planner=None):
+        if inst == "slow":
+            release.wait(timeout=2)
+        else:
+            release.set()
+        return {"lat": "", "lng": "", "city": inst, "country": "", "street": "", "state": "", "zip": ""}
+
+    monkeypatch.setattr(geocode_working_copy, "smart_geocode", fake_smart_geocode)
+
+    results = list(
+        geocode_working_copy.geocode_rows([("slow", ""), ("fast", ""), ("third", "")], "key", concurrency=3)
+    )
+
+    assert [geo["city"] for geo, _ in results] == ["slow", "fast", "third"]
+
+
+def test_geocode_rows_reports_api_calls_per_unique_query(monkeypatch):
+    result = {
+        "geometry": {"location": {"lat": 42.36, "lng": -71.06}},
+        "address_components": [
+            {"long_name": "Boston", "types": ["locality"]},
+            {"long_name": "United States", "types": ["country"]},
+        ],
+    }
+    monkeypatch.setattr(geocode_working_copy, "geocode_address", lambda query, key: result)
+
+    results = list(geocode_working_copy.geocode_rows([("Mass General", "55 Fruit St")], "key"))
+
+    assert results[0][0]["city"] == "Boston"
+    assert results[0][1] == 1
+
+
+def _wc_row(first, inst, addr, lat="", lng="", street=""):
+    row = [""] * len(geocode_working_copy.HEADERS)
+    row[geocode_working_copy.HEADERS.index("name_first")] = first
+    row[geocode_working_copy.WORK_INSTITUTION_COL] = inst
+    row[geocode_working_copy.WORK_ADDRESS_COL] = addr
+    row[geocode_working_copy.LAT_COL] = lat
+    row[geocode_working_copy.LNG_COL] = lng
+    row[geocode_working_copy.ADDRESS_STREET_COL] = street
+    return row
+
+
+def test_fingerprints_detect_edited_addresses_only(tmp_path):
+    rows = [
+        _wc_row("Ada", "Clinic A", "1 Main St", "1.0", "2.0", "1 Main St"),
+        _wc_row("Grace", "Clinic B", "2 Main St", "3.0", "4.0", "2 Main St"),
+        _wc_row("Alan", "Clinic C", "3 Main St"),
+    ]
+    key = b"k" * 32
+    identities = geocode_working_copy.row_identities(rows, key)
+    path = tmp_path / "fingerprints.json"
+
+    assert geocode_working_copy.load_fingerprints(path, key) is None
+    assert geocode_working_copy.save_fingerprints(path, rows, identities, key) == 2
+    assert "Main St" not in path.read_text()
+
+    rows[1][geocode_working_copy.WORK_ADDRESS_COL] = "99 Other Ave"
+    fingerprints = geocode_working_copy.load_fingerprints(path, key)
+    to_process, changed = geocode_working_copy.select_rows_to_geocode(rows, False, fingerprints, identities, key)
+
+    assert to_process == [1, 2]
+    assert changed == 1
+
+
+def test_fingerprints_are_keyed_by_the_credentials(tmp_path):
+    """Without the secret the sidecar's hashes cannot be recomputed from guessed names or addresses."""
+    rows = [_wc_row("Ada", "Clinic A", "1 Main St", "1.0", "2.0", "1 Main St")]
+    (tmp_path / "key.json").write_text('{"private_key": "one"}')
+    key = geocode_working_copy.fingerprint_key(tmp_path / "key.json")
+    other = geocode_working_copy.fingerprint_key(tmp_path / "key.json") + b"x"
+    assert geocode_working_copy.row_identities(rows, key) != geocode_working_copy.row_identities(rows, other)
+    assert geocode_working_copy.input_fingerprint("Clinic A", "1 Main St", key) != (
+        geocode_working_copy.input_fingerprint("Clinic A", "1 Main St", other)
+    )
+
+    path = tmp_path / "fingerprints.json"
+    geocode_working_copy.save_fingerprints(path, rows, geocode_working_copy.row_identities(rows, key), key)
+    assert geocode_working_copy.load_fingerprints(path, key)
+    # A rotated key reads as no baseline rather than as every row having changed
+    assert geocode_working_copy.load_fingerprints(path, other) is None
+
+
+def test_row_identities_disambiguate_repeated_providers():
+    rows = [_wc_row("Ada", "A", "1"), _wc_row("Ada", "B", "2")]
+    first, second = geocode_working_copy.row_identities(rows, b"k")
+    assert first != second
+    assert second.startswith(first)
+
+
+def test_changed_ranges_coalesces_adjacent_cells_and_rows():
+    original = [
+        ["a", "b", "c", "d"],
+        ["e", "f", "g"],
+        ["h", "i", "j", "k"],
+    ]
+    updated = [
+        ["a", "B", "C", "d"],
+        ["e", "F", "G", ""],
+        ["h", "i", "j", "K"],
+    ]
+
+    ranges = geocode_working_copy.changed_ranges(original, updated)
+
+    assert ranges == [
+        {"range": "'Working Copy'!B2:C3", "values": [["B", "C"], ["F", "G"]]},
+        {"range": "'Working Copy'!D4:D4", "values": [["K"]]},
+    ]
+
+
+def test_write_working_copy_sends_batch_update_only_when_cells_change():
+    header = list(geocode_working_copy.HEADERS)
+    original_row = _wc_row("Ada", "Clinic", "1 Main St")
+    rows = [header, list(original_row)]
+    sheets = FakeSheetsService({"Working Copy": rows})
+
+    assert geocode_working_copy.write_working_copy(sheets, "sheet", rows, [list(original_row)]) == 0
+    assert sheets.requests == []
+
+    edited = list(original_row)
+    edited[geocode_working_copy.LAT_COL] = "1.5"
+    edited[geocode_working_copy.LNG_COL] = "2.5"
+    assert geocode_working_copy.write_working_copy(sheets, "sheet", rows, [edited]) == 2
+    [(method, params)] = sheets.requests
+    assert method == "values.batchUpdate"
+    assert params["body"]["data"] == [{"range": "'Working Copy'!Q2:R2", "values": [["1.5", "2.5"]]}]
+    stored = sheets.rows("Working Copy")[1]
+    assert stored[geocode_working_copy.LAT_COL:geocode_working_copy.LNG_COL + 1] == ["1.5", "2.5"]
+
+    reordered = [list(reversed(header)), list(original_row)]
+    geocode_working_copy.write_working_copy(sheets, "sheet", reordered, [edited])
+    assert sheets.requests[-1][0] == "values.update"
+
+
+def _legacy_is_valid_city(city):
+    if not city or len(city) < 2 or len(city) > 50:
+        return False
+    if re.match(r"^\d+$", city):
+        return False
+    for term in geocode_working_copy.REJECT_TERMS:
+        if re.search(r"\b" + re.escape(term) + r"\b", city.lower()):
+            return False
+    if re.search(r"\d", city):
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "fragment",
+    [
+        "Boston", "New York", "MA 02114", "USA", "Great Ormond St", "Level 3",
+        "P.O. Box 12", "po box", "Stockholm", "Northampton", "Westminster",
+        "Upper Darby", "Dr", "Drs Clinic", "São Paulo - SP", "Bunkyo City",
+        "Ca", "Carlsbad", "Ohio", "M5G 1X8", "1234", "", "x", "Mi Casa",
+        "Medical Center Drive", "Centreville", "Saint-Étienne", "Oh",
+    ],
+)
+def test_is_valid_city_matches_per_term_regex_semantics(fragment):
+    assert geocode_working_copy.is_valid_city(fragment) == _legacy_is_valid_city(fragment)
+
+
+def _planner_results(monkeypatch, adaptive):
+    """Geocode 20 rows where "<institution>, <address>" never resolves but the address does."""
+    from attempt_planner import AttemptPlanner
+
+    result = {
+        "geometry": {"location": {"lat": 42.36, "lng": -71.06}},
+        "address_components": [
+            {"long_name": "Boston", "types": ["locality"]},
+            {"long_name": "United States", "types": ["country"]},
+        ],
+    }
+    monkeypatch.setattr(
+        geocode_working_copy, "geocode_address", lambda query, key: None if query.startswith("Clinic") else result
+    )
+    jobs = [(f"Clinic {i}", f"{i} Main St, Boston, MA 02114") for i in range(20)] + [("", "Telehealth only")]
+    planner = AttemptPlanner(adaptive=adaptive)
+    return list(geocode_working_copy.geocode_rows(jobs, "key", planner=planner)), planner
+
+
+def test_adaptive_attempt_order_cuts_calls_without_losing_results(monkeypatch):
+    fixed, fixed_planner = _planner_results(monkeypatch, adaptive=False)
+    adaptive, planner = _planner_results(monkeypatch, adaptive=True)
+
+    assert [geo for geo, _ in adaptive] == [geo for geo, _ in fixed]
+    assert sum(calls for _, calls in fixed) == 41
+    assert sum(calls for _, calls in adaptive) < 30
+    assert planner.reordered > 0
+    # A row without an institution sends its address once, not twice
+    assert fixed[-1][1] == adaptive[-1][1] == 1
+    assert fixed_planner.repeats_skipped == 1
+    assert "lookups per query" in planner.summary()
+
+
+def test_attempt_order_keeps_fixed_results_until_the_run_favours_another_attempt(monkeypatch):
+    """Every query is complete, each with its own coordinates: the order picks which one a row keeps."""
+    from attempt_planner import AttemptPlanner
+
+    def result(lat):
+        return {
+            "geometry": {"location": {"lat": lat, "lng": -lat}},
+            "address_components": [
+                {"long_name": "Boston", "types": ["locality"]},
+                {"long_name": "United States", "types": ["country"]},
+            ],
+        }
+
+    by_query = {
+        "MGH, 55 Fruit St, Boston, MA 02114": result(1.0),
+        "55 Fruit St, Boston, MA 02114": result(2.0),
+        "MGH": result(3.0),
+    }
+    monkeypatch.setattr(geocode_working_copy, "geocode_address", lambda query, key: by_query[query])
+    args = ("MGH", "55 Fruit St, Boston, MA 02114", "key")
+
+    unplanned = geocode_working_copy.smart_geocode(*args)
+    assert (unplanned["lat"], unplanned["lng"]) == (1.0, -1.0)
+    fixed = AttemptPlanner(adaptive=False)
+    adaptive = AttemptPlanner()
+    assert geocode_working_copy.smart_geocode(*args, planner=fixed) == unplanned
+    assert geocode_working_copy.smart_geocode(*args, planner=adaptive) == unplanned
+
+    # Once the run's rows of this shape favour the address query, a row keeps the
+    # address result (score 4.3, its coordinates) instead of the combined one (4.5)
+    shape = adaptive.plan(*args[:2])[0]
+    for _ in range(6):
+        for planner in (fixed, adaptive):
+            planner.record(shape, 0, complete=False)
+            planner.record(shape, 1, complete=True)
+    assert geocode_working_copy.smart_geocode(*args, planner=fixed) == unplanned
+    traded = geocode_working_copy.smart_geocode(*args, planner=adaptive)
+    assert (traded["lat"], traded["lng"]) == (2.0, -2.0)
+    assert traded["city"] == unplanned["city"] and traded["country"] == unplanned["country"]
+
+
+def _legacy_remap(rows):
+    source_idx = {str(h).strip(): i for i, h in enumerate(rows[0])}
+    return [
+        [raw[source_idx[h]] if h in source_idx and source_idx[h] < len(raw) else "" for h in geocode_working_copy.HEADERS]
+        for raw in rows[1:]
+    ]
+
+
+def test_project_rows_pads_and_remaps_like_per_header_lookup():
+    header = list(geocode_working_copy.HEADERS)
+    full = _wc_row("Ada", "Clinic", "1 Main St", "1.0", "2.0", "1 Main St")
+    trimmed = full[: geocode_working_copy.LNG_COL + 1]  # the API drops trailing empty cells
+    canonical = [header, full, trimmed, [], full + ["extra"]]
+    reordered = [[" City "] + list(reversed(header[1:])) + ["notes"], ["Boston", "x", "y"], []]
+    partial = [header[:5] + ["City", "unknown"], header[:5] + ["Paris", "?", "overflow"]]
+
+    for rows in (canonical, reordered, partial):
+        projected = geocode_working_copy.project_rows(rows)
+        assert projected == _legacy_remap(rows)
+        assert all(len(row) == len(header) for row in projected)
+    projected = geocode_working_copy.project_rows(canonical)
+    projected[0][geocode_working_copy.LAT_COL] = "9.9"
+    assert full[geocode_working_copy.LAT_COL] == "1.0"  # rows are copies; the original stays the diff base
+
+
+_MAIN_RESULT = {
+    "geometry": {"location": {"lat": 42.36, "lng": -71.06}},
+    "address_components": [
+        {"long_name": "1", "types": ["street_number"]},
+        {"long_name": "Boston", "types": ["locality"]},
+        {"long_name": "United States", "types": ["country"]},
+    ],
+}
+
+
+def _fake_sheet(monkeypatch, tmp_path, rows):
+    """Point main() at a FakeGoogle holding a Working Copy of `rows`; the caller resets the client factory."""
+    import sheet_io
+
+    google = FakeGoogle({"Working Copy": [list(geocode_working_copy.HEADERS)] + rows})
+    for name in ("key.json", "sheet-id.txt", "api-key.txt"):
+        (tmp_path / name).write_text("x")
+    monkeypatch.setattr(geocode_working_copy, "CREDENTIALS_PATH", tmp_path / "key.json")
+    monkeypatch.setattr(geocode_working_copy, "SHEET_ID_PATH", tmp_path / "sheet-id.txt")
+    monkeypatch.setattr(geocode_working_copy, "API_KEY_PATH", tmp_path / "api-key.txt")
+    sheet_io.set_client_factory(google.client_factory)
+    return google
+
+
+def test_fingerprints_from_a_previous_run_trigger_regeocoding_of_edited_addresses(monkeypatch, tmp_path):
+    """The CI path: run 1 records fingerprints, the file is carried over, run 2 sees the edit."""
+    import sheet_io
+
+    queries = []
+    monkeypatch.setattr(geocode_working_copy, "geocode_address", lambda q, key: queries.append(q) or _MAIN_RESULT)
+    google = _fake_sheet(monkeypatch, tmp_path, [_wc_row("Ada", "Clinic", "1 Main St"), _wc_row("Bo", "Lab", "2 Elm St")])
+    fingerprints = tmp_path / "fingerprints.json"
+    argv = ["geocode_working_copy.py", "--no-cache", "--no-snapshot", "--fingerprints-path", str(fingerprints)]
+    monkeypatch.setattr(sys, "argv", argv)
+    try:
+        geocode_working_copy.main()
+        assert fingerprints.exists()
+        assert len(queries) == 2
+        queries.clear()
+        geocode_working_copy.main()
+        assert queries == []
+
+        google.sheets.tabs["Working Copy"][2][geocode_working_copy.WORK_ADDRESS_COL] = "9 New Rd"
+        geocode_working_copy.main()
+        assert queries == ["Lab, 9 New Rd"]
+    finally:
+        sheet_io.set_client_factory(None)
+
+
+def test_main_uses_an_injected_client_and_restores_the_previous_default(monkeypatch, tmp_path):
+    import geocode_client
+    import sheet_io
+
+    class RecordingClient(geocode_client.GeocodingClient):
+        def geocode(self, address, api_key, language="en"):
+            queries.append(address)
+            return _MAIN_RESULT
+
+    queries = []
+    injected = RecordingClient(base_url="http://127.0.0.1:9/unused")
+    _fake_sheet(monkeypatch, tmp_path, [_wc_row("Ada", "Clinic", "1 Main St")])
+    monkeypatch.setattr(sys, "argv", ["geocode_working_copy.py", "--no-cache", "--no-snapshot", "--no-fingerprints"])
+    geocode_client.set_default_client(injected)
+    try:
+        geocode_working_copy.main()
+        assert queries == ["Clinic, 1 Main St"]
+        assert geocode_client.get_default_client() is injected
+
+        # Nothing injected: main builds its own client for the run and leaves no default behind
+        geocode_client.set_default_client(None)
+        monkeypatch.setattr(geocode_working_copy, "geocode_address", lambda q, key: _MAIN_RESULT)
+        geocode_working_copy.main()
+        assert geocode_client.set_default_client(None) is None
+    finally:
+        geocode_client.set_default_client(None)
+        sheet_io.set_client_factory(None)
+
+
+def test_main_keeps_the_fixed_attempt_order_unless_adaptive_is_requested(monkeypatch, tmp_path, capsys):
+    import sheet_io
+
+    monkeypatch.setattr(geocode_working_copy, "geocode_address", lambda q, key: _MAIN_RESULT)
+    argv = ["geocode_working_copy.py", "--no-cache", "--no-snapshot", "--no-fingerprints", "--backfill-all-records"]
+    try:
+        _fake_sheet(monkeypatch, tmp_path, [_wc_row("Ada", "Clinic", "1 Main St")])
+        monkeypatch.setattr(sys, "argv", argv)
+        geocode_working_copy.main()
+        assert "Query attempts (fixed order)" in capsys.readouterr().out
+        monkeypatch.setattr(sys, "argv", argv + ["--adaptive-attempt-order"])
+        geocode_working_copy.main()
+        assert "Query attempts (adaptive order)" in capsys.readouterr().out
+    finally:
+        sheet_io.set_client_factory(None)
@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import clean_and_validate
+import geocode_client
+import geocode_working_copy
+import sheet_io
+from geocode_client import GeocodingClient
+from google_fakes import FakeGeocodeServer, FakeGoogle, FakeSheetsService, PayloadTooLarge, parse_a1
+
+
+def test_parse_a1_forms():
+    assert parse_a1("'Working Copy'!A:Y") == ("Working Copy", 0, 0, None, 24)
+    assert parse_a1("'Production'!A2:X7") == ("Production", 1, 0, 6, 23)
+    assert parse_a1("'Production'!A1") == ("Production", 0, 0, 0, 0)
+    assert parse_a1("'It''s'!AA3:AB") == ("It's", 2, 26, None, 27)
+    with pytest.raises(ValueError):
+        parse_a1("'Tab'!1A")
+
+
+def test_reads_are_trimmed_like_the_sheets_api():
+    sheets = FakeSheetsService({"T": [["h1", "h2", ""], ["a", "", ""], ["", ""], ["b", "c"], [""], []]})
+    values = sheets.spreadsheets().values()
+    assert values.get(spreadsheetId="x", range="'T'!A:C").execute()["values"] == [["h1", "h2"], ["a"], [], ["b", "c"]]
+    assert values.get(spreadsheetId="x", range="'T'!B2:C3").execute().get("values") is None
+    res = values.batchGet(spreadsheetId="x", ranges=["'T'!A1:B1", "'T'!B4"]).execute()
+    assert [r.get("values") for r in res["valueRanges"]] == [[["h1", "h2"]], [["c"]]]
+
+
+def test_writes_move_drive_stamp_and_respect_limits():
+    slept = []
+    google = FakeGoogle({"T": [["h"]]}, latency=0.1, seconds_per_kib=1.0, max_request_bytes=200, sleep=slept.append)
+    values = google.sheets.spreadsheets().values()
+    before = google.drive.files().get(fileId="x", fields="modifiedTime").execute()["modifiedTime"]
+    values.update(spreadsheetId="x", range="'T'!B2", valueInputOption="RAW", body={"values": [[1, True, None]]}).execute()
+    values.batchUpdate(spreadsheetId="x", body={"data": [{"range": "'T'!A3:A3", "values": [["z"]]}]}).execute()
+    assert google.sheets.rows("T") == [["h"], ["", "1", "TRUE"], ["z"]]
+    assert google.drive.files().get(fileId="x", fields="modifiedTime").execute()["modifiedTime"] != before
+    assert google.sheets.calls == {"values.update": 1, "values.batchUpdate": 1}
+    assert all(s > 0.1 for s in slept)
+    with pytest.raises(PayloadTooLarge):
+        values.update(spreadsheetId="x", range="'T'!A1", body={"values": [["x" * 300]]}).execute()
+    assert google.sheets.rows("T")[0] == ["h"]
+    meta = google.sheets.spreadsheets().get(spreadsheetId="x", ranges="'T'!A1", fields="sheets").execute()
+    assert meta["sheets"][0]["properties"]["gridProperties"]["rowCount"] == 1000
+
+
+def test_fake_geocode_server_is_deterministic_and_can_throttle():
+    with FakeGeocodeServer(over_query_limit_every=2) as server:
+        client = GeocodingClient(base_url=server.url, backoff_base=0, sleep=lambda s: None)
+        first = client.geocode("1 Main St, Boston", "key")
+        assert first == client.geocode("1 Main St, Boston", "key")
+        assert client.geocode("Telehealth only", "key") is None
+        assert client.reverse_geocode(35.68, 139.65, "key", "en")["address_components"][2]["long_name"] == "Tokyo"
+    assert server.statuses["OVER_QUERY_LIMIT"] == client.retries > 0
+    assert server.statuses["ZERO_RESULTS"] == 1
+
+
+def _fake_environment(monkeypatch, tmp_path, tabs):
+    google = FakeGoogle(tabs)
+    for name in ("key.json", "sheet-id.txt", "api-key.txt"):
+        (tmp_path / name).write_text("fake")
+    for module in (geocode_working_copy, clean_and_validate):
+        monkeypatch.setattr(module, "CREDENTIALS_PATH", tmp_path / "key.json")
+        monkeypatch.setattr(module, "SHEET_ID_PATH", tmp_path / "sheet-id.txt")
+    monkeypatch.setattr(geocode_working_copy, "API_KEY_PATH", tmp_path / "api-key.txt")
+    sheet_io.set_client_factory(google.client_factory)
+    return google
+
+
+@pytest.fixture
+def reset_client_factory():
+    yield
+    sheet_io.set_client_factory(None)
+    geocode_client.set_default_client(None)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_mains_run_end_to_end_against_fakes(monkeypatch, tmp_path, capsys, reset_client_factory, stream):
+    headers = list(geocode_working_copy.HEADERS)
+    wc_row = [""] * len(headers)
+    wc_row[headers.index("work_address")] = "55 Fruit St, Boston, MA"
+    prod_row = [""] * len(clean_and_validate.SHEET_HEADERS)
+    prod_row[clean_and_validate.SHEET_HEADERS.index("email")] = "Someone@Example.org"
+    prod_row[clean_and_validate.SHEET_HEADERS.index("phone_work")] = "'+1 617 555 0100"
+    google = _fake_environment(
+        monkeypatch,
+        tmp_path,
+        {"Working Copy": [headers, wc_row], "Production": [clean_and_validate.SHEET_HEADERS, [], prod_row]},
+    )
+    snapshot = ["--snapshot-path", str(tmp_path / "snapshot.pickle")]
+
+    with FakeGeocodeServer() as server:
+        geocode_client.set_default_client(GeocodingClient(base_url=server.url))
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["geocode_working_copy.py", "--cache-path", str(tmp_path / "cache.sqlite3"),
+             "--fingerprints-path", str(tmp_path / "fp.json")] + snapshot,
+        )
+        geocode_working_copy.main()
+    assert server.requests >= 1
+    row = google.sheets.rows("Working Copy")[1]
+    assert row[geocode_working_copy.LAT_COL] and row[geocode_working_copy.CITY_COL]
+
+    argv = ["clean_and_validate.py", "--output-stdout"] + (["--stream", "--chunk-rows", "1"] if stream else snapshot)
+    monkeypatch.setattr(sys, "argv", argv)
+    clean_and_validate.main()
+    production = google.sheets.rows("Production")
+    assert len(production) == 3
+    assert production[2][clean_and_validate.SHEET_HEADERS.index("email")] == "someone@example.org"
+    assert "+1 617 555 0100" in capsys.readouterr().out
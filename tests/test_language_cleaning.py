@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import language_cleaning
+from language_cleaning import clean_languages, scan_language_column, uses_interpreters
+from legacy_language_cleaning import legacy_clean_languages, legacy_uses_interpreters_func
+
+CELLS = [
+    "English", "English, French", "Spanish, English, Spanish", "english and SPANISH", "English & French",
+    "and English", "English and", "& Spanish", "English; French|German/Italian\nDutch", "Prefer not to say",
+    "English (prefer not to say)", "English with interpreter services available", "French (some)",
+    "Eng(x)lish", "English, Other", "Translation", "Limited Spanish", "limited english, Spanish",
+    "English with use of Language Line", "All other languages with interpretation services",
+    "Others with provided interpreter services", "We also use interpreters", "Globo interpreter",
+    "Interpreters", "English, And", "Zulu, Afrikaans, English", "Français, Español", "日本語", "English.",
+    "E.n.g.l.i.s.h", "  English  ,,  , French  ", "interpreter present", "English (interpreter)",
+    "other languages with an interpreter present", "ASL", "Tagalog/Filipino", "", "   ", None, float("nan"),
+    pd.NA, 42, "english, ENGLISH, English",
+]
+
+
+@pytest.mark.parametrize("cell", CELLS)
+def test_scan_matches_legacy_cleaners(cell):
+    assert clean_languages(cell) == legacy_clean_languages(cell)
+    assert uses_interpreters(cell) == legacy_uses_interpreters_func(cell)
+
+
+def test_column_scan_matches_per_cell_results():
+    series = pd.Series(CELLS * 3, dtype=object, name="language_spoken")
+
+    languages, detected = scan_language_column(series)
+
+    pd.testing.assert_series_equal(languages, series.apply(legacy_clean_languages))
+    assert detected.tolist() == [legacy_uses_interpreters_func(v) for v in series]
+
+    text = series.where(series.map(lambda v: isinstance(v, str)), None)
+    languages, detected = scan_language_column(text)
+    pd.testing.assert_series_equal(languages, text.apply(legacy_clean_languages))
+    assert detected.tolist() == [legacy_uses_interpreters_func(v) for v in text]
+
+
+def test_each_distinct_cell_is_scanned_once():
+    language_cleaning._scan_text.cache_clear()
+    series = pd.Series(["English with interpreter present", "Spanish"] * 100)
+
+    scan_language_column(series)
+    assert clean_languages("Spanish") == "Spanish"
+    assert uses_interpreters("English with interpreter present") is True
+
+    info = language_cleaning._scan_text.cache_info()
+    assert info.misses == 2 and info.hits == 2
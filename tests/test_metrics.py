@@ -0,0 +1,93 @@
+import json
+import pickle
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import clean_and_validate
+import geocode_working_copy
+from metrics import Metrics
+
+
+def test_stages_accumulate_and_merge_across_processes():
+    metrics = Metrics("test")
+    for _ in range(2):
+        with metrics.stage("clean.emails"):
+            pass
+    metrics.count("rows", 3)
+    metrics.count_all("api_status", {"OK": 2, "ZERO_RESULTS": 1})
+
+    worker = pickle.loads(pickle.dumps(Metrics()))
+    worker.add_time("clean.emails", 1.5)
+    worker.count("rows", 4)
+    metrics.merge(worker)
+
+    out = metrics.to_dict()
+    assert out["script"] == "test"
+    assert out["stages"]["clean.emails"] >= 1.5
+    assert out["counters"] == {"api_status.OK": 2, "api_status.ZERO_RESULTS": 1, "rows": 7}
+
+
+def _fake_credentials(monkeypatch, module, tmp_path):
+    creds = tmp_path / "key.json"
+    creds.write_text("{}")
+    sheet_id = tmp_path / "sheet-id.txt"
+    sheet_id.write_text("spreadsheet-id")
+    monkeypatch.setattr(module, "CREDENTIALS_PATH", creds)
+    monkeypatch.setattr(module, "SHEET_ID_PATH", sheet_id)
+
+
+def test_clean_and_validate_metrics_have_stages_and_no_provider_data(monkeypatch, tmp_path):
+    headers = clean_and_validate.SHEET_HEADERS
+    row = {h: "" for h in headers}
+    row.update(name_first="Zelda", email="zelda@private.example.org", phone_work="+1 617 555 0199", City="nyc")
+    source = clean_and_validate.pd.DataFrame([row], columns=headers)
+    _fake_credentials(monkeypatch, clean_and_validate, tmp_path)
+    monkeypatch.setattr(clean_and_validate, "get_clients", lambda path: (object(), None))
+    monkeypatch.setattr(
+        clean_and_validate,
+        "_read_production_from_sheet",
+        lambda sheets, spreadsheet_id, drive, snapshot_path: (headers, source.copy()),
+    )
+    monkeypatch.setattr(clean_and_validate, "_write_to_production", lambda *args, **kwargs: None)
+    out = tmp_path / "metrics.json"
+    monkeypatch.setattr(sys, "argv", ["clean_and_validate.py", "--metrics-out", str(out)])
+
+    clean_and_validate.main()
+
+    text = out.read_text()
+    data = json.loads(text)
+    assert {"read", "clean", "write", "clean.emails", "clean.phones"} <= set(data["stages"])
+    assert data["counters"]["rows"] == 1
+    for value in ("Zelda", "zelda", "private.example", "555", "New York", "nyc"):
+        assert value not in text
+
+
+def test_geocode_metrics_written_even_for_offline_runs(monkeypatch, tmp_path):
+    header = list(geocode_working_copy.HEADERS)
+    row = [""] * len(header)
+    row[header.index("name_first")] = "Zelda"
+    row[header.index("work_address")] = "1 Secret Lane, Boston"
+    row[geocode_working_copy.CITY_COL] = "NY"
+    _fake_credentials(monkeypatch, geocode_working_copy, tmp_path)
+    monkeypatch.setattr(geocode_working_copy, "get_clients", lambda path: (object(), None))
+    monkeypatch.setattr(
+        geocode_working_copy,
+        "read_ranges",
+        lambda sheets, spreadsheet_id, ranges, drive, snapshot_path: ({ranges[0]: [header, row]}, False),
+    )
+    monkeypatch.setattr(geocode_working_copy, "write_working_copy", lambda *args: 1)
+    out = tmp_path / "metrics.json"
+    monkeypatch.setattr(sys, "argv", ["geocode_working_copy.py", "--fix-cities-only", "--metrics-out", str(out)])
+
+    geocode_working_copy.main()
+
+    text = out.read_text()
+    data = json.loads(text)
+    assert {"read", "normalize_cities", "offline_fill", "write"} <= set(data["stages"])
+    assert data["counters"]["rows"] == 1
+    assert data["counters"]["cities_fixed"] == 1
+    for value in ("Zelda", "Secret", "Boston", "New York"):
+        assert value not in text
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import geocode_working_copy
+from metro_index import MetroIndex
+
+
+def test_lookup_prefers_smallest_containing_box_across_cells():
+    index = MetroIndex([
+        ("Region", "X", 0.0, 3.0, 0.0, 3.0, []),
+        ("Town", "X", 1.2, 1.4, 1.2, 1.4, ["Bourg"]),
+    ])
+    assert index.lookup(1.3, 1.3).city == "Town"
+    assert index.lookup(2.5, 0.5).city == "Region"
+    assert index.lookup(-5.0, -5.0) is None
+    assert "bourg" in index.lookup(1.3, 1.3).aliases
+
+
+def test_bundled_table_covers_former_nyc_bounds():
+    assert geocode_working_copy.metro_for_coords("40.7128", "-74.0060").city == "New York City"
+    assert geocode_working_copy.metro_for_coords(35.68, 139.69).city == "Tokyo"
+    assert geocode_working_copy.metro_for_coords("", "") is None
+
+
+def test_normalize_cities_fills_empty_city_from_metro_box():
+    rows = [[""] * len(geocode_working_copy.HEADERS) for _ in range(3)]
+    rows[0][geocode_working_copy.LAT_COL], rows[0][geocode_working_copy.LNG_COL] = "-33.87", "151.21"
+    rows[1][geocode_working_copy.CITY_COL] = "NY"
+    rows[2][geocode_working_copy.LAT_COL], rows[2][geocode_working_copy.LNG_COL] = "0.5", "0.5"
+
+    assert geocode_working_copy.normalize_cities(rows) == 2
+    assert [r[geocode_working_copy.CITY_COL] for r in rows] == ["Sydney", "New York City", ""]
+
+
+def test_native_city_names_resolve_without_reverse_geocode(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("reverse geocode should not be called")
+
+    monkeypatch.setattr(geocode_working_copy, "reverse_geocode_language", fail)
+    assert geocode_working_copy._resolve_city_to_english("東京都", 35.68, 139.69, "key") == "Tokyo"
+    assert geocode_working_copy._resolve_city_to_english("서울특별시", 37.57, 126.98, "key") == "Seoul"
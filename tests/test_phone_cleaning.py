@@ -0,0 +1,89 @@
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from phone_cleaning import PhoneNumber, clean_phone, clean_phones, parse_phone
+
+CELLS = [
+    "+1 404 555 1212", "'+91-044-28296490", "'=+44 20 7946 0958", "#ERROR!", "#error!", "Prefer not to say",
+    "", "   ", None, float("nan"), pd.NA, 6175551234, "617-555-1234 / 617-555-9999", "office / +1 617 555 1234",
+    "n/a", "+1  617   555 1234", "(617) 555-1234 ext. 22", "'@home", "+44 (0)20 7946 0958",
+]
+
+
+# clean_phone before the patterns were precompiled
+def _legacy_clean_phone(val):
+    if val is None:
+        return None
+    try:
+        if val != val:
+            return None
+    except TypeError:
+        pass
+    val_str = str(val).strip()
+    if re.match(r"^'[=+\-@]", val_str):
+        val_str = val_str[1:].strip()
+    if val_str.lower() in ("prefer not to say", "") or val_str.upper() == "#ERROR!":
+        return None
+    if "/" in val_str:
+        parts = [p.strip() for p in val_str.split("/")]
+        for part in parts:
+            if re.search(r"(\+?\d[\d\s\-\(\)]{5,})", part):
+                val_str = part
+                break
+    val_str = re.sub(r" {2,}", " ", val_str.strip())
+    return val_str if val_str else None
+
+
+@pytest.mark.parametrize("cell", CELLS)
+def test_clean_phone_matches_uncompiled_version(cell):
+    assert clean_phone(cell) == _legacy_clean_phone(cell)
+
+
+def test_clean_phones_matches_scalar_apply():
+    series = pd.Series(CELLS, dtype=object, name="phone_work")
+    pd.testing.assert_series_equal(clean_phones(series), series.apply(clean_phone))
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("+1 404 555 1212", PhoneNumber("1", "4045551212")),
+        ("+16175551234", PhoneNumber("1", "6175551234")),
+        ("+44 (0)20 7946 0958", PhoneNumber("44", "2079460958")),
+        ("0044 20 7946 0958", PhoneNumber("44", "2079460958")),
+        ("+91-044-28296490", PhoneNumber("91", "4428296490")),
+        ("+39 06 1234 5678", PhoneNumber("39", "0612345678")),
+        ("+353 1 234 5678", PhoneNumber("353", "12345678")),
+        ("(617) 555-1234 ext. 22", PhoneNumber("", "6175551234")),
+        ("617.555.1234 x12", PhoneNumber("", "6175551234")),
+        ("123", None),
+        ("call the front desk", None),
+    ],
+)
+def test_parse_phone(text, expected):
+    assert parse_phone(text) == expected
+
+
+@pytest.mark.parametrize(
+    "cell",
+    ["+16175551234", "+442079460958", "617-555-1234", "(617) 555-1234", "617.555.1234", "+1 617 555 1234", "6175551234"],
+)
+def test_clean_phones_fast_path_only_takes_values_clean_phone_keeps(cell):
+    series = pd.Series([cell, " " + cell, "'" + cell, cell + " / 555"], dtype=object)
+    assert clean_phone(cell) == cell
+    assert clean_phones(series).tolist() == [clean_phone(v) for v in series]
+
+
+def test_clean_phones_handles_string_dtype_and_non_text_columns():
+    text = pd.Series(["+16175551234", None, "'+1 617  555 1234"], dtype="str")
+    pd.testing.assert_series_equal(clean_phones(text), text.apply(clean_phone))
+    numbers = pd.Series([6175551234, 1, 1.0, True], dtype=object)
+    assert clean_phones(numbers).tolist() == ["6175551234", "1", "1.0", "True"]
+    assert clean_phones(pd.Series([], dtype=object)).empty
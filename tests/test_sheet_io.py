@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import sheet_io
+from sheet_io import PRODUCTION_RANGE, WORKING_COPY_RANGE, batch_get, read_ranges
+
+
+from google_fakes import FakeDriveService, FakeGoogle, FakeSheetsService
+
+TABS = {
+    "Working Copy": [["name_first"], ["Ada"], ["Grace"]],
+    "Production": [["name_first"], ["Ada"]],
+}
+
+
+def test_batch_get_maps_value_ranges_back_to_requested_ranges():
+    sheets = FakeSheetsService({"Working Copy": TABS["Working Copy"], "Production": []})
+
+    result = batch_get(sheets, "sheet", [WORKING_COPY_RANGE, PRODUCTION_RANGE])
+
+    assert result == {WORKING_COPY_RANGE: TABS["Working Copy"], PRODUCTION_RANGE: []}
+    assert sheets.requests == [("values.batchGet", {"ranges": [WORKING_COPY_RANGE, PRODUCTION_RANGE]})]
+
+
+def test_snapshot_is_reused_only_while_the_spreadsheet_is_unchanged(tmp_path):
+    path = tmp_path / "snapshot.pickle"
+    google = FakeGoogle(TABS)
+    sheets, drive = google.sheets, google.drive
+
+    first, from_snapshot = read_ranges(sheets, "sheet", [WORKING_COPY_RANGE], drive, path, prefetch=[PRODUCTION_RANGE])
+    assert not from_snapshot and first[WORKING_COPY_RANGE] == TABS["Working Copy"]
+    assert sheets.requests == [("values.batchGet", {"ranges": [WORKING_COPY_RANGE, PRODUCTION_RANGE]})]
+
+    # the other script's range came along in the same batchGet
+    second, from_snapshot = read_ranges(sheets, "sheet", [PRODUCTION_RANGE], drive, path)
+    assert from_snapshot and second == {PRODUCTION_RANGE: TABS["Production"]}
+    assert sheets.calls["values.batchGet"] == 1
+
+    sheets.values().update(range="'Production'!A3", body={"values": [["Grace"]]}).execute()
+    third, from_snapshot = read_ranges(sheets, "sheet", [PRODUCTION_RANGE], drive, path)
+    assert not from_snapshot and third == {PRODUCTION_RANGE: TABS["Production"] + [["Grace"]]}
+    assert sheets.calls["values.batchGet"] == 2
+
+    _, from_snapshot = read_ranges(sheets, "other-sheet", [PRODUCTION_RANGE], drive, path)
+    assert not from_snapshot
+
+
+def test_no_snapshot_without_a_modified_time(tmp_path):
+    path = tmp_path / "snapshot.pickle"
+    sheets = FakeSheetsService(TABS)
+
+    for drive in (None, FakeDriveService(sheets, enabled=False)):
+        for _ in range(2):
+            _, from_snapshot = read_ranges(sheets, "sheet", [WORKING_COPY_RANGE], drive, path)
+            assert not from_snapshot
+    assert not path.exists()
+    assert sheets.calls["values.batchGet"] == 4
+
+
+def test_corrupt_or_foreign_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.pickle"
+    path.write_bytes(b"not a pickle")
+    google = FakeGoogle(TABS)
+    stamp = sheet_io.modified_time(google.drive, "sheet")
+
+    assert sheet_io.load_snapshot(path, "sheet", stamp) is None
+    _, from_snapshot = read_ranges(google.sheets, "sheet", [WORKING_COPY_RANGE], google.drive, path)
+    assert not from_snapshot
+    assert sheet_io.load_snapshot(path, "sheet", stamp) == {WORKING_COPY_RANGE: TABS["Working Copy"]}
+
+
+def test_scripts_do_not_import_google_client_libraries_at_load():
+    code = (
+        "import sys, clean_and_validate, geocode_working_copy;"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in ('google', 'googleapiclient', 'validators')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=SCRIPT_DIR, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
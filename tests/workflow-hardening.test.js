@@ -221,3 +221,17 @@ test('map data refresh runs every four hours using the currently deployed releas
   const deploy = workflow.indexOf('Deploy refreshed data to GitHub Pages');
   assert.ok(clean > -1 && health > clean && deploy > health);
 });
+
+test('sheet workflows carry geocode input fingerprints between runs', () => {
+  for (const workflow of ['refresh-map-data.yml', 'sync-and-deploy.yml', 'promote-only.yml']) {
+    const content = read(`.github/workflows/${workflow}`);
+    const restore = content.indexOf('uses: actions/cache/restore@v4');
+    const geocode = content.indexOf('run: python scripts/geocode_working_copy.py');
+    const save = content.indexOf('uses: actions/cache/save@v4');
+
+    assert.ok(restore !== -1 && restore < geocode, `${workflow} restores fingerprints before geocoding`);
+    assert.ok(save > geocode, `${workflow} saves fingerprints after geocoding`);
+    assert.ok(content.includes('.gcp-credentials/geocode-fingerprints.json'));
+    assert.ok(content.includes('restore-keys: geocode-fingerprints-'));
+  }
+});